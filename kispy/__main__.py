@@ -0,0 +1,5 @@
+import sys
+
+from kispy.cli import main
+
+sys.exit(main())
@@ -0,0 +1,200 @@
+"""수정주가 조정계수
+- 수정주가/원주가 시세의 비율로부터 분할·배당 조정계수를 추론
+- 저장된 조정계수로 한쪽 시세만 받아 반대쪽 시세를 로컬에서 계산
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+
+from kispy.models.market import OHLCV
+
+DEFAULT_TOLERANCE = Decimal("0.0005")  # 반올림 오차로 간주할 최소 상대 변화량
+
+
+@dataclass
+class AdjustmentEvent:
+    date: datetime  # 권리락일, 이 날짜 이전 시세에 조정계수가 적용됨
+    price_ratio: Decimal  # 가격 조정계수 (수정주가 = 원주가 * price_ratio)
+    volume_ratio: Decimal  # 거래량 조정계수 (수정거래량 = 원거래량 * volume_ratio)
+
+
+@dataclass
+class AdjustmentFactors:
+    symbol: str
+    events: list[AdjustmentEvent] = field(default_factory=list)
+    start_date: datetime | None = None  # 조정계수가 유효한 가장 오래된 일자
+    as_of: datetime | None = None  # 마지막으로 조정계수를 확인한 일자
+
+    def add_events(self, events: list[AdjustmentEvent]) -> None:
+        known = {event.date for event in self.events}
+        self.events.extend(event for event in events if event.date not in known)
+        self.events.sort(key=lambda event: event.date)
+
+    def cumulative_ratio(self, date: datetime) -> tuple[Decimal, Decimal]:
+        """date 시점 시세에 적용할 누적 (가격, 거래량) 조정계수"""
+        price_ratio = Decimal(1)
+        volume_ratio = Decimal(1)
+        for event in reversed(self.events):
+            if event.date <= date:
+                break
+            price_ratio *= event.price_ratio
+            volume_ratio *= event.volume_ratio
+        return price_ratio, volume_ratio
+
+    def adjust(self, bars: list[OHLCV]) -> list[OHLCV]:
+        """원주가 시세를 수정주가 시세로 변환"""
+        return [_scale(bar, *self.cumulative_ratio(bar.date)) for bar in bars]
+
+    def unadjust(self, bars: list[OHLCV]) -> list[OHLCV]:
+        """수정주가 시세를 원주가 시세로 변환"""
+        result = []
+        for bar in bars:
+            price_ratio, volume_ratio = self.cumulative_ratio(bar.date)
+            result.append(_scale(bar, 1 / price_ratio, 1 / volume_ratio))
+        return result
+
+
+def infer_adjustment_events(
+    adjusted: list[OHLCV],
+    unadjusted: list[OHLCV],
+    tolerance: Decimal = DEFAULT_TOLERANCE,
+) -> list[AdjustmentEvent]:
+    """같은 기간의 수정주가/원주가 시세 비율이 바뀌는 지점을 찾아 조정계수를 추론
+
+    Args:
+        adjusted (list[OHLCV]): 수정주가 시세
+        unadjusted (list[OHLCV]): 원주가 시세
+        tolerance (Decimal): 반올림 오차로 간주할 최소 상대 변화량
+
+    Returns:
+        list[AdjustmentEvent]: 일자 오름차순 조정계수
+
+    Note:
+        - 가격/거래량은 호가단위(값의 마지막 자릿수)로 반올림되므로, 두 날짜의 반올림 오차(1 tick / 값)를 합한 값이
+          tolerance보다 크면 그 값을 허용 오차로 사용합니다. 저가 종목의 반올림을 조정으로 오인하지 않습니다.
+    """
+    unadjusted_map = {bar.date: bar for bar in unadjusted}
+    ratios: list[tuple[datetime, Decimal, Decimal, Decimal, Decimal]] = []
+    for bar in sorted(adjusted, key=lambda bar: bar.date):
+        raw = unadjusted_map.get(bar.date)
+        if raw is None or not Decimal(raw.close) or not Decimal(bar.close):
+            continue
+        raw_volume = Decimal(raw.volume)
+        volume_ratio = Decimal(bar.volume) / raw_volume if raw_volume else None
+        ratios.append(
+            (
+                bar.date,
+                Decimal(bar.close) / Decimal(raw.close),
+                volume_ratio or Decimal(1),
+                _rounding_error(bar.close) + _rounding_error(raw.close),
+                _rounding_error(bar.volume) + _rounding_error(raw.volume) if volume_ratio else Decimal(0),
+            )
+        )
+
+    events: list[AdjustmentEvent] = []
+    if not ratios:
+        return events
+
+    # 최신 시세부터 과거로 진행하며 비율이 바뀌는 지점(권리락일)을 찾음
+    _, cur_price_ratio, cur_volume_ratio, cur_price_error, cur_volume_error = ratios[-1]
+    next_date = ratios[-1][0]
+    for date, price_ratio, volume_ratio, price_error, volume_error in reversed(ratios[:-1]):
+        price_change = price_ratio / cur_price_ratio
+        volume_change = volume_ratio / cur_volume_ratio
+        price_changed = abs(price_change - 1) > max(tolerance, price_error + cur_price_error)
+        volume_changed = abs(volume_change - 1) > max(tolerance, volume_error + cur_volume_error)
+        if price_changed or volume_changed:
+            events.append(
+                AdjustmentEvent(
+                    date=next_date,
+                    price_ratio=price_change if price_changed else Decimal(1),
+                    volume_ratio=volume_change if volume_changed else Decimal(1),
+                )
+            )
+            cur_price_ratio, cur_price_error = price_ratio, price_error
+            cur_volume_ratio, cur_volume_error = volume_ratio, volume_error
+        next_date = date
+
+    events.reverse()
+    return events
+
+
+class AdjustmentStore:
+    """종목별 조정계수를 JSON 파일로 저장"""
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self._directory, f"{symbol}.json")
+
+    def load(self, symbol: str) -> AdjustmentFactors | None:
+        path = self._path(symbol)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return AdjustmentFactors(
+            symbol=data["symbol"],
+            events=[
+                AdjustmentEvent(
+                    date=datetime.fromisoformat(event["date"]),
+                    price_ratio=Decimal(event["price_ratio"]),
+                    volume_ratio=Decimal(event["volume_ratio"]),
+                )
+                for event in data["events"]
+            ],
+            start_date=datetime.fromisoformat(data["start_date"]) if data["start_date"] else None,
+            as_of=datetime.fromisoformat(data["as_of"]) if data["as_of"] else None,
+        )
+
+    def save(self, factors: AdjustmentFactors) -> None:
+        data = {
+            "symbol": factors.symbol,
+            "events": [
+                {
+                    "date": event.date.isoformat(),
+                    "price_ratio": str(event.price_ratio),
+                    "volume_ratio": str(event.volume_ratio),
+                }
+                for event in factors.events
+            ],
+            "start_date": factors.start_date.isoformat() if factors.start_date else None,
+            "as_of": factors.as_of.isoformat() if factors.as_of else None,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self._path(factors.symbol))
+
+
+def _rounding_error(value: str) -> Decimal:
+    """값의 마지막 자릿수(1 tick)로 반올림했을 때의 최대 상대 오차"""
+    number = Decimal(value)
+    if not number:
+        return Decimal(0)
+    tick = Decimal(1).scaleb(number.as_tuple().exponent)  # type: ignore[arg-type]
+    return tick / abs(number)
+
+
+def _scale(bar: OHLCV, price_ratio: Decimal, volume_ratio: Decimal) -> OHLCV:
+    if price_ratio == 1 and volume_ratio == 1:
+        return bar
+
+    def price(value: str) -> str:
+        return str((Decimal(value) * price_ratio).quantize(Decimal(value)))
+
+    return OHLCV(
+        date=bar.date,
+        open=price(bar.open),
+        high=price(bar.high),
+        low=price(bar.low),
+        close=price(bar.close),
+        volume=str((Decimal(bar.volume) * volume_ratio).quantize(Decimal(bar.volume))),
+    )
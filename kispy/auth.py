@@ -13,6 +13,8 @@ from kispy.responses import AuthResponse
 
 logger = logging.getLogger(__name__)
 
+APPROVAL_KEY_LIFETIME = timedelta(hours=24)  # 웹소켓 접속키 유효기간
+
 
 class Token(BaseModel):
     access_token: str = Field(description="액세스 토큰")
@@ -42,6 +44,7 @@ class KisAuth:
         self.account_no = account_no
         self.cano, self.acnt_prdt_cd = account_no.split("-")
         self._token: Token | None = None
+        self._approval_key: tuple[str, datetime] | None = None  # (웹소켓 접속키, 갱신할 일시)
         self._file_path = os.path.join(tempfile.gettempdir(), f"kis_{self.app_key}")
 
     def _request(self, method: str, url: str, **kwargs) -> AuthResponse:
@@ -98,6 +101,32 @@ class KisAuth:
         self._token = token
         return self._token.access_token
 
+    def get_approval_key(self, refresh: bool = False) -> str:
+        """실시간(웹소켓) 접속키 발급[실시간-000]
+
+        Args:
+            refresh (bool): 발급받은 접속키가 있어도 새로 발급 (접속키가 거부된 경우)
+
+        Returns:
+            str: 웹소켓 접속키 (유효기간 24시간, 만료 1시간 전부터는 새로 발급)
+        """
+        now = datetime.now()
+        if self._approval_key is not None and not refresh and now < self._approval_key[1]:
+            return self._approval_key[0]
+
+        resp = self._request(
+            "POST",
+            f"{self._url}/oauth2/Approval",
+            json={
+                "grant_type": "client_credentials",
+                "appkey": self.app_key,
+                "secretkey": self.app_secret,
+            },
+        )
+        approval_key: str = resp.json["approval_key"]
+        self._approval_key = (approval_key, now + APPROVAL_KEY_LIFETIME - timedelta(hours=1))
+        return approval_key
+
     def get_header(self) -> dict:
         return {
             "content-type": "application/json",
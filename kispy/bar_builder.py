@@ -0,0 +1,313 @@
+"""실시간 봉 생성기
+- 실시간 체결(Trade)을 모든 Period의 OHLCV 봉으로 누적하고, 봉이 완성되면 BarClose 이벤트를 반환
+- 분/시간봉은 거래소 정규장 시작 시각 기준으로 나눔 (예: 미국 1시간봉은 9:30, 10:30, ...)
+- 재접속하면 REST 분봉 이력으로 한 번 맞춰서, 끊긴 동안의 봉을 채우고 만들어지는 중인 봉을 보정
+  (REST 조회는 백그라운드 스레드에서 하고, 조회가 끝난 뒤 처리하는 이벤트에서 반영)
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from typing import get_args
+
+from kispy.constants import DOMESTIC_EXCHANGE_CODE, PERIOD_TO_MINUTES, MarketSessionMap, Period, TimeZoneMap
+from kispy.domestic_stock import realtime as domestic_realtime
+from kispy.models.market import OHLCV, Symbol
+from kispy.models.realtime import BarClose, SubscriptionResult, Trade
+from kispy.overseas_stock import realtime as overseas_realtime
+
+logger = logging.getLogger(__name__)
+
+ALL_DAY_SESSION = (time(0, 0), time(23, 59))  # 정규장 정보가 없는 거래소
+TRADE_TR_IDS = (domestic_realtime.TRADE_TR_ID, overseas_realtime.TRADE_TR_ID)
+
+
+@dataclass(slots=True)
+class _Bar:
+    start: datetime
+    end: datetime  # 이 시각이 지나면 완성
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    volume: Decimal
+
+    def update(self, price: Decimal, volume: Decimal) -> None:
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+
+    def merge(self, other: "_Bar") -> None:
+        """뒤이은 구간의 봉을 합침"""
+        self.high = max(self.high, other.high)
+        self.low = min(self.low, other.low)
+        self.close = other.close
+        self.volume += other.volume
+
+    def to_ohlcv(self) -> OHLCV:
+        return OHLCV(
+            date=self.start,
+            open=str(self.open),
+            high=str(self.high),
+            low=str(self.low),
+            close=str(self.close),
+            volume=str(self.volume),
+        )
+
+
+class BarBuilder:
+    def __init__(
+        self,
+        symbols: Iterable[Symbol],
+        periods: Iterable[Period] = get_args(Period),
+        fetch_minute_bars: Callable[[Symbol], list[OHLCV]] | None = None,
+        include_extended_hours: bool = False,
+    ):
+        """실시간 체결로 봉을 만드는 생성기
+
+        Args:
+            symbols (Iterable[Symbol]): 봉을 만들 종목 (거래소별 정규장 시간을 사용)
+            periods (Iterable[Period]): 만들 봉 주기, 기본값은 전체
+            fetch_minute_bars (Callable[[Symbol], list[OHLCV]] | None): 재접속 후 보정에 사용할 1분봉 조회 함수
+            include_extended_hours (bool): 정규장 외 체결 포함 여부
+
+        Example:
+            >>> builder = BarBuilder(symbols, ["1m", "5m"], lambda s: kis.fetch_ohlcv(s.symbol, period="1m", limit=120))
+            >>> for event in client.events():
+            ...     for closed in builder.on_event(event):
+            ...         print(closed.symbol, closed.period, closed.bar)
+
+        Note:
+            - 재접속 후 1분봉 조회는 백그라운드 스레드에서 하므로 이벤트 처리를 막지 않습니다.
+              조회 결과는 다음 on_event/flush 호출(또는 poll_reconciled)에서 반영됩니다.
+        """
+        self._symbols = {symbol.symbol: symbol for symbol in symbols}
+        self._realtime_keys = {
+            symbol.symbol if symbol.exchange_code == DOMESTIC_EXCHANGE_CODE else symbol.realtime_symbol: symbol
+            for symbol in self._symbols.values()
+        }
+        # 1분봉은 재접속 보정의 기준이므로 항상 만듦
+        self._periods: list[Period] = list(dict.fromkeys(["1m", *periods]))
+        self._emitted = set(periods)
+        self._fetch_minute_bars = fetch_minute_bars
+        self._include_extended_hours = include_extended_hours
+        self._bars: dict[tuple[str, Period], _Bar] = {}
+        self._last_closed: dict[tuple[str, Period], datetime] = {}
+        self._subscribed: set[str] = set()  # 한 번 이상 등록 응답을 받은 종목 (다시 받으면 재접속)
+        self._executor: ThreadPoolExecutor | None = None
+        self._reconciling: dict[str, Future[list[OHLCV]]] = {}  # 종목별 진행 중인 1분봉 조회
+
+    def current(self, symbol: str, period: Period) -> OHLCV | None:
+        """만들어지는 중인 봉"""
+        bar = self._bars.get((symbol, period))
+        return bar.to_ohlcv() if bar else None
+
+    def on_event(self, event: object) -> list[BarClose]:
+        """실시간 이벤트 반영 (체결이 아닌 이벤트는 재접속 확인에만 사용)
+
+        Returns:
+            list[BarClose]: 완성된 봉 (끝난 재접속 보정으로 완성된 봉 포함)
+        """
+        closed = self.poll_reconciled()
+        if isinstance(event, Trade):
+            closed.extend(self.on_trade(event))
+        elif isinstance(event, SubscriptionResult) and event.success and event.tr_id in TRADE_TR_IDS:
+            symbol = self._realtime_keys.get(event.tr_key)
+            if symbol is None:
+                pass
+            elif symbol.symbol not in self._subscribed:
+                self._subscribed.add(symbol.symbol)
+            elif self._fetch_minute_bars is not None and symbol.symbol not in self._reconciling:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kispy-bar-reconcile")
+                self._reconciling[symbol.symbol] = self._executor.submit(self._fetch_minute_bars, symbol)
+        return closed
+
+    def poll_reconciled(self, timeout: float | None = 0.0) -> list[BarClose]:
+        """백그라운드 1분봉 조회가 끝난 종목의 봉을 보정
+
+        Args:
+            timeout (float | None): 조회가 끝나기를 기다릴 시간(초), None이면 모두 끝날 때까지 대기
+
+        Returns:
+            list[BarClose]: 끊긴 동안 완성된 봉
+        """
+        if not self._reconciling:
+            return []
+        done, _ = wait(self._reconciling.values(), timeout=timeout)
+        closed = []
+        for symbol, future in list(self._reconciling.items()):
+            if future not in done:
+                continue
+            del self._reconciling[symbol]
+            try:
+                closed.extend(self.reconcile(symbol, future.result()))
+            except Exception as e:
+                logger.warning(f"failed to reconcile bars of {symbol}: {e!r}")
+        return closed
+
+    def on_trade(self, trade: Trade) -> list[BarClose]:
+        """체결 반영
+
+        Returns:
+            list[BarClose]: 이 체결로 새 구간이 시작되어 완성된 봉
+        """
+        symbol = self._symbols.get(trade.symbol)
+        if symbol is None or not self._in_session(symbol, trade.time):
+            return []
+
+        price, volume = Decimal(trade.price), Decimal(trade.volume)
+        closed = []
+        for period in self._periods:
+            key = (trade.symbol, period)
+            bar = self._bars.get(key)
+            if bar is not None and trade.time < bar.start:
+                continue  # 늦게 도착한 이전 구간 체결
+            if bar is not None and trade.time < bar.end:
+                bar.update(price, volume)
+                continue
+            if bar is not None:
+                closed.extend(self._close(key, bar))
+            start, end = self._bucket(symbol, period, trade.time)
+            self._bars[key] = _Bar(start, end, price, price, price, price, volume)
+        return closed
+
+    def flush(self, now: datetime | None = None) -> list[BarClose]:
+        """체결이 없어도 구간이 끝난 봉을 완성
+
+        Args:
+            now (datetime | None): 현재 시각 (시간대 포함), 기본값은 현재 시각
+        """
+        closed = self.poll_reconciled()
+        for key, bar in list(self._bars.items()):
+            zone_info = TimeZoneMap[self._symbols[key[0]].exchange_code]
+            local_now = (now or datetime.now(zone_info)).astimezone(zone_info).replace(tzinfo=None)
+            if bar.end <= local_now:
+                del self._bars[key]
+                closed.extend(self._close(key, bar))
+        return closed
+
+    def close(self) -> None:
+        """진행 중인 재접속 보정을 취소하고 백그라운드 스레드를 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._reconciling.clear()
+
+    def reconcile(self, symbol: str, minute_bars: list[OHLCV]) -> list[BarClose]:
+        """재접속 후 REST 1분봉으로 봉 보정
+
+        - 마지막으로 완성한 봉 이후 끊긴 동안의 구간은 1분봉을 합쳐 완성
+        - 1분봉의 마지막 구간은 만들어지는 중인 봉으로 이어서 만듦
+        - 1분봉 이력이 봉 시작 시각부터 없으면 실시간으로 만든 봉의 시가를 유지
+
+        Args:
+            symbol (str): 종목코드
+            minute_bars (list[OHLCV]): 1분봉 (정렬 순서 무관)
+
+        Returns:
+            list[BarClose]: 끊긴 동안 완성된 봉
+        """
+        market_symbol = self._symbols[symbol]
+        bars = sorted(minute_bars, key=lambda bar: bar.date)
+        if not self._include_extended_hours:
+            bars = [bar for bar in bars if self._in_session(market_symbol, bar.date)]
+        if not bars:
+            return []
+
+        closed = []
+        for period in self._periods:
+            key = (symbol, period)
+            last_closed = self._last_closed.get(key)
+            groups: dict[datetime, _Bar] = {}
+            for minute_bar in bars:
+                start, end = self._bucket(market_symbol, period, minute_bar.date)
+                if last_closed is not None and start <= last_closed:
+                    continue
+                group = _from_ohlcv(minute_bar, start, end)
+                if start in groups:
+                    groups[start].merge(group)
+                else:
+                    groups[start] = group
+            if not groups:
+                continue
+
+            starts = list(groups)
+            current = self._bars.pop(key, None)
+            if current is not None:
+                if current.start < starts[0]:
+                    closed.extend(self._close(key, current))  # 1분봉이 없는 이전 구간의 봉은 그대로 완성
+                elif current.start not in groups:
+                    groups[current.start] = current  # 1분봉보다 최근 구간
+                    starts = sorted(groups)
+                elif bars[0].date > current.start:
+                    groups[current.start] = _combine(current, groups[current.start])
+
+            for start in starts[:-1]:
+                closed.extend(self._close(key, groups[start]))
+            self._bars[key] = groups[starts[-1]]
+        return closed
+
+    def _close(self, key: tuple[str, Period], bar: _Bar) -> list[BarClose]:
+        self._last_closed[key] = bar.start
+        if key[1] not in self._emitted:
+            return []
+        return [BarClose(symbol=key[0], period=key[1], bar=bar.to_ohlcv())]
+
+    def _in_session(self, symbol: Symbol, at: datetime) -> bool:
+        if self._include_extended_hours:
+            return True
+        open_time, close_time = MarketSessionMap.get(symbol.exchange_code, ALL_DAY_SESSION)
+        # 장 마감 시각의 체결(동시호가 등)까지 포함
+        return open_time <= at.time() and at.time().replace(second=0, microsecond=0) <= close_time
+
+    def _bucket(self, symbol: Symbol, period: Period, at: datetime) -> tuple[datetime, datetime]:
+        """체결 시각이 속한 구간 (시작, 끝)"""
+        open_time, close_time = MarketSessionMap.get(symbol.exchange_code, ALL_DAY_SESSION)
+        day = datetime.combine(at.date(), time())
+        session_end = datetime.combine(at.date(), close_time) + timedelta(minutes=1)
+        if period in PERIOD_TO_MINUTES:
+            size = timedelta(minutes=int(PERIOD_TO_MINUTES[period]))
+            session_open = datetime.combine(at.date(), open_time)
+            start = session_open + (at - session_open) // size * size
+            end = start + size
+            return start, min(end, session_end) if start < session_end else end
+        if period == "d":
+            return day, day + timedelta(days=1) if self._include_extended_hours else session_end
+        if period == "w":
+            monday = day - timedelta(days=day.weekday())
+            return monday, datetime.combine((monday + timedelta(days=4)).date(), close_time) + timedelta(minutes=1)
+        # M
+        first = day.replace(day=1)
+        return first, (first + timedelta(days=32)).replace(day=1)
+
+
+def _combine(live: _Bar, history: _Bar) -> _Bar:
+    """시작 부분이 빠진 1분봉 합과 실시간 봉을 합침 (겹치는 구간이 있을 수 있으므로 거래량은 큰 값)"""
+    return _Bar(
+        live.start,
+        live.end,
+        live.open,
+        max(live.high, history.high),
+        min(live.low, history.low),
+        history.close,
+        max(live.volume, history.volume),
+    )
+
+
+def _from_ohlcv(bar: OHLCV, start: datetime, end: datetime) -> _Bar:
+    return _Bar(
+        start,
+        end,
+        Decimal(bar.open),
+        Decimal(bar.high),
+        Decimal(bar.low),
+        Decimal(bar.close),
+        Decimal(bar.volume),
+    )
@@ -0,0 +1,288 @@
+"""컬럼형 시세 파일
+- 종목별 청크 단위로 OHLCV를 고정 타입 컬럼으로 저장
+- 일시/가격은 청크 기준값과의 차이(int32)로 저장하여 크기를 줄임
+  (이웃한 값끼리의 차이(delta)가 아니라 기준값과의 차이라서, 앞의 값을 누적하지 않고 각 값을 바로 읽을 수 있음)
+- 차이가 int32를 넘는 종목은 여러 청크로 나누어 저장
+- mmap으로 열어 컬럼을 복사 없이 memoryview로 읽음 (numpy.frombuffer로 복사 없이 변환 가능)
+
+파일 구조:
+    [파일 헤더 16바이트] [청크] [청크] ...
+    청크 = [청크 헤더 48바이트] volume(int64 * n) timestamp(int32 * n) open/high/low/close(int32 * n) [8바이트 정렬]
+           [청크 끝 표시 8바이트: 청크 크기(uint32) + "DONE"]
+    청크 헤더의 마지막 4바이트는 청크 본문의 CRC32
+
+기록 중 중단:
+    청크는 파일 끝에만 추가하므로 손상될 수 있는 청크는 마지막 청크뿐입니다.
+    읽을 때는 청크 끝 표시와 마지막 청크의 CRC32를 확인해 불완전한 청크에서 멈추고,
+    추가할 때는 파일 끝의 청크가 완전하지 않으면 마지막 완전한 청크 뒤로 파일을 잘라낸 뒤 이어 씁니다.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from kispy.models.market import OHLCV
+from kispy.store import BarStore
+
+MAGIC = b"KISBARS\x00"
+VERSION = 2
+MAX_SCALE = 8  # 가격 소수점 최대 자리수
+
+_FILE_HEADER = struct.Struct("<8sH6x")
+_CHUNK_HEADER = struct.Struct("<4s16sIIqqI")
+_CHUNK_MARKER = b"CHNK"
+_CHUNK_FOOTER = struct.Struct("<I4s")
+_CHUNK_END_MARKER = b"DONE"
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class BarChunk:
+    symbol: str
+    count: int
+    scale: int  # 가격 = (base_price + 차이) / 10**scale
+    base_time: int  # 첫 시세 일시 (1970-01-01 기준 초)
+    base_price: int
+    timestamps: memoryview  # base_time 기준 초 단위 차이 (int32)
+    open: memoryview  # base_price 기준 차이 (int32)
+    high: memoryview
+    low: memoryview
+    close: memoryview
+    volume: memoryview  # int64
+
+    def to_ohlcv(self) -> list[OHLCV]:
+        unit = Decimal(1).scaleb(-self.scale)
+
+        def price(value: int) -> str:
+            return str(Decimal(self.base_price + value) * unit)
+
+        return [
+            OHLCV(
+                date=_EPOCH + timedelta(seconds=self.base_time + self.timestamps[i]),
+                open=price(self.open[i]),
+                high=price(self.high[i]),
+                low=price(self.low[i]),
+                close=price(self.close[i]),
+                volume=str(self.volume[i]),
+            )
+            for i in range(self.count)
+        ]
+
+
+def append_bars(path: str, symbol: str, bars: list[OHLCV]) -> None:
+    """시세 파일 끝에 종목의 청크를 추가 (파일이 없으면 생성, 가격/일시 범위가 int32를 넘으면 여러 청크로 나눔)
+
+    Raises:
+        ValueError: 종목코드가 16바이트를 넘거나, 가격 소수점이 MAX_SCALE자리를 넘거나,
+            한 시세의 시가/고가/저가/종가 범위가 int32를 넘는 경우
+    """
+    if not bars:
+        return
+
+    encoded_symbol = symbol.encode("utf-8")
+    if len(encoded_symbol) > 16:
+        raise ValueError(f"Symbol too long: {symbol}")
+
+    bars = sorted(bars, key=lambda bar: bar.date)
+    prices = [Decimal(value) for bar in bars for value in (bar.open, bar.high, bar.low, bar.close)]
+    scale = max(-min(0, int(price.normalize().as_tuple().exponent)) for price in prices)
+    if scale > MAX_SCALE:
+        raise ValueError(f"Price scale {scale} of {symbol} exceeds {MAX_SCALE} decimal places")
+    scaled = [int(price.scaleb(scale)) for price in prices]
+    times = [int((bar.date.replace(tzinfo=None) - _EPOCH).total_seconds()) for bar in bars]
+
+    chunks = []
+    start, low, high = 0, scaled[0], scaled[0]
+    for i in range(len(bars)):
+        values = scaled[i * 4 : i * 4 + 4]
+        if max(values) - min(values) > _INT32_MAX:
+            raise ValueError(f"Price range of {symbol} at {bars[i].date} exceeds int32 at scale {scale}")
+        if max(high, *values) - min(low, *values) > _INT32_MAX or times[i] - times[start] > _INT32_MAX:
+            # 범위가 int32를 넘기 직전까지를 한 청크로 기록
+            chunks.append(_encode_chunk(encoded_symbol, scale, bars[start:i], scaled[start * 4 : i * 4], times[start:i]))
+            start, low, high = i, min(values), max(values)
+        else:
+            low, high = min(low, *values), max(high, *values)
+    chunks.append(_encode_chunk(encoded_symbol, scale, bars[start:], scaled[start * 4 :], times[start:]))
+
+    with open(path, "ab+") as f:
+        f.seek(0)
+        head = f.read(_FILE_HEADER.size)
+        if len(head) < _FILE_HEADER.size:
+            f.truncate(0)
+            f.write(_FILE_HEADER.pack(MAGIC, VERSION))
+        else:
+            magic, version = _FILE_HEADER.unpack(head)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Invalid bar file: {path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                size, end = len(buffer), _committed_size(buffer)
+            if end != size:
+                f.truncate(end)  # 기록 중 중단된 마지막 청크 제거
+        f.write(b"".join(chunks))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _encode_chunk(encoded_symbol: bytes, scale: int, bars: list[OHLCV], scaled: list[int], times: list[int]) -> bytes:
+    """청크 하나 (scaled: 시세별 시가/고가/저가/종가, 범위는 int32 이내)"""
+    base_price = min(scaled)
+    base_time = times[0]
+    price_deltas = [value - base_price for value in scaled]
+    time_deltas = [value - base_time for value in times]
+
+    count = len(bars)
+    body = b"".join(
+        [
+            struct.pack(f"<{count}q", *(int(Decimal(bar.volume)) for bar in bars)),
+            struct.pack(f"<{count}i", *time_deltas),
+            struct.pack(f"<{count}i", *price_deltas[0::4]),
+            struct.pack(f"<{count}i", *price_deltas[1::4]),
+            struct.pack(f"<{count}i", *price_deltas[2::4]),
+            struct.pack(f"<{count}i", *price_deltas[3::4]),
+        ]
+    )
+    body += b"\x00" * (-len(body) % 8)
+    header = _CHUNK_HEADER.pack(_CHUNK_MARKER, encoded_symbol, count, scale, base_time, base_price, zlib.crc32(body))
+    return header + body + _CHUNK_FOOTER.pack(len(header) + len(body) + _CHUNK_FOOTER.size, _CHUNK_END_MARKER)
+
+
+def pack_store(store: BarStore, path: str) -> None:
+    """BarStore의 모든 종목을 시세 파일로 변환 (기존 파일은 새로 만든 파일로 교체, 종목이 없으면 빈 파일)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_FILE_HEADER.pack(MAGIC, VERSION))
+    for symbol in store.symbols():
+        append_bars(tmp_path, symbol, store.read(symbol))
+    os.replace(tmp_path, path)
+
+
+def _chunk_at(buffer: mmap.mmap, offset: int, check_crc: bool) -> tuple[int, int, tuple] | None:
+    """offset의 청크가 완전하면 (청크 끝 위치, 본문 위치, 청크 헤더), 아니면 None"""
+    size = len(buffer)
+    if offset + _CHUNK_HEADER.size + _CHUNK_FOOTER.size > size:
+        return None
+    header = _CHUNK_HEADER.unpack_from(buffer, offset)
+    column = offset + _CHUNK_HEADER.size
+    count = header[2]
+    end = column + count * 28 + (-(count * 28) % 8) + _CHUNK_FOOTER.size
+    if header[0] != _CHUNK_MARKER or end > size:
+        return None
+    chunk_size, end_marker = _CHUNK_FOOTER.unpack_from(buffer, end - _CHUNK_FOOTER.size)
+    if end_marker != _CHUNK_END_MARKER or chunk_size != end - offset:
+        return None
+    if check_crc and zlib.crc32(buffer[column : end - _CHUNK_FOOTER.size]) != header[6]:
+        return None
+    return end, column, header
+
+
+def _scan_chunks(buffer: mmap.mmap) -> Iterator[tuple[int, int, tuple]]:
+    """완전한 청크의 (청크 끝 위치, 본문 위치, 청크 헤더) 반복 (마지막 청크는 CRC32까지 확인)"""
+    offset = _FILE_HEADER.size
+    size = len(buffer)
+    while (chunk := _chunk_at(buffer, offset, check_crc=False)) is not None:
+        end = chunk[0]
+        if end == size and _chunk_at(buffer, offset, check_crc=True) is None:
+            return
+        yield chunk
+        offset = end
+
+
+def _committed_size(buffer: mmap.mmap) -> int:
+    """마지막 완전한 청크까지의 파일 크기"""
+    size = len(buffer)
+    if size == _FILE_HEADER.size:
+        return size
+    # 파일 끝의 청크 끝 표시로 마지막 청크를 바로 확인하고, 손상된 경우에만 처음부터 확인
+    if size >= _FILE_HEADER.size + _CHUNK_FOOTER.size:
+        chunk_size, end_marker = _CHUNK_FOOTER.unpack_from(buffer, size - _CHUNK_FOOTER.size)
+        offset = size - chunk_size
+        if (
+            end_marker == _CHUNK_END_MARKER
+            and offset >= _FILE_HEADER.size
+            and _chunk_at(buffer, offset, check_crc=True) is not None
+        ):
+            return size
+    end = _FILE_HEADER.size
+    for end, _, _ in _scan_chunks(buffer):  # noqa: B007
+        pass
+    return end
+
+
+class BarFile:
+    """mmap으로 연 읽기 전용 시세 파일
+
+    파일을 열 때 청크 헤더만 읽어 종목별 청크 목록을 만들고, 컬럼 데이터는 접근할 때 페이지 단위로 읽힙니다.
+
+    Example:
+        >>> with BarFile("bars.kbar") as bar_file:
+        ...     for chunk in bar_file.chunks("AAPL"):
+        ...         closes = numpy.frombuffer(chunk.close, dtype=numpy.int32)
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._index: dict[str, list[BarChunk]] = {}
+
+        magic, version = _FILE_HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Invalid bar file: {path}")
+
+        for _, column, header in _scan_chunks(self._mmap):
+            _, encoded_symbol, count, scale, base_time, base_price, _ = header
+            symbol = encoded_symbol.rstrip(b"\x00").decode("utf-8")
+            volume_end = column + count * 8
+            int32_columns = [
+                self._view[volume_end + count * 4 * i : volume_end + count * 4 * (i + 1)].cast("i") for i in range(5)
+            ]
+            self._index.setdefault(symbol, []).append(
+                BarChunk(
+                    symbol=symbol,
+                    count=count,
+                    scale=scale,
+                    base_time=base_time,
+                    base_price=base_price,
+                    timestamps=int32_columns[0],
+                    open=int32_columns[1],
+                    high=int32_columns[2],
+                    low=int32_columns[3],
+                    close=int32_columns[4],
+                    volume=self._view[column:volume_end].cast("q"),
+                )
+            )
+
+    def __enter__(self) -> "BarFile":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def symbols(self) -> list[str]:
+        return list(self._index)
+
+    def chunks(self, symbol: str) -> list[BarChunk]:
+        return self._index.get(symbol, [])
+
+    def read(self, symbol: str) -> list[OHLCV]:
+        """시간순으로 정렬된 OHLCV (중복 일시는 나중에 추가된 청크 우선)"""
+        bars = {bar.date: bar for chunk in self.chunks(symbol) for bar in chunk.to_ohlcv()}
+        return [bars[date] for date in sorted(bars)]
+
+    def close(self) -> None:
+        for chunks in self._index.values():
+            for chunk in chunks:
+                for column in (chunk.timestamps, chunk.open, chunk.high, chunk.low, chunk.close, chunk.volume):
+                    column.release()
+        self._index.clear()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
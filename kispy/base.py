@@ -1,6 +1,7 @@
 from datetime import datetime
 import logging
 import time
+from collections.abc import Iterator
 from zoneinfo import ZoneInfo
 
 import requests
@@ -10,6 +11,7 @@ from urllib3.util.retry import Retry
 from kispy.auth import KisAuth
 from kispy.constants import REAL_URL, VIRTUAL_URL
 from kispy.err_codes import ErrorCode
+from kispy.pagination import iter_pages, paginate
 from kispy.rate_limit import RateLimiter
 from kispy.responses import BaseResponse
 
@@ -50,6 +52,46 @@ class BaseAPI:
             custom_resp.raise_for_status()
             return custom_resp
         
+    def _paginate(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        params: dict,
+        output_key: str = "output",
+        limit: int | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict]:
+        """연속조회 레코드 반복 (tr_cont/CTX_AREA_* 처리, limit을 채우면 중단)"""
+        return paginate(
+            lambda headers, params: self._request(method, url, headers=headers, params=params),
+            headers,
+            params,
+            output_key,
+            limit,
+            prefetch,
+        )
+
+    def _paginate_pages(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        params: dict,
+        output_key: str = "output",
+        limit: int | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[BaseResponse]:
+        """연속조회 페이지 응답 반복 (요약 정보가 함께 오는 조회용)"""
+        return iter_pages(
+            lambda headers, params: self._request(method, url, headers=headers, params=params),
+            headers,
+            params,
+            output_key,
+            limit,
+            prefetch,
+        )
+
     def _parse_date(self, date_str: str, zone_info: ZoneInfo | None = None) -> datetime:
         date_str = date_str.replace("-", "")
         try : 
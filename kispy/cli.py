@@ -0,0 +1,148 @@
+"""kispy 명령행 도구
+
+Example:
+    $ export KISPY_APP_KEY=... KISPY_APP_SECRET=... KISPY_ACCOUNT_NO=12345678-01
+    $ kispy ingest --nation US --exchange NAS --start 2020-01-01 --out ./data
+    $ kispy record --symbols AAPL MSFT --domestic-symbols 005930 --out ./data
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from kispy.auth import KisAuth
+from kispy.barfile import pack_store
+from kispy.client import KisClient
+from kispy.constants import NationExchangeCodeMap
+from kispy.ingest import IngestCheckpoint, IngestJob
+from kispy.master import MasterCache
+from kispy.recorder import MinuteBarRecorder
+from kispy.store import BarStore
+
+# 기간별 시세 수집/분봉 기록은 해외주식 종목 마스터 기준 (국내주식 분봉은 --domestic-symbols)
+OVERSEAS_NATIONS = [nation for nation in NationExchangeCodeMap if nation != "KR"]
+
+
+def _auth_from_env() -> KisAuth:
+    app_key = os.getenv("KISPY_APP_KEY")
+    secret = os.getenv("KISPY_APP_SECRET")
+    account_no = os.getenv("KISPY_ACCOUNT_NO")
+    if not (app_key and secret and account_no):
+        raise SystemExit("KISPY_APP_KEY, KISPY_APP_SECRET, KISPY_ACCOUNT_NO 환경변수를 설정해주세요.")
+    is_real = os.getenv("KISPY_IS_REAL", "true").lower() not in ("0", "false", "no")
+    return KisAuth(app_key=app_key, secret=secret, account_no=account_no, is_real=is_real)
+
+
+def _ingest(args: argparse.Namespace) -> int:
+    symbol_map = MasterCache().load_symbol_map(args.nation)
+    if args.symbols:
+        missing = [symbol for symbol in args.symbols if symbol not in symbol_map]
+        if missing:
+            raise SystemExit(f"Invalid symbol: {', '.join(missing)}")
+        symbols = [symbol_map[symbol] for symbol in args.symbols]
+    else:
+        symbols = list(symbol_map.values())
+    if args.exchange:
+        symbols = [symbol for symbol in symbols if symbol.exchange_code == args.exchange]
+
+    os.makedirs(args.out, exist_ok=True)
+    checkpoint = IngestCheckpoint(os.path.join(args.out, f"checkpoint_{args.period}.json"))
+    if args.reset:
+        checkpoint.reset()
+    try:
+        job = IngestJob(
+            client=KisClient(_auth_from_env()),
+            store=BarStore(os.path.join(args.out, args.period)),
+            checkpoint=checkpoint,
+            symbols=symbols,
+            start_date=args.start,
+            end_date=args.end,
+            period=args.period,
+            is_adjust=not args.no_adjust,
+            max_workers=args.workers,
+            resume=args.resume,
+        )
+    except ValueError as e:
+        raise SystemExit(
+            f"{e}\n이어서 수집하려면 --resume, 새 조건으로 처음부터 수집하려면 --reset을 지정해주세요."
+        ) from e
+    result = job.run()
+    print(f"done: {len(result.done)}, skipped: {len(result.skipped)}, failed: {len(result.failed)}")
+    for symbol, error in result.failed.items():
+        print(f"  {symbol}: {error}", file=sys.stderr)
+    return 1 if result.failed else 0
+
+
+def _record(args: argparse.Namespace) -> int:
+    symbols = []
+    if args.symbols:
+        symbol_map = MasterCache().load_symbol_map(args.nation)
+        missing = [symbol for symbol in args.symbols if symbol not in symbol_map]
+        if missing:
+            raise SystemExit(f"Invalid symbol: {', '.join(missing)}")
+        symbols = [symbol_map[symbol] for symbol in args.symbols]
+
+    recorder = MinuteBarRecorder(
+        client=KisClient(_auth_from_env()),
+        store=BarStore(os.path.join(args.out, "1m")),
+        symbols=symbols,
+        domestic_symbols=args.domestic_symbols,
+    )
+    if args.once:
+        reports = recorder.sweep()
+        return 1 if any(report.error for report in reports) else 0
+
+    recorder.run_forever()
+    return 0
+
+
+def _pack(args: argparse.Namespace) -> int:
+    pack_store(BarStore(args.src), args.out)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="kispy")
+    parser.add_argument("-v", "--verbose", action="store_true", help="디버그 로그 출력")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest = subparsers.add_parser("ingest", help="기간별 시세 일괄 수집 (중단 시 같은 명령 또는 --resume으로 재개)")
+    ingest.add_argument("--nation", required=True, choices=OVERSEAS_NATIONS, help="국가")
+    ingest.add_argument("--exchange", help="거래소코드 (예: NAS), 지정하지 않으면 국가 전체")
+    ingest.add_argument("--symbols", nargs="+", help="종목코드, 지정하지 않으면 거래소 전체 종목")
+    ingest.add_argument("--start", required=True, help="조회시작일자 (YYYY-MM-DD)")
+    ingest.add_argument("--end", help="조회종료일자 (YYYY-MM-DD), 기본값은 오늘")
+    ingest.add_argument("--period", default="d", choices=["d", "w", "M"], help="조회기간")
+    ingest.add_argument("--no-adjust", action="store_true", help="원주가로 조회")
+    ingest.add_argument("--out", required=True, help="저장 디렉토리")
+    ingest.add_argument("--workers", type=int, default=4, help="동시 수집 종목 수")
+    restart = ingest.add_mutually_exclusive_group()
+    restart.add_argument("--resume", action="store_true", help="조회 조건이 달라도 이전 조회 조건으로 이어서 수집")
+    restart.add_argument("--reset", action="store_true", help="이전 진행 상황을 지우고 처음부터 수집")
+    ingest.set_defaults(func=_ingest)
+
+    record = subparsers.add_parser("record", help="장 마감 후 1분봉을 조회하여 로컬에 누적 기록")
+    record.add_argument("--nation", default="US", choices=OVERSEAS_NATIONS, help="해외주식 국가")
+    record.add_argument("--symbols", nargs="+", help="해외주식 종목코드")
+    record.add_argument("--domestic-symbols", nargs="+", help="국내주식 종목코드")
+    record.add_argument("--out", required=True, help="저장 디렉토리")
+    record.add_argument("--once", action="store_true", help="한 번만 기록하고 종료")
+    record.set_defaults(func=_record)
+
+    pack = subparsers.add_parser("pack", help="수집한 시세 디렉토리를 컬럼형 시세 파일로 변환")
+    pack.add_argument("--src", required=True, help="시세 디렉토리 (예: ./data/d)")
+    pack.add_argument("--out", required=True, help="시세 파일 경로")
+    pack.set_defaults(func=_pack)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    return args.func(args)  # type: ignore[no-any-return]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
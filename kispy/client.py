@@ -1,25 +1,50 @@
 import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Literal
+from datetime import time as dt_time
+from decimal import Decimal
+from typing import Literal, TypeVar
 
+from kispy.adjustment import AdjustmentFactors, AdjustmentStore, infer_adjustment_events
 from kispy.auth import KisAuth
 from kispy.constants import (
+    DOMESTIC_EXCHANGE_CODE,
+    DOMESTIC_TIME_ZONE,
     PERIOD_TO_MINUTES,
     REAL_URL,
     VIRTUAL_URL,
+    Currency,
+    CurrencyBalanceQueryMap,
+    ExchangeCode,
     ExchangeLongCodeMap,
+    LongExchangeCode,
+    LongExchangeCurrencyMap,
+    MarketSessionMap,
     Nation,
+    NationExchangeCodeMap,
+    OrderSide,
     Period,
 )
 from kispy.domestic_stock import DomesticStock
 from kispy.exceptions import InvalidSymbol
+from kispy.master import MasterCache, SymbolRegistry
 from kispy.models.account import AccountSummary, Balance, Order, PendingOrder, Position
 from kispy.models.market import OHLCV, Symbol
+from kispy.models.realtime import FillNotice
+from kispy.order_journal import OrderJournal
+from kispy.order_sync import OrderChange, OrderSync
 from kispy.overseas_stock import OverseasStock
-from kispy.utils import get_symbol_map
+from kispy.realtime import OrderTracker, RealtimeClient
+from kispy.search import SymbolSearchIndex
+from kispy.symbol_table import SymbolTable
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class KisClient:
     def __init__(
@@ -50,79 +75,358 @@ class KisClient:
 
 
 class KisClientV2:
-    def __init__(self, auth: KisAuth, nation: Nation):
+    def __init__(
+        self,
+        auth: KisAuth,
+        nation: Nation | None = None,
+        master_cache: MasterCache | None = None,
+        symbol_table: SymbolTable | None = None,
+        journal: OrderJournal | None = None,
+    ):
+        """
+        Args:
+            auth (KisAuth): 인증 정보
+            nation (Nation | None): 국가, None이면 국내주식과 모든 해외주식 종목을 한 클라이언트에서 조회/주문
+            master_cache (MasterCache | None): 종목 마스터 디스크 캐시, None이면 매번 다운로드
+            symbol_table (SymbolTable | None): 여러 프로세스가 공유하는 종목 테이블, 지정하면 종목 마스터를 불러오지 않음
+            journal (OrderJournal | None): 주문 일지, 지정하면 해외주식 주문/정정/취소/동기화한 주문을 기록
+        """
         self.account_no = auth.account_no
         self.client = KisClient(auth)
+        self._auth = auth
         self.nation = nation
-        self._market: dict[str, Symbol] = {}
+        self._market: SymbolRegistry | SymbolTable = symbol_table or SymbolRegistry(
+            nation, master_cache.load if master_cache else None
+        )
+        self._search_index: SymbolSearchIndex | None = None
+        self._account_summary: dict[Currency, tuple[float, AccountSummary]] = {}  # 통화별 (조회 시각, 총 자산 정보)
+        self._account_summary_lock = threading.Lock()
+        self._account_summary_fetch: dict[Currency, Future[AccountSummary]] = {}  # 통화별 진행 중인 총 자산 조회
+        self._order_branches: dict[str, str] = {}  # 국내주식 주문번호별 주문조직번호 (정정/취소에 필요)
+        self.journal = journal
 
     def load_market_data(self, reload: bool = False) -> None:
-        if not self._market or reload:
-            self._market = get_symbol_map(self.nation)
+        """종목 마스터는 조회할 때 거래소별로 불러오므로, reload 시에는 불러온 마스터만 비웁니다.
+        종목 테이블을 사용하는 경우 파일을 다시 엽니다."""
+        if reload:
+            self._market.clear()
+            self._search_index = None
 
-    def get_price(self, symbol: str) -> str:
-        if self.nation == "KR":
-            # TODO: 국내주식 현재가 조회
-            raise NotImplementedError("국내주식 현재가 조회는 아직 구현되지 않았습니다.")
+    def search_symbols(self, query: str, limit: int = 10) -> list[Symbol]:
+        """종목코드 또는 한글/영문 이름의 앞부분이나 일부로 종목 검색
+
+        Args:
+            query (str): 검색어 (예: "AAPL", "애플", "apple")
+            limit (int): 최대 결과 수
+
+        Returns:
+            list[Symbol]: 검색 결과 (종목코드 일치 > 종목코드 앞부분 > 이름 앞부분 > 이름 일부 순)
+
+        Note:
+            - 처음 검색할 때 모든 거래소 종목 마스터를 불러와 검색 색인을 만듭니다.
+        """
+        if self._search_index is None:
+            self._search_index = SymbolSearchIndex(self._market)
+        return self._search_index.search(query, limit)
+
+    def get_symbol(self, symbol: str, exchange_code: ExchangeCode | None = None) -> Symbol:
+        """종목 조회 (거래소, 시장, 통화 등)
+
+        Args:
+            symbol (str): 종목코드
+            exchange_code (ExchangeCode | None): 거래소코드, 지정하면 해당 거래소의 종목만 조회
 
+        Raises:
+            InvalidSymbol: 종목이 없는 경우
+            AmbiguousSymbol: nation이 None이고 숫자 종목코드가 여러 국가의 거래소에 있는 경우 (exchange_code 지정 필요)
+        """
         self.load_market_data()
-        market_symbol = self._market[symbol]
+        market_symbol = self._market.get(symbol, exchange_code)
+        if market_symbol is None:
+            raise InvalidSymbol(f"Invalid symbol: {symbol}")
+        return market_symbol
+
+    def get_price(self, symbol: str) -> str:
+        market_symbol = self.get_symbol(symbol)
+        if market_symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            return str(self.client.domestic_stock.quote.get_price(market_symbol.symbol))
         return self.client.overseas_stock.quote.get_price(market_symbol.symbol, market_symbol.exchange_code)
 
-    def fetch_balance(self) -> Balance:
+    def get_prices(self, symbols: list[str], max_workers: int = 8) -> dict[str, str]:
+        """여러 종목의 현재가를 동시에 조회 (호출 빈도는 RateLimiter로 제한)
+
+        Returns:
+            dict[str, str]: 종목코드별 현재가
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as executor:
+            return dict(zip(symbols, executor.map(self.get_price, symbols), strict=True))
+
+    def fetch_balance(self, currency: Currency | None = None) -> Balance:
         """잔고 조회
 
+        Args:
+            currency (Currency | None): 통화, None이면 nation의 통화 (국내주식은 KRW)
+
         Returns:
-            Balance: 외화 잔고
+            Balance: 통화별 잔고
+
+        Raises:
+            ValueError: nation이 None이거나 통화가 여럿인데 currency를 지정하지 않은 경우,
+                nation에 없는 통화를 지정한 경우
         """
-        if self.nation == "KR":
-            # TODO: 국내주식 잔고 조회
-            raise NotImplementedError("국내주식 잔고 조회는 아직 구현되지 않았습니다.")
+        currency = self._account_currency(currency)
+        if currency == "KRW":
+            return Balance.from_domestic_response(self.client.domestic_stock.order.inquire_psbl_order())
 
-        # TODO: 다른 국가 지원
-        response = self.client.overseas_stock.account.inquire_psamount("AAPL", "NASD")
+        exchange_code, symbol = CurrencyBalanceQueryMap[currency]
+        response = self.client.overseas_stock.account.inquire_psamount(symbol, exchange_code)
         return Balance.from_response(response)
 
-    def fetch_positions(self) -> list[Position]:
-        """보유종목 조회
+    def fetch_positions(self, currency: Currency | None = None) -> list[Position]:
+        """보유종목 조회 (국가의 모든 해외거래소를 동시에 조회, nation이 None이면 전체)
+
+        Args:
+            currency (Currency | None): 통화, 지정하면 그 통화의 거래소만 조회
 
         Returns:
-            list[Position]: 외화 보유종목
+            list[Position]: 외화 보유종목 (통화 포함), 거래소/종목코드 중복 제거
         """
-        if self.nation == "KR":
+        if self.nation == "KR" or currency == "KRW":
             # TODO: 국내주식 보유종목 조회
             raise NotImplementedError("국내주식 보유종목 조회는 아직 구현되지 않았습니다.")
 
-        # TODO: 다른 국가 지원
-        response = self.client.overseas_stock.account.inquire_balance(exchange_code="NASD", currency="USD")
-        return [Position.from_response(position) for position in response["output1"]]
+        def fetch(exchange_code: LongExchangeCode) -> list[Position]:
+            currency = LongExchangeCurrencyMap[exchange_code]
+            response = self.client.overseas_stock.account.inquire_balance(exchange_code=exchange_code, currency=currency)
+            return [Position.from_response(position) for position in response["output1"]]
+
+        positions: dict[tuple[str, str], Position] = {}
+        for exchange_code, items in self._fan_out(fetch, currency):
+            for position in items:
+                position.exchange_code = position.exchange_code or exchange_code
+                position.currency = position.currency or LongExchangeCurrencyMap[exchange_code]
+                positions.setdefault((position.exchange_code, position.symbol), position)
+        return list(positions.values())
+
+    def fetch_pending_orders(self, currency: Currency | None = None) -> list[PendingOrder]:
+        """미체결 주문 조회 (국가의 모든 해외거래소를 동시에 조회, nation이 None이면 전체)
 
-    def fetch_pending_orders(self) -> list[PendingOrder]:
-        if self.nation == "KR":
+        Args:
+            currency (Currency | None): 통화, 지정하면 그 통화의 거래소만 조회
+
+        Returns:
+            list[PendingOrder]: 미체결 주문 (통화 포함), 주문번호 중복 제거
+        """
+        if self.nation == "KR" or currency == "KRW":
             # TODO: 국내주식 예약주문 조회
             raise NotImplementedError("국내주식 예약주문 조회는 아직 구현되지 않았습니다.")
 
-        # TODO: 다른 국가 지원
-        orders = self.client.overseas_stock.account.inquire_nccs("NASD")
-        return [PendingOrder.from_response(order) for order in orders]
+        def fetch(exchange_code: LongExchangeCode) -> list[PendingOrder]:
+            orders = self.client.overseas_stock.account.inquire_nccs(exchange_code)
+            return [PendingOrder.from_response(order) for order in orders]
+
+        pending_orders: dict[str, PendingOrder] = {}
+        for exchange_code, items in self._fan_out(fetch, currency):
+            for order in items:
+                order.exchange_code = order.exchange_code or exchange_code
+                order.currency = order.currency or LongExchangeCurrencyMap[exchange_code]
+                pending_orders.setdefault(order.order_id, order)
+        return list(pending_orders.values())
+
+    def _account_exchange_codes(self, currency: Currency | None = None) -> list[LongExchangeCode]:
+        """잔고/미체결을 조회할 해외거래소코드 (nation 기준, currency를 지정하면 그 통화의 거래소만)"""
+        nations = [self.nation] if self.nation else [nation for nation in NationExchangeCodeMap if nation != "KR"]
+        exchange_codes = [
+            ExchangeLongCodeMap[exchange_code]
+            for nation in nations
+            for exchange_code in NationExchangeCodeMap[nation]
+            if exchange_code in ExchangeLongCodeMap
+        ]
+        if currency is not None:
+            exchange_codes = [code for code in exchange_codes if LongExchangeCurrencyMap[code] == currency]
+        return list(dict.fromkeys(exchange_codes))
+
+    def _account_currencies(self) -> list[Currency]:
+        """이 클라이언트가 다루는 통화 (nation 기준, None이면 원화와 모든 외화)"""
+        overseas = [LongExchangeCurrencyMap[code] for code in self._account_exchange_codes()]
+        domestic: list[Currency] = ["KRW"] if self.nation in ("KR", None) else []
+        return list(dict.fromkeys([*domestic, *overseas]))
+
+    def _account_currency(self, currency: Currency | None) -> Currency:
+        """조회할 통화 (None이면 nation의 유일한 통화)"""
+        currencies = self._account_currencies()
+        if currency is None:
+            if len(currencies) != 1:
+                raise ValueError(f"통화를 지정해야 합니다: {currencies}")
+            return currencies[0]
+        if currency not in currencies:
+            raise ValueError(f"{self.nation} 계좌에서 조회할 수 없는 통화입니다: {currency}")
+        return currency
+
+    def _fan_out(
+        self, fetch: Callable[[LongExchangeCode], list[T]], currency: Currency | None = None
+    ) -> list[tuple[LongExchangeCode, list[T]]]:
+        """거래소별 조회를 동시에 실행 (호출 빈도는 RateLimiter로 제한, 결과는 거래소 순서)"""
+        exchange_codes = self._account_exchange_codes(currency)
+        if not exchange_codes:
+            return []
+        with ThreadPoolExecutor(max_workers=len(exchange_codes)) as executor:
+            return list(zip(exchange_codes, executor.map(fetch, exchange_codes), strict=True))
+
+    def fetch_order(self, order_id: str, lookback_days: int = 30, symbol: str | None = None) -> Order | None:
+        """주문 조회
 
-    def fetch_order(self, order_id: str, lookback_days: int = 30) -> Order | None:
+        Args:
+            order_id (str): 주문번호
+            lookback_days (int): 주문 일지에 없는 주문을 찾을 기간(일)
+            symbol (str | None): 종목코드, 국내주식 주문은 지정해야 국내주식 주문체결내역에서 조회
+                (이 클라이언트로 접수한 국내주식 주문은 생략 가능)
+
+        Returns:
+            Order | None: 주문, 찾지 못하면 None
+
+        Note:
+            - 주문 일지가 있으면 완료된 주문은 일지에서 바로 반환하고,
+              미완료 주문은 주문일자부터만 다시 조회해 최신 상태를 기록합니다.
+            - 국내주식 주문은 주문 일지에 기록하지 않고 매번 조회합니다.
+        """
         now = datetime.now()
-        start_date = (now - timedelta(days=lookback_days)).strftime("%Y%m%d")
-        end_date = now.strftime("%Y%m%d")
-        orders = self.client.overseas_stock.order.inquire_orders(start_date, end_date, order_id)
+        start = now - timedelta(days=lookback_days)
+        is_domestic = order_id in self._order_branches or (
+            symbol is not None and self.get_symbol(symbol).exchange_code == DOMESTIC_EXCHANGE_CODE
+        )
+        if is_domestic:
+            item = self.client.domestic_stock.order.inquire_order(
+                order_id, start.strftime("%Y%m%d"), now.strftime("%Y%m%d")
+            )
+            return Order.from_response(item) if item is not None else None
+
+        if self.journal is not None:
+            journal_order = self.journal.get(order_id)
+            if journal_order is not None:
+                if journal_order.status != "open":
+                    return journal_order
+                start = journal_order.order_date
+
+        orders = self.client.overseas_stock.order.inquire_orders(
+            start.strftime("%Y%m%d"), now.strftime("%Y%m%d"), order_id
+        )
         if not orders:
             return None
 
-        order = orders[0]
-        return Order.from_response(order)
+        order = Order.from_response(orders[0])
+        if self.journal is not None:
+            self.journal.record(order)
+        return order
 
-    def fetch_account_summary(self) -> AccountSummary:
-        """총 자산 정보를 조회"""
-        balance = self.fetch_balance()
-        positions = self.fetch_positions()
-        pending_orders = self.fetch_pending_orders()
-        return AccountSummary.create(balance, positions, pending_orders)
+    def sync_orders(self, lookback_days: int = 30) -> list[OrderChange]:
+        """주문체결내역을 주문 일지에 증분 동기화 (지난 동기화 이후의 주문과 미완료 주문의 변경만 조회)
+
+        Args:
+            lookback_days (int): 처음 동기화할 때 조회할 기간(일)
+
+        Returns:
+            list[OrderChange]: 새 주문과 상태가 바뀐 주문
+        """
+        if self.journal is None:
+            raise ValueError("주문 일지(journal)가 없습니다.")
+        return OrderSync(self.client.overseas_stock.order, self.journal, lookback_days).sync()
+
+    def watch_orders(self, hts_id: str, realtime: RealtimeClient | None = None) -> Iterator[Order]:
+        """실시간 체결통보로 이 계좌의 주문 상태 변경을 받음 (fetch_order 폴링 대신 사용)
+
+        Args:
+            hts_id (str): 체결통보를 등록할 HTS ID
+            realtime (RealtimeClient | None): 실시간 클라이언트, None이면 새로 접속
+
+        Yields:
+            Order: 접수/체결/취소/거부로 상태가 바뀐 주문
+
+        Note:
+            realtime.close()를 호출하면 반복이 끝납니다.
+        """
+        realtime = realtime or RealtimeClient(self._auth)
+        realtime.subscribe_fill_notices(hts_id, self.nation)
+        tracker = OrderTracker()
+        for event in realtime.events():
+            if not isinstance(event, FillNotice) or not event.account_no.startswith(self._auth.cano):
+                continue
+            order = tracker.update(event)
+            if order is not None:
+                yield order
+
+    def fetch_account_summary(
+        self, max_age: float = 0.0, refresh: bool = False, currency: Currency | None = None
+    ) -> AccountSummary:
+        """한 통화의 총 자산 정보를 조회 (잔고/보유종목/미체결을 동시에 조회)
+
+        Args:
+            max_age (float): 이전 조회 결과를 재사용할 최대 경과 시간(초), 0이면 항상 조회
+            refresh (bool): max_age와 관계없이 새로 조회 (주문 전 확인 등)
+            currency (Currency | None): 통화, None이면 nation의 통화 (nation이 None이면 지정해야 함)
+
+        Returns:
+            AccountSummary: 총 자산 정보 (snapshot_at은 조회를 요청한 시각)
+
+        Raises:
+            ValueError: 통화를 정할 수 없는 경우 (fetch_balance 참고)
+
+        Note:
+            - 조회가 진행 중일 때 다른 스레드가 같은 통화를 요청하면 max_age, refresh와 관계없이 새로 조회하지 않고
+              진행 중인 조회의 결과를 기다려 공유합니다.
+            - 통화가 다른 금액은 더하지 않습니다. 여러 통화는 fetch_account_summaries로 조회합니다.
+
+        Example:
+            >>> kis.fetch_account_summary(max_age=5)  # 대시보드: 5초 동안 같은 결과 재사용
+            >>> kis.fetch_account_summary(refresh=True)  # 주문 전: 항상 새로 조회
+        """
+        currency = self._account_currency(currency)
+        with self._account_summary_lock:
+            cached = self._account_summary.get(currency)
+            if not refresh and cached is not None and time.monotonic() - cached[0] <= max_age:
+                return cached[1]
+            in_flight = self._account_summary_fetch.get(currency)
+            if in_flight is None:
+                future: Future[AccountSummary] = Future()
+                self._account_summary_fetch[currency] = future
+        if in_flight is not None:
+            return in_flight.result()
+
+        fetched_at, snapshot_at = time.monotonic(), datetime.now()
+        try:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                balance = executor.submit(self.fetch_balance, currency)
+                positions = executor.submit(self.fetch_positions, currency)
+                pending_orders = executor.submit(self.fetch_pending_orders, currency)
+                summary = AccountSummary.create(
+                    balance.result(), positions.result(), pending_orders.result(), snapshot_at=snapshot_at
+                )
+        except BaseException as e:
+            with self._account_summary_lock:
+                del self._account_summary_fetch[currency]
+            future.set_exception(e)
+            raise
+        with self._account_summary_lock:
+            self._account_summary[currency] = (fetched_at, summary)
+            del self._account_summary_fetch[currency]
+        future.set_result(summary)
+        return summary
+
+    def fetch_account_summaries(self, max_age: float = 0.0, refresh: bool = False) -> dict[Currency, AccountSummary]:
+        """nation의 모든 외화 총 자산 정보를 통화별로 동시에 조회 (nation이 None이면 모든 외화)
+
+        Returns:
+            dict[Currency, AccountSummary]: 통화별 총 자산 정보
+
+        Note:
+            - 국내주식 보유종목 조회가 구현되기 전까지 원화(KRW)는 포함하지 않습니다.
+        """
+        currencies = [currency for currency in self._account_currencies() if currency != "KRW"]
+        if not currencies:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(currencies)) as executor:
+            summaries = executor.map(lambda currency: self.fetch_account_summary(max_age, refresh, currency), currencies)
+            return dict(zip(currencies, summaries, strict=True))
 
     def fetch_ohlcv(
         self,
@@ -147,16 +451,14 @@ class KisClientV2:
 
         Returns:
             list[dict]: 주식 기간별 시세
-        """
-        if self.nation == "KR":
-            # TODO: 국내주식 시세 조회
-            return []
 
-        self.load_market_data()
-        if symbol not in self._market:
-            raise InvalidSymbol(f"Invalid symbol: {symbol}")
-
-        market_symbol = self._market[symbol]
+        Note:
+            - 국내주식은 start_date가 없으면 최근 100일을 조회합니다.
+            - 국내주식 분봉은 1분봉을 장 시작 시각부터 period 단위로 묶어 만듭니다.
+        """
+        market_symbol = self.get_symbol(symbol)
+        if market_symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            return self._fetch_domestic_ohlcv(market_symbol, start_date, end_date, period, is_adjust, desc, limit)
 
         exchange_code = market_symbol.exchange_code
         if period in ["d", "w", "M"]:
@@ -186,6 +488,92 @@ class KisClientV2:
 
         return result
 
+    def _fetch_domestic_ohlcv(
+        self,
+        market_symbol: Symbol,
+        start_date: str | None,
+        end_date: str | None,
+        period: Period,
+        is_adjust: bool,
+        desc: bool,
+        limit: int | None,
+    ) -> list[OHLCV]:
+        quote = self.client.domestic_stock.quote
+        start_date = start_date or (datetime.now() - timedelta(days=99)).strftime("%Y-%m-%d")
+        if period in ["d", "w", "M"]:
+            histories = quote.get_stock_price_history(
+                stock_code=market_symbol.symbol,
+                start_date=start_date,
+                end_date=end_date,
+                period=period.upper(),
+                is_adjust=is_adjust,
+            )
+            bars = [OHLCV.from_response(history) for history in histories]
+        else:
+            histories = quote.get_stock_price_history_by_minute_range(
+                symbol=market_symbol.symbol,
+                start_date=start_date,
+                end_date=end_date,
+                desc=True,
+            )
+            bars = [OHLCV.from_response(history) for history in histories]
+            if period != "1m":
+                session_open = MarketSessionMap[DOMESTIC_EXCHANGE_CODE][0]
+                bars = _resample_minutes(bars, int(PERIOD_TO_MINUTES[period]), session_open)
+
+        # 최신순 정렬된 시세에서 최근 limit건
+        result = bars[:limit]
+        if not desc:
+            result.reverse()
+        return result
+
+    def fetch_ohlcv_pair(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str | None = None,
+        store: AdjustmentStore | None = None,
+    ) -> tuple[list[OHLCV], list[OHLCV]]:
+        """수정주가/원주가 일봉 시세를 한 번의 다운로드로 함께 조회
+
+        최초 조회 시에는 두 시세를 모두 받아 조정계수를 추론하고 store에 저장합니다.
+        이후에는 원주가 시세만 받고, 마지막 확인일 이후 구간만 수정주가로 조회하여 새 권리락을 반영한 뒤
+        수정주가 시세를 로컬에서 계산합니다.
+
+        Args:
+            symbol (str): 종목코드
+            start_date (str): 조회시작일자 ("YYYY-MM-DD" 형식)
+            end_date (str | None): 조회종료일자 ("YYYY-MM-DD" 형식), 기본값은 오늘
+            store (AdjustmentStore | None): 조정계수 저장소, None이면 매번 두 시세를 모두 조회
+
+        Returns:
+            tuple[list[OHLCV], list[OHLCV]]: (수정주가 시세, 원주가 시세), 시간순 정렬
+        """
+        parsed_start_date = datetime.strptime(start_date.replace("-", ""), "%Y%m%d")
+        # 조정계수는 오늘 기준이므로 종료일과 관계없이 오늘까지 조회
+        unadjusted = self.fetch_ohlcv(symbol, start_date, None, "d", is_adjust=False)
+
+        factors = store.load(symbol) if store else None
+        adjusted_window: list[OHLCV] = []
+        if factors is None or factors.start_date is None or parsed_start_date < factors.start_date:
+            factors = AdjustmentFactors(symbol=symbol, start_date=parsed_start_date)
+            adjusted_window = self.fetch_ohlcv(symbol, start_date, None, "d", is_adjust=True)
+        elif factors.as_of is None or (unadjusted and unadjusted[-1].date > factors.as_of):
+            window_start = (factors.as_of or parsed_start_date).strftime("%Y-%m-%d")
+            adjusted_window = self.fetch_ohlcv(symbol, window_start, None, "d", is_adjust=True)
+
+        if adjusted_window:
+            factors.add_events(infer_adjustment_events(adjusted_window, unadjusted))
+            factors.as_of = adjusted_window[-1].date
+            if store:
+                store.save(factors)
+
+        if end_date:
+            parsed_end_date = datetime.strptime(end_date.replace("-", ""), "%Y%m%d")
+            unadjusted = [bar for bar in unadjusted if bar.date <= parsed_end_date]
+
+        return factors.adjust(unadjusted), unadjusted
+
     def create_order(
         self,
         symbol: str,
@@ -204,12 +592,15 @@ class KisClientV2:
         Returns:
             str: 주문 ID
         """
-        if self.nation == "KR":
-            # TODO: 국내주식 주문
-            raise NotImplementedError("국내주식 주문은 아직 구현되지 않았습니다.")
+        market_symbol = self.get_symbol(symbol)
+        if market_symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            domestic_order = self.client.domestic_stock.order
+            place = domestic_order.buy if side == "buy" else domestic_order.sell
+            output = place(stock_code=market_symbol.symbol, quantity=quantity, price=price)["output"]
+            order_id: str = output["ODNO"]
+            self._order_branches[order_id] = output["KRX_FWDG_ORD_ORGNO"]
+            return order_id  # 주문 일지는 해외주식 주문체결내역으로 동기화하므로 국내주식 주문은 기록하지 않음
 
-        self.load_market_data()
-        market_symbol = self._market[symbol]
         exchange_code = ExchangeLongCodeMap[market_symbol.exchange_code]
 
         if side == "buy":
@@ -227,8 +618,47 @@ class KisClientV2:
                 price=price,
             )
 
+        self._record_order(order["ODNO"], market_symbol.symbol, side, price, quantity)
         return order["ODNO"]  # type: ignore[no-any-return]
 
+    def edit_order(self, symbol: str, order_id: str, price: str, quantity: int) -> str:
+        """주문정정
+
+        Args:
+            symbol (str): 종목코드
+            order_id (str): 원주문번호
+            price (str): 정정할 주문 가격
+            quantity (int): 정정할 주문 수량 (원주문의 미체결수량과 같아야 함)
+
+        Returns:
+            str: 정정 주문번호
+
+        Raises:
+            ValueError: 오늘 접수한 국내주식 주문이 아닌 경우 (국내주식은 당일 주문만 정정 가능)
+
+        Note:
+            - 국내주식은 미체결수량 전부의 가격을 정정합니다.
+        """
+        market_symbol = self.get_symbol(symbol)
+        if market_symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            resp = self.client.domestic_stock.order.update(order_id, self._order_branch(order_id), quantity, price)
+            self._order_branches[resp["ODNO"]] = resp["KRX_FWDG_ORD_ORGNO"]
+            return resp["ODNO"]  # type: ignore[no-any-return]
+
+        exchange_code = ExchangeLongCodeMap[market_symbol.exchange_code]
+        resp = self.client.overseas_stock.order.update(
+            symbol=market_symbol.symbol,
+            exchange_code=exchange_code,
+            order_number=order_id,
+            quantity=str(quantity),
+            price=float(price),
+        )
+
+        original = self.journal.get(order_id) if self.journal is not None else None
+        if original is not None:
+            self._record_order(resp["ODNO"], market_symbol.symbol, original.side, price, quantity, order_id)
+        return resp["ODNO"]  # type: ignore[no-any-return]
+
     def cancel_order(self, symbol: str, order_id: str) -> str:
         """주문취소
 
@@ -238,9 +668,15 @@ class KisClientV2:
 
         Returns:
             str: 주문번호
+
+        Raises:
+            ValueError: 오늘 접수한 국내주식 주문이 아닌 경우 (국내주식은 당일 주문만 취소 가능)
         """
-        self.load_market_data()
-        market_symbol = self._market[symbol]
+        market_symbol = self.get_symbol(symbol)
+        if market_symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            resp = self.client.domestic_stock.order.cancel(order_id, self._order_branch(order_id))
+            return resp["ODNO"]  # type: ignore[no-any-return]
+
         exchange_code = ExchangeLongCodeMap[market_symbol.exchange_code]
         resp = self.client.overseas_stock.order.cancel(
             symbol=market_symbol.symbol,
@@ -248,4 +684,66 @@ class KisClientV2:
             order_number=order_id,
         )
 
+        # 원주문은 동기화로 취소가 확인될 때까지 open으로 둠
+        original = self.journal.get(order_id) if self.journal is not None else None
+        if original is not None:
+            self._record_order(
+                resp["ODNO"], market_symbol.symbol, original.side, "0", original.requested_quantity, order_id
+            )
         return resp["ODNO"]  # type: ignore[no-any-return]
+
+    def _order_branch(self, order_id: str) -> str:
+        """국내주식 주문의 주문조직번호 (이 클라이언트에서 접수하지 않은 주문은 오늘 주문체결내역에서 조회)"""
+        branch = self._order_branches.get(order_id)
+        if branch is None:
+            order = self.client.domestic_stock.order.inquire_order(order_id)
+            if order is None:
+                raise ValueError(f"오늘 접수한 국내주식 주문이 아닙니다: {order_id}")
+            branch = self._order_branches[order_id] = order["ord_gno_brno"]
+        return branch
+
+    def _record_order(
+        self,
+        order_id: str,
+        symbol: str,
+        side: OrderSide,
+        price: str,
+        quantity: int | str,
+        original_order_id: str = "",
+    ) -> None:
+        """주문 일지에 접수한 주문을 기록 (체결 정보는 동기화로 채움)"""
+        if self.journal is None:
+            return
+        order = Order(
+            order_id=order_id,
+            symbol=symbol,
+            side=side,
+            status="open",
+            requested_price=str(price),
+            requested_quantity=str(quantity),
+            filled_quantity="0",
+            average_price="0",
+            filled_amount="0",
+            reject_reason="",
+            order_date=datetime.now(DOMESTIC_TIME_ZONE).replace(tzinfo=None),  # 주문체결내역과 같은 한국 시각
+        )
+        self.journal.record(order, original_order_id)
+
+
+def _resample_minutes(bars: list[OHLCV], minutes: int, session_open: dt_time) -> list[OHLCV]:
+    """최신순 1분봉을 장 시작 시각부터 minutes 단위로 묶은 분봉 (최신순)"""
+    size = timedelta(minutes=minutes)
+    resampled: list[OHLCV] = []
+    for bar in reversed(bars):
+        day_open = datetime.combine(bar.date.date(), session_open)
+        start = day_open + (bar.date - day_open) // size * size
+        last = resampled[-1] if resampled else None
+        if last is not None and last.date == start:
+            last.high = max(last.high, bar.high, key=Decimal)
+            last.low = min(last.low, bar.low, key=Decimal)
+            last.close = bar.close
+            last.volume = str(Decimal(last.volume) + Decimal(bar.volume))
+        else:
+            resampled.append(bar.model_copy(update={"date": start}))
+    resampled.reverse()
+    return resampled
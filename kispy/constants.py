@@ -1,23 +1,31 @@
+from datetime import time
 from typing import Literal
 
 from zoneinfo import ZoneInfo
 
 REAL_URL = "https://openapi.koreainvestment.com:9443"  # 실전투자 API
 VIRTUAL_URL = "https://openapivts.koreainvestment.com:29443"  # 모의투자 API
+REAL_WS_URL = "ws://ops.koreainvestment.com:21000"  # 실전투자 실시간 API
+VIRTUAL_WS_URL = "ws://ops.koreainvestment.com:31000"  # 모의투자 실시간 API
+REALTIME_SUBSCRIPTION_LIMIT = 41  # 웹소켓 세션당 실시간 TR 등록 한도
 
 # Rate Limits (calls per second)
 RATE_LIMIT_PER_SECOND = 19  # Maximum 19 calls per second
 RATE_LIMIT_WINDOW = 1.0  # Window size in seconds
 
 Nation = Literal["KR", "US", "JP", "CN", "HK", "VN"]
-ExchangeCode = Literal["NAS", "NYS", "AMS", "HKS", "HNX", "HSX", "SHI", "SHS", "SZI", "SZS", "TSE", "BAY", "BAQ", "BAA"]
+ExchangeCode = Literal[
+    "KRX", "NAS", "NYS", "AMS", "HKS", "HNX", "HSX", "SHI", "SHS", "SZI", "SZS", "TSE", "BAY", "BAQ", "BAA"
+]  # fmt: skip
 LongExchangeCode = Literal["NASD", "NYSE", "AMEX", "SEHK", "SHAA", "SZAA", "TKSE", "HASE", "VNSE"]
-Currency = Literal["USD", "HKD", "CNY", "JPY", "VND"]
+Currency = Literal["KRW", "USD", "HKD", "CNY", "JPY", "VND"]
+DomesticMarket = Literal["KOSPI", "KOSDAQ"]
 OrderSide = Literal["buy", "sell"]
 OrderStatus = Literal["open", "closed", "canceled", "rejected", "expired"]
 
 
 NationExchangeCodeMap: dict[Nation, list[ExchangeCode]] = {
+    "KR": ["KRX"],  # 국내주식 (코스피, 코스닥)
     "US": ["NAS", "NYS", "AMS"],
     "HK": ["HKS"],
     "JP": ["TSE"],
@@ -36,13 +44,42 @@ ExchangeLongCodeMap: dict[ExchangeCode, LongExchangeCode] = {
     "SZI": "SZAA",  # 중국심천지수
     "HSX": "HASE",  # 베트남 하노이
     "HNX": "VNSE",  # 베트남 호치민
+    "TSE": "TKSE",  # 일본
 }
 
+# 잔고/미체결 조회 거래소코드별 통화
+LongExchangeCurrencyMap: dict[LongExchangeCode, Currency] = {
+    "NASD": "USD",
+    "NYSE": "USD",
+    "AMEX": "USD",
+    "SEHK": "HKD",
+    "SHAA": "CNY",
+    "SZAA": "CNY",
+    "TKSE": "JPY",
+    "HASE": "VND",
+    "VNSE": "VND",
+}
+
+# 통화별 매수가능금액조회 거래소/종목 (주문가능외화금액은 통화 단위로 같으므로 거래가 많은 종목 하나로 조회)
+CurrencyBalanceQueryMap: dict[Currency, tuple[LongExchangeCode, str]] = {
+    "USD": ("NASD", "AAPL"),
+    "HKD": ("SEHK", "00700"),
+    "CNY": ("SHAA", "600519"),
+    "JPY": ("TKSE", "7203"),
+    "VND": ("VNSE", "VNM"),
+}
+
+DOMESTIC_EXCHANGE_CODE: ExchangeCode = "KRX"
+DOMESTIC_MARKETS: list[DomesticMarket] = ["KOSPI", "KOSDAQ"]
+DOMESTIC_TIME_ZONE = ZoneInfo("Asia/Seoul")
+DOMESTIC_MARKET_SESSION = (time(9, 0), time(15, 30))
+
 TimeZoneMap: dict[ExchangeCode, ZoneInfo] = {
+    "KRX": DOMESTIC_TIME_ZONE,
     "HKS": ZoneInfo("Asia/Hong_Kong"),
     "NYS": ZoneInfo("America/New_York"),
     "NAS": ZoneInfo("America/New_York"),
-    "AMS": ZoneInfo("Europe/Amsterdam"),
+    "AMS": ZoneInfo("America/New_York"),
     "TSE": ZoneInfo("Asia/Tokyo"),
     "SHS": ZoneInfo("Asia/Shanghai"),
     "SZS": ZoneInfo("Asia/Shanghai"),
@@ -55,6 +92,34 @@ TimeZoneMap: dict[ExchangeCode, ZoneInfo] = {
     "BAA": ZoneInfo("America/New_York"),
 }
 
+# 정규장 운영시간 (현지시각 기준, 점심시간 포함)
+MarketSessionMap: dict[ExchangeCode, tuple[time, time]] = {
+    "KRX": DOMESTIC_MARKET_SESSION,
+    "NAS": (time(9, 30), time(16, 0)),
+    "NYS": (time(9, 30), time(16, 0)),
+    "AMS": (time(9, 30), time(16, 0)),
+    "HKS": (time(9, 30), time(16, 0)),
+    "TSE": (time(9, 0), time(15, 30)),
+    "SHS": (time(9, 30), time(15, 0)),
+    "SZS": (time(9, 30), time(15, 0)),
+    "SHI": (time(9, 30), time(15, 0)),
+    "SZI": (time(9, 30), time(15, 0)),
+    "HSX": (time(9, 0), time(15, 0)),
+    "HNX": (time(9, 0), time(15, 0)),
+}
+
+# 정규장 점심시간 (현지시각 기준, 거래가 없는 시간)
+MarketBreakMap: dict[ExchangeCode, tuple[time, time]] = {
+    "HKS": (time(12, 0), time(13, 0)),
+    "TSE": (time(11, 30), time(12, 30)),
+    "SHS": (time(11, 30), time(13, 0)),
+    "SZS": (time(11, 30), time(13, 0)),
+    "SHI": (time(11, 30), time(13, 0)),
+    "SZI": (time(11, 30), time(13, 0)),
+    "HSX": (time(11, 30), time(13, 0)),
+    "HNX": (time(11, 30), time(13, 0)),
+}
+
 Period = Literal[
     "1m",
     "3m",
@@ -0,0 +1,204 @@
+"""실시간 이벤트 분배기
+- 하나의 실시간 스트림을 여러 소비자에게 나누어 전달
+- 소비자마다 크기가 정해진 대기열과 가득 찼을 때의 정책을 지정
+    - block: 자리가 날 때까지 전달을 멈춤 (주문 처리처럼 이벤트를 잃으면 안 되는 빠른 소비자용)
+    - drop_oldest: 가장 오래된 이벤트를 버림
+    - conflate: 같은 종목의 시세는 최신 값 하나만 남김 (가득 차면 가장 오래된 이벤트를 버림)
+- 느린 소비자(DB 기록 등)가 있어도 메모리가 늘지 않고, block이 아닌 소비자가 다른 소비자를 멈추지 않음
+"""
+
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import count
+from typing import Literal
+
+from kispy.models.realtime import OrderBook, Trade
+
+OverflowPolicy = Literal["block", "drop_oldest", "conflate"]
+
+
+def symbol_key(event: object) -> Hashable | None:
+    """conflate 기본 키: 시세(Trade/OrderBook)는 (종류, 종목코드), 그 외 이벤트(체결통보 등)는 합치지 않음"""
+    if isinstance(event, Trade | OrderBook):
+        return (event.tr_id, event.symbol)
+    return None
+
+
+@dataclass
+class SubscriberStats:
+    name: str
+    policy: OverflowPolicy
+    queued: int  # 대기 중인 이벤트 수
+    max_queued: int  # 최대 대기 이벤트 수
+    delivered: int  # 전달한 이벤트 수
+    dropped: int  # 대기열이 가득 차서 버린 이벤트 수
+    conflated: int  # 최신 값으로 합친 이벤트 수
+    lag: float  # 가장 오래 기다린 이벤트의 대기 시간(초)
+
+
+class Subscriber:
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        policy: OverflowPolicy,
+        key: Callable[[object], Hashable | None] = symbol_key,
+    ):
+        """분배기의 소비자 대기열 (RealtimeDispatcher.subscribe()로 생성)"""
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.name = name
+        self.policy = policy
+        self._maxsize = maxsize
+        self._key = key
+        self._items: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()  # 키 -> (대기 시작 시각, 이벤트)
+        self._sequence = count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._max_queued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._conflated = 0
+
+    def get(self, timeout: float | None = None) -> object:
+        """다음 이벤트
+
+        Raises:
+            queue.Empty: timeout 동안 이벤트가 없거나, 닫힌 뒤 남은 이벤트가 없는 경우
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._items or self._closed, timeout) or not self._items:
+                raise queue.Empty
+            _, (_, event) = self._items.popitem(last=False)
+            self._delivered += 1
+            self._condition.notify_all()
+            return event
+
+    def __iter__(self) -> Iterator[object]:
+        """닫힐 때까지 이벤트를 반복 (닫힌 뒤에도 남은 이벤트는 전달)"""
+        while True:
+            try:
+                yield self.get()
+            except queue.Empty:
+                return
+
+    def stats(self) -> SubscriberStats:
+        with self._condition:
+            oldest = next(iter(self._items.values()), None)
+            return SubscriberStats(
+                name=self.name,
+                policy=self.policy,
+                queued=len(self._items),
+                max_queued=self._max_queued,
+                delivered=self._delivered,
+                dropped=self._dropped,
+                conflated=self._conflated,
+                lag=time.monotonic() - oldest[0] if oldest else 0.0,
+            )
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _put(self, event: object) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            key = self._key(event) if self.policy == "conflate" else None
+            if key is not None and key in self._items:
+                queued_at, _ = self._items[key]
+                self._items[key] = (queued_at, event)  # 순서와 대기 시작 시각은 유지
+                self._conflated += 1
+                return
+            if key is None:
+                key = (Subscriber, next(self._sequence))  # 합치지 않는 이벤트
+
+            if len(self._items) >= self._maxsize:
+                if self.policy == "block":
+                    self._condition.wait_for(lambda: len(self._items) < self._maxsize or self._closed)
+                    if self._closed:
+                        return
+                else:
+                    self._items.popitem(last=False)
+                    self._dropped += 1
+
+            self._items[key] = (time.monotonic(), event)
+            self._max_queued = max(self._max_queued, len(self._items))
+            self._condition.notify_all()
+
+
+class RealtimeDispatcher:
+    def __init__(self) -> None:
+        """실시간 이벤트를 여러 소비자에게 분배
+
+        Example:
+            >>> dispatcher = RealtimeDispatcher()
+            >>> orders = dispatcher.subscribe("orders", 10_000, "block")
+            >>> writer = dispatcher.subscribe("db", 1_000, "conflate")
+            >>> threading.Thread(target=dispatcher.run, args=(client.events(),), daemon=True).start()
+            >>> for event in writer:
+            ...     save(event)
+        """
+        self._subscribers: list[Subscriber] = []
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self,
+        name: str,
+        maxsize: int = 1_000,
+        policy: OverflowPolicy = "drop_oldest",
+        key: Callable[[object], Hashable | None] = symbol_key,
+    ) -> Subscriber:
+        """소비자 추가
+
+        Args:
+            name (str): 소비자 이름 (통계 구분용)
+            maxsize (int): 최대 대기 이벤트 수
+            policy (OverflowPolicy): 대기열이 가득 찼을 때의 정책
+            key (Callable[[object], Hashable | None]): conflate 정책에서 합칠 이벤트의 키, None을 반환하면 합치지 않음
+
+        Returns:
+            Subscriber: 이벤트를 꺼낼 대기열
+        """
+        subscriber = Subscriber(name, maxsize, policy, key)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+        subscriber.close()
+
+    def publish(self, event: object) -> None:
+        """모든 소비자에게 이벤트 전달"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber._put(event)
+
+    def run(self, events: Iterable[object]) -> None:
+        """스트림이 끝날 때까지 이벤트를 분배한 뒤 모든 소비자를 닫음"""
+        try:
+            for event in events:
+                self.publish(event)
+        finally:
+            self.close()
+
+    def stats(self) -> list[SubscriberStats]:
+        """소비자별 대기/전달/버림/합침 수와 지연 시간"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return [subscriber.stats() for subscriber in subscribers]
+
+    def close(self) -> None:
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber.close()
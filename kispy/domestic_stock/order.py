@@ -2,22 +2,34 @@
 - 주문 관련 기능 (매수, 매도, 정정, 취소 등)
 """
 
+from datetime import datetime
+
 from kispy.base import BaseAPI
 
 
 class OrderAPI(BaseAPI):
-    def buy(self, stock_code: str, quantity: int, price: float) -> dict:
+    def buy(self, stock_code: str, quantity: int, price: float | str) -> dict:
         """
         주식주문(현금)[v1_국내주식-001] - 매수
+
+        Returns:
+            dict: 주문 응답 (output의 ODNO: 주문번호, KRX_FWDG_ORD_ORGNO: 주문조직번호, ORD_TMD: 주문시각)
+        """
+        return self._order_cash("TTTC0802U" if self._auth.is_real else "VTTC0802U", stock_code, quantity, price)
+
+    def sell(self, stock_code: str, quantity: int, price: float | str) -> dict:
+        """
+        주식주문(현금)[v1_국내주식-001] - 매도
+
+        Returns:
+            dict: 주문 응답 (output의 ODNO: 주문번호, KRX_FWDG_ORD_ORGNO: 주문조직번호, ORD_TMD: 주문시각)
         """
+        return self._order_cash("TTTC0801U" if self._auth.is_real else "VTTC0801U", stock_code, quantity, price)
+
+    def _order_cash(self, tr_id: str, stock_code: str, quantity: int, price: float | str) -> dict:
         path = "uapi/domestic-stock/v1/trading/order-cash"
         url = f"{self._url}/{path}"
 
-        if self._auth.is_real:
-            tr_id = "TTTC0802U"  # 실전투자
-        else:
-            tr_id = "VTTC0802U"  # 모의투자
-
         headers = self._auth.get_header()
         headers["tr_id"] = tr_id
         params = {
@@ -32,8 +44,119 @@ class OrderAPI(BaseAPI):
         resp = self._request(method="post", url=url, headers=headers, json=params)
         return resp.json
 
-    def sell(self) -> dict:
+    def cancel(self, order_number: str, order_branch: str) -> dict:
         """
-        주식주문(현금)[v1_국내주식-001] - 매도
+        주식주문(정정취소)[v1_국내주식-003] - 취소 (미체결수량 전부)
+
+        Args:
+            order_number (str): 원주문번호
+            order_branch (str): 주문조직번호 (주문 응답의 KRX_FWDG_ORD_ORGNO)
+
+        Returns:
+            dict: 주문 결과 (ODNO: 주문번호, KRX_FWDG_ORD_ORGNO: 주문조직번호, ORD_TMD: 주문시각)
+        """
+        return self._revise_cancel(order_number, order_branch, "02", "0", "0")
+
+    def update(self, order_number: str, order_branch: str, quantity: int, price: float | str) -> dict:
         """
-        return {}
+        주식주문(정정취소)[v1_국내주식-003] - 정정 (미체결수량 전부)
+
+        Args:
+            order_number (str): 원주문번호
+            order_branch (str): 주문조직번호 (주문 응답의 KRX_FWDG_ORD_ORGNO)
+            quantity (int): 주문수량 (전량 정정이므로 무시되지만 원주문의 미체결수량을 전달)
+            price (float | str): 정정할 주문단가
+
+        Returns:
+            dict: 주문 결과 (ODNO: 주문번호, KRX_FWDG_ORD_ORGNO: 주문조직번호, ORD_TMD: 주문시각)
+        """
+        return self._revise_cancel(order_number, order_branch, "01", str(quantity), str(price))
+
+    def _revise_cancel(self, order_number: str, order_branch: str, division: str, quantity: str, price: str) -> dict:
+        path = "uapi/domestic-stock/v1/trading/order-rvsecncl"
+        url = f"{self._url}/{path}"
+
+        headers = self._auth.get_header()
+        headers["tr_id"] = "TTTC0803U" if self._auth.is_real else "VTTC0803U"
+        params = {
+            "CANO": self._auth.cano,
+            "ACNT_PRDT_CD": self._auth.acnt_prdt_cd,
+            "KRX_FWDG_ORD_ORGNO": order_branch,
+            "ORGN_ODNO": order_number,
+            "ORD_DVSN": "00",  # 주문구분: 00-지정가
+            "RVSE_CNCL_DVSN_CD": division,  # 정정취소구분: 01-정정, 02-취소
+            "ORD_QTY": quantity,
+            "ORD_UNPR": price,
+            "QTY_ALL_ORD_YN": "Y",  # 잔량전부주문여부
+        }
+
+        resp = self._request(method="post", url=url, headers=headers, json=params)
+        return resp.json["output"]  # type: ignore[no-any-return]
+
+    def inquire_psbl_order(self, stock_code: str = "", price: float | str = "") -> dict:
+        """
+        매수가능조회[v1_국내주식-007]
+
+        Args:
+            stock_code (str): 종목코드, 비워두면 주문가능현금만 조회
+            price (float | str): 주문단가, 비워두면 현재가 기준
+
+        Returns:
+            dict: 매수가능 금액 (ord_psbl_cash: 주문가능현금, nrcvb_buy_amt: 미수없는매수금액, max_buy_amt: 최대매수금액)
+        """
+        path = "uapi/domestic-stock/v1/trading/inquire-psbl-order"
+        url = f"{self._url}/{path}"
+
+        headers = self._auth.get_header()
+        headers["tr_id"] = "TTTC8908R" if self._auth.is_real else "VTTC8908R"
+        params = {
+            "CANO": self._auth.cano,
+            "ACNT_PRDT_CD": self._auth.acnt_prdt_cd,
+            "PDNO": stock_code,
+            "ORD_UNPR": str(price),
+            "ORD_DVSN": "00" if price else "01",  # 주문구분: 00-지정가, 01-시장가
+            "CMA_EVLU_AMT_ICLD_YN": "N",  # CMA평가금액포함여부
+            "OVRS_ICLD_YN": "N",  # 해외포함여부
+        }
+
+        resp = self._request(method="get", url=url, headers=headers, params=params)
+        return resp.json["output"]  # type: ignore[no-any-return]
+
+    def inquire_order(self, order_number: str, start_date: str | None = None, end_date: str | None = None) -> dict | None:
+        """
+        주식일별주문체결조회[v1_국내주식-005] - 주문번호로 조회 (3개월 이내)
+
+        Args:
+            order_number (str): 주문번호
+            start_date (str | None): 조회시작일자 (YYYYMMDD), 기본값은 오늘
+            end_date (str | None): 조회종료일자 (YYYYMMDD), 기본값은 오늘
+
+        Returns:
+            dict | None: 주문 체결 내역 (odno, ord_gno_brno: 주문조직번호, ord_qty, tot_ccld_qty, rmn_qty 등), 없으면 None
+        """
+        path = "uapi/domestic-stock/v1/trading/inquire-daily-ccld"
+        url = f"{self._url}/{path}"
+
+        today = datetime.now().strftime("%Y%m%d")
+        headers = self._auth.get_header()
+        headers["tr_id"] = "TTTC8001R" if self._auth.is_real else "VTTC8001R"
+        params = {
+            "CANO": self._auth.cano,
+            "ACNT_PRDT_CD": self._auth.acnt_prdt_cd,
+            "INQR_STRT_DT": start_date or today,
+            "INQR_END_DT": end_date or today,
+            "SLL_BUY_DVSN_CD": "00",  # 매도매수구분: 00-전체
+            "INQR_DVSN": "00",  # 조회구분: 00-역순
+            "PDNO": "",
+            "CCLD_DVSN": "00",  # 체결구분: 00-전체
+            "ORD_GNO_BRNO": "",
+            "ODNO": order_number,
+            "INQR_DVSN_3": "00",
+            "INQR_DVSN_1": "",
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
+
+        resp = self._request(method="get", url=url, headers=headers, params=params)
+        orders = [order for order in resp.json.get("output1") or [] if order.get("odno") == order_number]
+        return orders[0] if orders else None
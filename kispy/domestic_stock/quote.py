@@ -2,9 +2,11 @@
 - 기본적인 시세 정보 조회 (현재가, 호가, 체결, 일별 시세 등)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from kispy.base import BaseAPI
+from kispy.constants import DOMESTIC_MARKET_SESSION, DOMESTIC_TIME_ZONE
 
 
 class QuoteAPI(BaseAPI):
@@ -168,6 +170,121 @@ class QuoteAPI(BaseAPI):
 
         return result
 
+    def get_stock_price_history_by_daily_minute(
+        self,
+        symbol: str,
+        date: str,
+        time: str | None = None,
+        limit: int | None = None,
+        desc: bool = False,
+    ) -> list[dict]:
+        """주식일별분봉조회[국내주식-213]
+        지정한 일자의 분봉 데이터를 조회합니다. 주식당일분봉조회와 달리 과거 일자도 조회할 수 있습니다.
+
+        Args:
+            symbol (str): 종목코드
+            date (str): 조회일자 ("YYYY-MM-DD" 또는 "YYYYMMDD" 형식)
+            time (str | None): 조회 시작시간 (HHMMSS 형식), None인 경우 장 마감 시각부터 조회
+            limit (int | None): 조회 건수, None인 경우 해당 일자 전체
+            desc (bool): 시간 역순 정렬 여부, 기본값은 False (False: 과거순 정렬, True: 최신순 정렬)
+
+        Returns:
+            list[dict]: 주식 분봉 시세 (stck_cntg_hour는 datetime으로 변환)
+
+        Note:
+            - 한 번의 API 호출로 최대 120건의 데이터를 가져올 수 있습니다.
+            - 해당 일자의 분봉만 조회하도록 과거 데이터 포함 여부(FID_PW_DATA_INCU_YN)는 "N"으로 조회합니다.
+        """
+        path = "uapi/domestic-stock/v1/quotations/inquire-time-dailychartprice"
+        url = f"{self._url}/{path}"
+
+        headers = self._auth.get_header()
+        headers["tr_id"] = "FHKST03010230"
+
+        target_date = date.replace("-", "")
+        current_time = time or DOMESTIC_MARKET_SESSION[1].strftime("%H%M%S")
+
+        result: list[dict] = []
+        while limit is None or len(result) < limit:
+            params = {
+                "FID_COND_MRKT_DIV_CODE": "J",  # 시장 분류 코드 (J : 주식)
+                "FID_INPUT_ISCD": symbol,  # 종목코드
+                "FID_INPUT_HOUR_1": current_time,  # 조회 시작 시간
+                "FID_INPUT_DATE_1": target_date,  # 조회 일자
+                "FID_PW_DATA_INCU_YN": "N",  # 과거 데이터 포함 여부
+                "FID_FAKE_TICK_INCU_YN": "",  # 허봉 포함 여부 (공백: 미포함)
+            }
+
+            resp = self._request(method="get", url=url, headers=headers, params=params)
+
+            records = [
+                record
+                for record in resp.json["output2"]
+                if record and record.get("stck_bsop_date") == target_date and record["stck_cntg_hour"] <= current_time
+            ]
+            if not records:
+                break
+
+            for record in records:
+                record["stck_cntg_hour"] = self._parse_date(f"{target_date}{record['stck_cntg_hour']}")
+
+            if limit is not None:
+                records = records[: limit - len(result)]
+
+            result.extend(records)
+            current_time = self._get_next_keyb_minute(records)
+            if current_time < DOMESTIC_MARKET_SESSION[0].strftime("%H%M%S"):
+                break
+
+        if not desc:
+            result.reverse()
+
+        return result
+
+    def get_stock_price_history_by_minute_range(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str | None = None,
+        desc: bool = False,
+        max_workers: int = 4,
+    ) -> list[dict]:
+        """여러 일자의 분봉 데이터를 일자별로 동시에 조회하여 병합
+
+        Args:
+            symbol (str): 종목코드
+            start_date (str): 조회시작일자 ("YYYY-MM-DD" 형식)
+            end_date (str | None): 조회종료일자 ("YYYY-MM-DD" 형식), 기본값은 오늘
+            desc (bool): 시간 역순 정렬 여부, 기본값은 False
+            max_workers (int): 동시에 조회할 일자 수
+
+        Returns:
+            list[dict]: 주식 분봉 시세
+
+        Note:
+            - 주말은 조회하지 않으며, 휴장일은 빈 결과로 처리됩니다.
+            - 모든 스레드는 RateLimiter를 공유하므로 초당 호출 제한을 넘지 않습니다.
+        """
+        parsed_start_date = self._parse_date(start_date)
+        # 시스템 시간대와 관계없이 한국 시간 기준으로 오늘까지 조회
+        now = datetime.now(DOMESTIC_TIME_ZONE).replace(tzinfo=None)
+        parsed_end_date = min(self._parse_date(end_date or now.strftime("%Y%m%d")), now)
+
+        dates = []
+        cur_date = parsed_start_date
+        while cur_date <= parsed_end_date:
+            if cur_date.weekday() < 5:
+                dates.append(cur_date.strftime("%Y%m%d"))
+            cur_date += timedelta(days=1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            days = list(executor.map(lambda date: self.get_stock_price_history_by_daily_minute(symbol, date), dates))
+
+        result = [record for day in days for record in day]
+        if desc:
+            result.reverse()
+        return result
+
     def _get_next_keyb_minute(self, records: list[dict], period: int = 1) -> str:
         last_record = records[-1]
         last_time: datetime = last_record["stck_cntg_hour"]
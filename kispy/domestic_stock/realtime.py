@@ -1 +1,86 @@
-"""[국내주식] 실시간시세"""
+"""[국내주식] 실시간시세
+- 실시간 체결가/호가 TR의 필드 구성과 변환
+"""
+
+from datetime import datetime
+
+from kispy.constants import DOMESTIC_TIME_ZONE
+from kispy.models.realtime import FillNotice, OrderBook, Trade
+from kispy.utils import parse_compact_datetime
+
+TRADE_TR_ID = "H0STCNT0"  # 국내주식 실시간체결가 (KRX)
+ORDER_BOOK_TR_ID = "H0STASP0"  # 국내주식 실시간호가 (KRX)
+FILL_NOTICE_TR_ID = "H0STCNI0"  # 국내주식 실시간체결통보 (실전투자, 암호화)
+VIRTUAL_FILL_NOTICE_TR_ID = "H0STCNI9"  # 국내주식 실시간체결통보 (모의투자, 암호화)
+
+TRADE_FIELD_COUNT = 46
+ORDER_BOOK_FIELD_COUNT = 59
+FILL_NOTICE_FIELD_COUNT = 23
+
+# 국내주식 실시간체결가[실시간-003] 필드 위치
+TRADE_FIELDS = {
+    "symbol": 0,  # 유가증권단축종목코드
+    "time": 1,  # 주식체결시간
+    "price": 2,  # 주식현재가
+    "open": 7,  # 주식시가
+    "high": 8,  # 주식최고가
+    "low": 9,  # 주식최저가
+    "volume": 12,  # 체결거래량
+    "accumulated_volume": 13,  # 누적거래량
+    "date": 33,  # 주식영업일자
+}
+
+
+def parse_trade(fields: list[str], offset: int = 0) -> Trade:
+    """국내주식 실시간체결가[실시간-003] (필드 위치는 TRADE_FIELDS)"""
+    return Trade(
+        tr_id=TRADE_TR_ID,
+        symbol=fields[offset + 0],
+        time=parse_compact_datetime(fields[offset + 33], fields[offset + 1]),
+        price=fields[offset + 2],
+        volume=fields[offset + 12],
+        accumulated_volume=fields[offset + 13],
+        open=fields[offset + 7],
+        high=fields[offset + 8],
+        low=fields[offset + 9],
+    )
+
+
+def parse_order_book(fields: list[str], offset: int = 0) -> OrderBook:
+    """국내주식 실시간호가[실시간-004]
+
+    필드: 0 종목코드, 1 영업시간, 3~12 매도호가1~10, 13~22 매수호가1~10, 23~32 매도호가잔량1~10, 33~42 매수호가잔량1~10
+    """
+    today = datetime.now(DOMESTIC_TIME_ZONE).strftime("%Y%m%d")
+    return OrderBook(
+        tr_id=ORDER_BOOK_TR_ID,
+        symbol=fields[offset + 0],
+        time=parse_compact_datetime(today, fields[offset + 1]),
+        asks=list(zip(fields[offset + 3 : offset + 13], fields[offset + 23 : offset + 33], strict=True)),
+        bids=list(zip(fields[offset + 13 : offset + 23], fields[offset + 33 : offset + 43], strict=True)),
+    )
+
+
+def parse_fill_notice(fields: list[str], offset: int = 0) -> FillNotice:
+    """국내주식 실시간체결통보[실시간-005] (복호화한 데이터, 모의투자 TR도 tr_id는 FILL_NOTICE_TR_ID)
+
+    필드: 1 계좌번호, 2 주문번호, 3 원주문번호, 4 매도매수구분, 5 정정구분, 8 종목코드, 9 체결수량, 10 체결단가,
+    11 체결시간, 12 거부여부, 13 체결여부, 16 주문수량, 22 주문가격
+    """
+    today = datetime.now(DOMESTIC_TIME_ZONE).strftime("%Y%m%d")
+    return FillNotice(
+        tr_id=FILL_NOTICE_TR_ID,
+        account_no=fields[offset + 1],
+        order_id=fields[offset + 2],
+        original_order_id=fields[offset + 3],
+        symbol=fields[offset + 8],
+        side="sell" if fields[offset + 4] == "01" else "buy",
+        revise_cancel=fields[offset + 5],
+        is_fill=fields[offset + 13] == "2",
+        is_rejected=fields[offset + 12] == "1",
+        quantity=fields[offset + 9],
+        price=fields[offset + 10],
+        order_quantity=fields[offset + 16],
+        order_price=fields[offset + 22],
+        time=parse_compact_datetime(today, fields[offset + 11]),
+    )
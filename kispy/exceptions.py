@@ -26,3 +26,9 @@ class InvalidSymbol(KispyException):
     """Invalid symbol."""
 
     pass
+
+
+class AmbiguousSymbol(InvalidSymbol):
+    """Symbol code listed on exchanges of several nations."""
+
+    pass
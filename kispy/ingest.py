@@ -0,0 +1,219 @@
+"""시세 일괄 수집
+- 여러 종목의 기간별 시세를 스레드로 나누어 수집
+- 종목/페이지 단위로 진행 상황을 기록하여 중단된 지점부터 재개
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Literal
+
+from kispy.client import KisClient
+from kispy.models.market import OHLCV, Symbol
+from kispy.store import BarStore
+
+logger = logging.getLogger(__name__)
+
+IngestStatus = Literal["pending", "running", "done", "failed"]
+
+
+class IngestCheckpoint:
+    """수집 진행 상황을 JSON 파일로 저장
+
+    종목별로 상태와 다음에 조회할 종료일자(cursor)를 기록합니다.
+    매 기록은 `{path}.log` 파일에 한 줄씩 추가하고, compact_every건마다(또는 compact 호출 시)
+    전체 상태를 `{path}`에 원자적으로 교체한 뒤 로그를 비웁니다. 기록 비용은 종목 수와 관계없이 일정합니다.
+    """
+
+    def __init__(self, path: str, compact_every: int = 1000):
+        self._path = path
+        self._log_path = f"{path}.log"
+        self._compact_every = compact_every
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] = {"params": None, "symbols": {}}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._data = json.load(f)
+        self._log_size = self._replay()
+        self._log = open(self._log_path, "a", encoding="utf-8")
+
+    @property
+    def params(self) -> dict | None:
+        return self._data["params"]  # type: ignore[no-any-return]
+
+    def set_params(self, params: dict) -> None:
+        with self._lock:
+            self._data["params"] = params
+            self._flush()
+
+    def reset(self) -> None:
+        """조회 조건과 모든 종목의 진행 상황을 지움"""
+        with self._lock:
+            self._data = {"params": None, "symbols": {}}
+            self._flush()
+
+    def get(self, symbol: str) -> dict:
+        with self._lock:
+            return dict(self._data["symbols"].get(symbol, {"status": "pending", "cursor": None}))
+
+    def update(self, symbol: str, status: IngestStatus, cursor: str | None = None, error: str | None = None) -> None:
+        with self._lock:
+            state: dict[str, Any] = {"status": status, "cursor": cursor}
+            if error:
+                state["error"] = error
+            self._data["symbols"][symbol] = state
+            self._log.write(json.dumps({"symbol": symbol, **state}) + "\n")
+            self._log.flush()
+            self._log_size += 1
+            if self._log_size >= self._compact_every:
+                self._flush()
+
+    def compact(self) -> None:
+        """전체 상태를 기록하고 로그를 비움"""
+        with self._lock:
+            self._flush()
+
+    def _replay(self) -> int:
+        """로그에 추가된 기록을 상태에 반영 (기록 중 중단되어 잘린 줄은 무시)"""
+        if not os.path.exists(self._log_path):
+            return 0
+        count = 0
+        with open(self._log_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    # 잘린 줄 뒤에 이어 쓰지 않도록 줄바꿈으로 끝냄
+                    with open(self._log_path, "a", encoding="utf-8") as log:
+                        log.write("\n")
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._data["symbols"][record.pop("symbol")] = record
+                count += 1
+        return count
+
+    def _flush(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
+        self._log.truncate(0)
+        self._log_size = 0
+
+
+@dataclass
+class IngestResult:
+    done: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+class IngestJob:
+    def __init__(
+        self,
+        client: KisClient,
+        store: BarStore,
+        checkpoint: IngestCheckpoint,
+        symbols: list[Symbol],
+        start_date: str,
+        end_date: str | None = None,
+        period: str = "d",
+        is_adjust: bool = True,
+        max_workers: int = 4,
+        resume: bool = False,
+    ):
+        """해외주식 기간별 시세 일괄 수집 작업
+
+        Args:
+            client (KisClient): KIS API 클라이언트
+            store (BarStore): 시세 저장소
+            checkpoint (IngestCheckpoint): 진행 상황 저장소
+            symbols (list[Symbol]): 수집할 종목
+            start_date (str): 조회시작일자 ("YYYY-MM-DD" 형식)
+            end_date (str | None): 조회종료일자 ("YYYY-MM-DD" 형식), 기본값은 오늘
+            period (str): 조회기간 (옵션: "d" (일), "w" (주), "M" (월))
+            is_adjust (bool): 수정주가 여부, 기본값은 True
+            max_workers (int): 동시에 수집할 종목 수
+            resume (bool): 이전 진행 상황의 조회 조건이 달라도 저장된 조회 조건으로 이어서 수집
+
+        Raises:
+            ValueError: 이전 진행 상황의 조회 조건이 다른데 resume이 False인 경우
+                (이어서 수집하려면 resume=True, 새 조건으로 수집하려면 checkpoint.reset() 후 실행)
+
+        Note:
+            - 모든 스레드는 프로세스 내 RateLimiter를 공유하므로 동시 수집 시에도 초당 호출 제한을 넘지 않습니다.
+            - 이전 진행 상황이 있으면 이어서 수집합니다.
+        """
+        self._client = client
+        self._store = store
+        self._checkpoint = checkpoint
+        self._symbols = symbols
+        self._max_workers = max_workers
+
+        params: dict[str, Any] = {
+            "start_date": start_date,
+            "end_date": end_date or datetime.now().strftime("%Y-%m-%d"),
+            "period": period,
+            "is_adjust": is_adjust,
+        }
+        if checkpoint.params is None:
+            checkpoint.set_params(params)
+        elif checkpoint.params != params:
+            if not resume:
+                raise ValueError(f"이전 진행 상황의 조회 조건이 다릅니다: {checkpoint.params} != {params}")
+            logger.info(f"resume with saved params: {checkpoint.params}")
+        self._params = checkpoint.params or params
+
+    def run(self) -> IngestResult:
+        result = IngestResult()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {symbol.symbol: executor.submit(self._ingest_symbol, symbol) for symbol in self._symbols}
+
+        for symbol, future in futures.items():
+            status, error = future.result()
+            if status == "done":
+                result.done.append(symbol)
+            elif status == "skipped":
+                result.skipped.append(symbol)
+            else:
+                result.failed[symbol] = error or ""
+        self._checkpoint.compact()
+        return result
+
+    def _ingest_symbol(self, symbol: Symbol) -> tuple[str, str | None]:
+        state = self._checkpoint.get(symbol.symbol)
+        if state["status"] == "done":
+            return "skipped", None
+
+        cursor: str = state["cursor"] or self._params["end_date"]
+        self._checkpoint.update(symbol.symbol, "running", cursor)
+        try:
+            pages = self._client.overseas_stock.quote.iter_stock_price_history_pages(
+                symbol=symbol.symbol,
+                exchange_code=symbol.exchange_code,
+                start_date=self._params["start_date"],
+                end_date=cursor,
+                period=self._params["period"],
+                is_adjust=self._params["is_adjust"],
+            )
+            for page in pages:
+                self._store.append(symbol.symbol, [OHLCV.from_response(item) for item in page])
+                last_date = datetime.strptime(page[-1]["xymd"], "%Y%m%d")
+                cursor = (last_date - timedelta(days=1)).strftime("%Y-%m-%d")
+                self._checkpoint.update(symbol.symbol, "running", cursor)
+        except Exception as e:
+            logger.exception(f"failed to ingest {symbol.symbol}")
+            self._checkpoint.update(symbol.symbol, "failed", cursor, error=str(e))
+            return "failed", str(e)
+
+        self._checkpoint.update(symbol.symbol, "done", cursor)
+        return "done", None
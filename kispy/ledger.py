@@ -0,0 +1,303 @@
+"""로컬 포트폴리오 장부
+- 주문/체결 이벤트(체결통보 또는 REST 폴링으로 받은 Order)를 보유종목, 예수금, 주문중금액에 이벤트당 O(1)로 반영
+- 주기적으로 REST 총 자산 정보(inquire_balance 등)로 맞춰서, 놓친 이벤트나 수수료 차이를 바로잡음
+- 위험 점검은 네트워크 조회 없이 장부를 읽음
+
+금액 계산 (통화별로 따로 계산하고 더하지 않음):
+    예수금(cash) = 주문가능금액 + 매수 주문중금액
+    매수 체결은 예수금에서 체결금액을 빼고, 매도 체결은 더함 (수수료/세금은 맞출 때 반영)
+    매수 주문중금액은 미체결수량 x 주문가격, 매도 주문은 보유수량(잔고수량) 중 미체결수량을 묶음
+"""
+
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal
+
+from kispy.models.account import AccountSummary, Order
+from kispy.models.realtime import FillNotice
+
+ZERO = Decimal(0)
+DONE_STATUSES = ("closed", "canceled", "rejected", "expired")
+
+
+@dataclass(slots=True)
+class Holding:
+    symbol: str
+    currency: str  # 통화
+    quantity: Decimal  # 보유수량 (잔고수량)
+    cost: Decimal  # 매입금액 (평균단가 x 보유수량)
+    locked_quantity: Decimal = ZERO  # 매도 주문중 수량
+
+    @property
+    def average_price(self) -> Decimal:
+        return self.cost / self.quantity if self.quantity else ZERO
+
+    @property
+    def available_quantity(self) -> Decimal:
+        """매도가능수량"""
+        return self.quantity - self.locked_quantity
+
+
+@dataclass(slots=True)
+class _OrderState:
+    symbol: str
+    currency: str
+    is_buy: bool
+    price: Decimal  # 주문가격 (시장가는 0)
+    filled_quantity: Decimal
+    filled_amount: Decimal
+    remaining_quantity: Decimal  # 미체결수량 (완료된 주문은 0)
+
+    @property
+    def locked_amount(self) -> Decimal:
+        return self.remaining_quantity * self.price if self.is_buy else ZERO
+
+
+class PortfolioLedger:
+    def __init__(
+        self,
+        summary: AccountSummary | None = None,
+        reconcile_interval: float = 60.0,
+        currency_of: Callable[[str], str] | None = None,
+    ):
+        """주문/체결 이벤트로 갱신하는 계좌 장부 (통화별 예수금/주문중금액)
+
+        Args:
+            summary (AccountSummary | None): 시작 상태, None이면 빈 장부
+            reconcile_interval (float): REST로 맞출 주기(초), reconcile_due 판단에 사용
+            currency_of (Callable[[str], str] | None): 종목코드의 통화, 장부에 없는 종목의 주문을 반영할 때 사용
+                (None이면 장부의 통화가 하나일 때만 그 통화로 반영)
+
+        Example:
+            >>> ledger = PortfolioLedger(currency_of=lambda symbol: kis.get_symbol(symbol).currency)
+            >>> for summary in kis.fetch_account_summaries().values():
+            ...     ledger.reconcile(summary)
+            >>> for event in realtime.events():
+            ...     if isinstance(event, FillNotice):
+            ...         ledger.on_notice(event)
+            ...     if ledger.reconcile_due():
+            ...         for summary in kis.fetch_account_summaries(refresh=True).values():
+            ...             ledger.reconcile(summary)
+            >>> ledger.available_cash("USD"), ledger.holding("AAPL")
+        """
+        self._reconcile_interval = reconcile_interval
+        self._currency_of = currency_of
+        self._lock = threading.Lock()
+        self._holdings: dict[str, Holding] = {}
+        self._orders: dict[str, _OrderState] = {}  # 미체결 주문
+        self._done: set[str] = set()  # 완료까지 반영한 주문번호 (REST 폴링 중복 방지)
+        self._cash: defaultdict[str, Decimal] = defaultdict(Decimal)  # 통화별 예수금
+        self._locked_cash: defaultdict[str, Decimal] = defaultdict(Decimal)  # 통화별 매수 주문중금액
+        self._reconciled_at = 0.0
+        if summary is not None:
+            self.reconcile(summary)
+
+    def cash(self, currency: str | None = None) -> Decimal:
+        """예수금 (주문중금액 포함), currency가 None이면 장부의 유일한 통화"""
+        with self._lock:
+            return self._cash.get(self._ledger_currency(currency), ZERO)
+
+    def locked_cash(self, currency: str | None = None) -> Decimal:
+        """매수 주문중금액, currency가 None이면 장부의 유일한 통화"""
+        with self._lock:
+            return self._locked_cash.get(self._ledger_currency(currency), ZERO)
+
+    def available_cash(self, currency: str | None = None) -> Decimal:
+        """주문가능금액, currency가 None이면 장부의 유일한 통화"""
+        with self._lock:
+            currency = self._ledger_currency(currency)
+            return self._cash.get(currency, ZERO) - self._locked_cash.get(currency, ZERO)
+
+    def holding(self, symbol: str) -> Holding | None:
+        return self._holdings.get(symbol)
+
+    def holdings(self) -> list[Holding]:
+        with self._lock:
+            return list(self._holdings.values())
+
+    def on_notice(self, notice: FillNotice) -> None:
+        """체결통보 반영 (체결분만큼 보유종목/예수금을 바꾸고, 접수/정정/취소/거부는 주문중금액을 바꿈)"""
+        with self._lock:
+            if notice.revise_cancel != "0" and not notice.is_fill:
+                if notice.is_rejected:
+                    return  # 정정/취소 거부는 원주문에 영향 없음
+                original = self._orders.pop(notice.original_order_id, None)
+                if original is not None:
+                    self._lock_remaining(original, ZERO)
+                    self._done.add(notice.original_order_id)
+                if notice.revise_cancel == "2":
+                    return
+
+            state = self._orders.get(notice.order_id)
+            if state is None:
+                state = self._orders[notice.order_id] = _OrderState(
+                    symbol=notice.symbol,
+                    currency=self._symbol_currency(notice.symbol),
+                    is_buy=notice.side == "buy",
+                    price=Decimal(notice.order_price or (ZERO if notice.is_fill else notice.price)),
+                    filled_quantity=ZERO,
+                    filled_amount=ZERO,
+                    remaining_quantity=ZERO,
+                )
+                self._lock_remaining(state, Decimal(notice.order_quantity))
+
+            if notice.is_rejected:
+                self._lock_remaining(state, ZERO)
+            elif notice.is_fill:
+                quantity = Decimal(notice.quantity)
+                self._lock_remaining(state, max(state.remaining_quantity - quantity, ZERO))
+                self._fill(state, quantity, quantity * Decimal(notice.price))
+            if not state.remaining_quantity and (notice.is_rejected or notice.is_fill):
+                del self._orders[notice.order_id]
+                self._done.add(notice.order_id)
+
+    def apply(self, order: Order) -> None:
+        """REST로 조회한 주문의 최신 상태를 반영
+
+        Note:
+            - 이전에 반영한 상태와의 차이만 적용하므로 같은 상태를 여러 번 반영해도 됩니다.
+            - 체결통보와 함께 사용해도 같은 체결을 두 번 반영하지 않습니다.
+        """
+        filled_quantity = Decimal(order.filled_quantity)
+        filled_amount = Decimal(order.filled_amount)
+        remaining_quantity = (
+            ZERO if order.status in DONE_STATUSES else max(Decimal(order.requested_quantity) - filled_quantity, ZERO)
+        )
+        with self._lock:
+            state = self._orders.get(order.order_id)
+            if state is None:
+                if order.status in DONE_STATUSES and order.order_id in self._done:
+                    return  # 이미 완료까지 반영한 주문
+                state = self._orders[order.order_id] = _OrderState(
+                    symbol=order.symbol,
+                    currency=self._symbol_currency(order.symbol),
+                    is_buy=order.side == "buy",
+                    price=Decimal(order.requested_price or 0),
+                    filled_quantity=ZERO,
+                    filled_amount=ZERO,
+                    remaining_quantity=ZERO,
+                )
+            elif filled_quantity < state.filled_quantity:
+                return  # 이미 반영한 상태보다 오래된 상태
+
+            self._lock_remaining(state, remaining_quantity)
+            self._fill(state, filled_quantity - state.filled_quantity, filled_amount - state.filled_amount)
+            if order.status in DONE_STATUSES:
+                del self._orders[order.order_id]
+                self._done.add(order.order_id)
+
+    def reconcile(self, summary: AccountSummary) -> list[str]:
+        """REST 총 자산 정보로 장부의 그 통화 부분을 맞춤 (다른 통화의 보유종목/주문/예수금은 그대로 둠)
+
+        Args:
+            summary (AccountSummary): 한 통화의 총 자산 정보 (fetch_account_summary)
+
+        Returns:
+            list[str]: 장부와 보유수량(잔고수량)이 달랐던 종목코드
+        """
+        currency = summary.currency
+        holdings = {
+            position.symbol: Holding(
+                symbol=position.symbol,
+                currency=currency,
+                quantity=Decimal(position.balance_quantity),
+                cost=Decimal(position.average_price) * Decimal(position.balance_quantity),
+            )
+            for position in summary.positions
+        }
+        orders = {
+            order.order_id: _OrderState(
+                symbol=order.symbol,
+                currency=currency,
+                is_buy=order.side == "buy",
+                price=Decimal(order.requested_price or 0),
+                filled_quantity=Decimal(order.filled_amount),
+                filled_amount=Decimal(order.order_amount),
+                remaining_quantity=Decimal(order.remaining_quantity),
+            )
+            for order in summary.pending_orders
+        }
+        for order in orders.values():
+            if not order.is_buy and order.symbol in holdings:
+                holdings[order.symbol].locked_quantity += order.remaining_quantity
+        locked_cash = sum((order.locked_amount for order in orders.values()), ZERO)
+
+        with self._lock:
+            previous = {symbol: holding for symbol, holding in self._holdings.items() if holding.currency == currency}
+            drifted = [
+                symbol
+                for symbol in previous.keys() | holdings.keys()
+                if self._quantity(previous, symbol) != self._quantity(holdings, symbol)
+            ]
+            self._holdings = {
+                symbol: holding for symbol, holding in self._holdings.items() if holding.currency != currency
+            } | holdings
+            previous_orders = {order_id for order_id, order in self._orders.items() if order.currency == currency}
+            self._done |= previous_orders - orders.keys()  # 미체결에 없으면 완료된 주문
+            self._orders = {
+                order_id: order for order_id, order in self._orders.items() if order.currency != currency
+            } | orders
+            self._locked_cash[currency] = locked_cash
+            self._cash[currency] = Decimal(summary.buyable_balance) + locked_cash
+            self._reconciled_at = time.monotonic()
+        return sorted(drifted)
+
+    def reconcile_due(self) -> bool:
+        """마지막으로 맞춘 뒤 reconcile_interval이 지났는지"""
+        return time.monotonic() - self._reconciled_at >= self._reconcile_interval
+
+    def _fill(self, state: _OrderState, quantity: Decimal, amount: Decimal) -> None:
+        if not quantity:
+            return
+        state.filled_quantity += quantity
+        state.filled_amount += amount
+        holding = self._holdings.get(state.symbol)
+        if holding is None:
+            holding = self._holdings[state.symbol] = Holding(
+                symbol=state.symbol, currency=state.currency, quantity=ZERO, cost=ZERO
+            )
+        if state.is_buy:
+            holding.quantity += quantity
+            holding.cost += amount
+            self._cash[state.currency] -= amount
+        else:
+            holding.cost -= holding.average_price * min(quantity, holding.quantity)
+            holding.quantity -= quantity
+            self._cash[state.currency] += amount
+        if holding.quantity <= ZERO and not holding.locked_quantity:
+            del self._holdings[state.symbol]
+
+    def _lock_remaining(self, state: _OrderState, remaining_quantity: Decimal) -> None:
+        if state.is_buy:
+            self._locked_cash[state.currency] += (remaining_quantity - state.remaining_quantity) * state.price
+        elif (holding := self._holdings.get(state.symbol)) is not None:
+            holding.locked_quantity = max(holding.locked_quantity + remaining_quantity - state.remaining_quantity, ZERO)
+        state.remaining_quantity = remaining_quantity
+
+    def _ledger_currency(self, currency: str | None) -> str:
+        if currency is not None:
+            return currency
+        currencies = self._cash.keys() | self._locked_cash.keys()
+        if len(currencies) != 1:
+            raise ValueError(f"통화를 지정해야 합니다: {sorted(currencies)}")
+        return next(iter(currencies))
+
+    def _symbol_currency(self, symbol: str) -> str:
+        """장부에 없는 주문의 통화 (보유종목 > currency_of > 장부의 유일한 통화 순)"""
+        holding = self._holdings.get(symbol)
+        if holding is not None:
+            return holding.currency
+        if self._currency_of is not None:
+            return self._currency_of(symbol)
+        currencies = self._cash.keys() | self._locked_cash.keys()
+        if len(currencies) != 1:
+            raise ValueError(f"종목의 통화를 알 수 없습니다 (currency_of 필요): {symbol}")
+        return next(iter(currencies))
+
+    @staticmethod
+    def _quantity(holdings: dict[str, Holding], symbol: str) -> Decimal:
+        holding = holdings.get(symbol)
+        return holding.quantity if holding is not None else ZERO
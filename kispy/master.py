@@ -0,0 +1,370 @@
+"""종목 마스터
+- 파싱한 종목 마스터를 로컬 디스크에 저장하여 프로세스 시작 시 다운로드를 생략
+- ETag/Last-Modified 조건부 요청으로 변경된 경우에만 다시 다운로드
+- 거래소별 종목 마스터를 필요할 때만 불러오는 종목 조회
+- 여러 프로세스가 mmap으로 공유하는 종목 테이블 파일 생성
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import IO, cast
+
+from kispy.constants import (
+    DOMESTIC_EXCHANGE_CODE,
+    DOMESTIC_MARKETS,
+    DomesticMarket,
+    ExchangeCode,
+    Nation,
+    NationExchangeCodeMap,
+)
+from kispy.exceptions import AmbiguousSymbol
+from kispy.models.market import Symbol
+from kispy.symbol_table import compile_symbol_table
+from kispy.utils import (
+    download_master,
+    get_domestic_master_url,
+    get_overseas_master_url,
+    get_symbols,
+    parse_domestic_symbols,
+    parse_overseas_symbols,
+)
+
+logger = logging.getLogger(__name__)
+
+MasterSource = ExchangeCode | DomesticMarket  # 종목 마스터 파일 단위 (국내주식은 시장별로 파일이 나뉨)
+
+SCHEMA_VERSION = 2  # 캐시 파일 형식 버전, Symbol 필드가 바뀌면 올려서 기존 캐시를 무시
+
+
+def _default_directory() -> str:
+    """사용자별 캐시 디렉토리 ($XDG_CACHE_HOME/kispy/master, 기본값 ~/.cache/kispy/master)"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "kispy", "master")
+
+
+# 종목코드가 숫자라 다른 국가와 겹칠 수 있는 거래소 (국내 6자리, 중국 6자리, 홍콩 5자리, 일본 4자리)
+_NUMERIC_CODE_EXCHANGES: set[ExchangeCode] = {DOMESTIC_EXCHANGE_CODE, "SHS", "SZS", "SHI", "SZI", "HKS", "TSE"}
+
+
+def _exchange_codes(nation: Nation | None) -> list[ExchangeCode]:
+    """국가의 거래소코드, None이면 모든 국가 (NationExchangeCodeMap 순서)"""
+    if nation is None:
+        return [exchange_code for exchange_codes in NationExchangeCodeMap.values() for exchange_code in exchange_codes]
+    return NationExchangeCodeMap.get(nation, [])
+
+
+def _master_sources(exchange_code: ExchangeCode) -> list[MasterSource]:
+    if exchange_code == DOMESTIC_EXCHANGE_CODE:
+        return list(DOMESTIC_MARKETS)
+    return [exchange_code]
+
+
+def _master_url(source: MasterSource) -> str:
+    if source in DOMESTIC_MARKETS:
+        return get_domestic_master_url(cast(DomesticMarket, source))
+    return get_overseas_master_url(cast(ExchangeCode, source))
+
+
+def _parse_master(source: MasterSource, file: IO[bytes]) -> list[Symbol]:
+    if source in DOMESTIC_MARKETS:
+        return parse_domestic_symbols(file, cast(DomesticMarket, source))
+    return parse_overseas_symbols(file, cast(ExchangeCode, source))
+
+
+class MasterCache:
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_age: timedelta = timedelta(days=1),
+        stale_while_revalidate: bool = False,
+    ):
+        """종목 마스터 디스크 캐시
+
+        Args:
+            directory (str | None): 캐시 디렉토리, 기본값은 사용자별 캐시 디렉토리 (~/.cache/kispy/master)
+            max_age (timedelta): 캐시 유효기간, 지나면 조건부 요청으로 갱신 여부를 확인
+            stale_while_revalidate (bool): 유효기간이 지난 캐시를 즉시 반환하고 백그라운드에서 갱신
+
+        Note:
+            - 캐시 파일은 임시 파일에 기록한 뒤 교체하므로, 다른 프로세스가 읽는 중에도 깨진 파일을 읽지 않습니다.
+            - 종목은 JSON으로 저장하고, 캐시 형식 버전(SCHEMA_VERSION)이 다르면 다시 다운로드합니다.
+        """
+        self._directory = directory or _default_directory()
+        self._max_age = max_age
+        self._stale_while_revalidate = stale_while_revalidate
+        self._lock = threading.Lock()
+        self._refreshing: dict[MasterSource, threading.Thread] = {}
+        os.makedirs(self._directory, mode=0o700, exist_ok=True)
+
+    def load_symbol_map(self, nation: Nation) -> dict[str, Symbol]:
+        exchange_codes = NationExchangeCodeMap[nation]
+        with ThreadPoolExecutor(max_workers=len(exchange_codes)) as executor:
+            shards = list(executor.map(self.load, exchange_codes))
+
+        symbol_map: dict[str, Symbol] = {}
+        for symbols in shards:
+            symbol_map.update({symbol.symbol: symbol for symbol in symbols})
+        return symbol_map
+
+    def build_symbol_table(self, nation: Nation | None, path: str | None = None) -> str:
+        """국가의 모든 거래소 종목으로 여러 프로세스가 공유할 종목 테이블 파일을 생성
+
+        Args:
+            nation (Nation | None): 국가, None이면 국내주식을 포함한 모든 국가
+            path (str | None): 종목 테이블 파일 경로, 기본값은 캐시 디렉토리의 {nation}.symtab (모든 국가는 ALL.symtab)
+
+        Returns:
+            str: 종목 테이블 파일 경로 (SymbolTable로 열기)
+        """
+        exchange_codes = _exchange_codes(nation)
+        with ThreadPoolExecutor(max_workers=len(exchange_codes)) as executor:
+            shards = list(executor.map(self.load, exchange_codes))
+
+        path = path or os.path.join(self._directory, f"{nation or 'ALL'}.symtab")
+        compile_symbol_table(path, (symbol for symbols in shards for symbol in symbols))
+        return path
+
+    def load(self, exchange_code: ExchangeCode) -> list[Symbol]:
+        """거래소 종목 마스터 조회 (캐시가 유효하면 다운로드하지 않음)"""
+        return [symbol for source in _master_sources(exchange_code) for symbol in self._load(source)]
+
+    def refresh(self, exchange_code: ExchangeCode, force: bool = False) -> list[Symbol]:
+        """조건부 요청으로 종목 마스터를 갱신
+
+        Args:
+            exchange_code (ExchangeCode): 거래소코드
+            force (bool): 캐시 상태와 관계없이 다시 다운로드
+
+        Returns:
+            list[Symbol]: 종목 목록
+        """
+        return [symbol for source in _master_sources(exchange_code) for symbol in self._refresh(source, force)]
+
+    def _load(self, source: MasterSource) -> list[Symbol]:
+        meta = self._read_meta(source)
+        symbols = self._read_symbols(source) if meta else None
+        if meta is None or symbols is None:
+            return self._refresh(source)
+
+        fetched_at = datetime.fromisoformat(meta["fetched_at"])
+        if datetime.now() - fetched_at < self._max_age:
+            return symbols
+
+        if self._stale_while_revalidate:
+            self._refresh_in_background(source)
+            return symbols
+        return self._refresh(source)
+
+    def _refresh(self, source: MasterSource, force: bool = False) -> list[Symbol]:
+        meta = None if force else self._read_meta(source)
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        resp, file = download_master(_master_url(source), headers=headers)
+        with file:
+            if resp.status_code == 304 and meta:
+                symbols = self._read_symbols(source)
+                if symbols is not None:
+                    logger.debug(f"master not modified: {source}")
+                    self._write_meta(source, {**meta, "fetched_at": datetime.now().isoformat()})
+                    return symbols
+                return self._refresh(source, force=True)
+            resp.raise_for_status()
+            symbols = _parse_master(source, file)
+
+        self._write(self._symbols_path(source), json.dumps([asdict(symbol) for symbol in symbols]).encode("utf-8"))
+        self._write_meta(
+            source,
+            {
+                "version": SCHEMA_VERSION,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "fetched_at": datetime.now().isoformat(),
+            },
+        )
+        logger.debug(f"master downloaded: {source} ({len(symbols)} symbols)")
+        return symbols
+
+    def _refresh_in_background(self, source: MasterSource) -> None:
+        with self._lock:
+            thread = self._refreshing.get(source)
+            if thread and thread.is_alive():
+                return
+
+            def target() -> None:
+                try:
+                    self._refresh(source)
+                except Exception:
+                    logger.exception(f"failed to refresh master: {source}")
+
+            thread = threading.Thread(target=target, name=f"kispy-master-{source}", daemon=True)
+            self._refreshing[source] = thread
+            thread.start()
+
+    def wait(self) -> None:
+        """백그라운드 갱신이 끝날 때까지 대기"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join()
+
+    def _symbols_path(self, source: MasterSource) -> str:
+        return os.path.join(self._directory, f"{source}.symbols.json")
+
+    def _meta_path(self, source: MasterSource) -> str:
+        return os.path.join(self._directory, f"{source}.json")
+
+    def _read_symbols(self, source: MasterSource) -> list[Symbol] | None:
+        try:
+            with open(self._symbols_path(source), encoding="utf-8") as f:
+                return [Symbol(**item) for item in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _read_meta(self, source: MasterSource) -> dict | None:
+        """캐시 메타 정보, 없거나 캐시 형식 버전이 다르면 None"""
+        try:
+            with open(self._meta_path(source), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or meta.get("version") != SCHEMA_VERSION:
+            return None
+        return meta
+
+    def _write_meta(self, source: MasterSource, meta: dict) -> None:
+        self._write(self._meta_path(source), json.dumps(meta).encode("utf-8"))
+
+    def _write(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class SymbolRegistry:
+    def __init__(
+        self,
+        nation: Nation | None,
+        loader: Callable[[ExchangeCode], list[Symbol]] | None = None,
+        priority: list[ExchangeCode] | None = None,
+    ):
+        """거래소별 종목 마스터를 필요할 때만 불러오는 종목 조회기
+
+        Args:
+            nation (Nation | None): 국가, None이면 국내주식을 포함한 모든 국가
+            loader (Callable | None): 거래소 종목 마스터를 불러오는 함수, 기본값은 매번 다운로드
+            priority (list[ExchangeCode] | None): 종목 조회 시 확인할 거래소 순서, 기본값은 NationExchangeCodeMap 순서
+
+        Note:
+            - 종목을 찾을 때까지 priority 순서대로 거래소를 불러오므로,
+              나스닥 종목만 조회하면 나스닥 마스터만 다운로드합니다.
+              다음 거래소에서도 찾지 못하면 나머지 거래소는 동시에 불러옵니다.
+            - 같은 종목코드가 같은 국가의 여러 거래소에 있으면 priority가 앞선 거래소의 종목을 반환합니다.
+            - 숫자 종목코드가 다른 국가의 거래소에도 있으면(국내주식과 중국주식의 6자리 코드 등)
+              AmbiguousSymbol을 발생시키므로 거래소코드를 지정해 조회합니다.
+        """
+        self.nation = nation
+        self._loader = loader or get_symbols
+        self._priority = priority or _exchange_codes(nation)
+        self._shards: dict[ExchangeCode, dict[str, Symbol]] = {}
+        self._locks = {exchange_code: threading.Lock() for exchange_code in self._priority}
+        self._nations = {
+            exchange_code: nation
+            for nation, exchange_codes in NationExchangeCodeMap.items()
+            for exchange_code in exchange_codes
+        }
+
+    def get(self, symbol: str, exchange_code: ExchangeCode | None = None) -> Symbol | None:
+        """종목 조회
+
+        Args:
+            symbol (str): 종목코드
+            exchange_code (ExchangeCode | None): 거래소코드, 지정하면 해당 거래소만 조회
+
+        Returns:
+            Symbol | None: 종목, 없으면 None
+
+        Raises:
+            AmbiguousSymbol: exchange_code 없이 조회한 숫자 종목코드가 여러 국가의 거래소에 있는 경우
+        """
+        if exchange_code:
+            return self.shard(exchange_code).get(symbol)
+
+        market_symbol = self._find(symbol)
+        if market_symbol is not None and symbol.isdigit():
+            # 숫자 종목코드는 국가마다 겹칠 수 있으므로 다른 국가의 숫자 코드 거래소도 확인
+            nation = self._nations.get(market_symbol.exchange_code)
+            others = [
+                code for code in self._priority if code in _NUMERIC_CODE_EXCHANGES and self._nations.get(code) != nation
+            ]
+            self._load(others)
+            duplicates = [code for code in others if symbol in self._shards[code]]
+            if duplicates:
+                exchange_codes = ", ".join([market_symbol.exchange_code, *duplicates])
+                raise AmbiguousSymbol(f"{symbol} is listed on {exchange_codes}, specify exchange_code")
+        return market_symbol
+
+    def _find(self, symbol: str) -> Symbol | None:
+        """priority 순서로 종목 조회 (처음 불러오는 거래소에서도 없으면 나머지 거래소는 동시에 불러옴)"""
+        loaded_one = False
+        for index, code in enumerate(self._priority):
+            if code not in self._shards:
+                if loaded_one:
+                    self._load(self._priority[index:])
+                loaded_one = True
+            market_symbol = self.shard(code).get(symbol)
+            if market_symbol:
+                return market_symbol
+        return None
+
+    def _load(self, exchange_codes: list[ExchangeCode]) -> None:
+        pending = [code for code in exchange_codes if code not in self._shards]
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                list(executor.map(self.shard, pending))
+        elif pending:
+            self.shard(pending[0])
+
+    def shard(self, exchange_code: ExchangeCode) -> dict[str, Symbol]:
+        """거래소 종목 마스터 (처음 접근할 때 불러옴)"""
+        shard = self._shards.get(exchange_code)
+        if shard is not None:
+            return shard
+
+        with self._locks.setdefault(exchange_code, threading.Lock()):
+            if exchange_code not in self._shards:
+                self._shards[exchange_code] = {symbol.symbol: symbol for symbol in self._loader(exchange_code)}
+            return self._shards[exchange_code]
+
+    def load_all(self) -> None:
+        """모든 거래소 종목 마스터를 동시에 불러옴"""
+        self._load(self._priority)
+
+    def clear(self) -> None:
+        self._shards.clear()
+
+    def __iter__(self) -> Iterator[Symbol]:
+        """모든 거래소 종목 (priority 순서)"""
+        self.load_all()
+        for exchange_code in self._priority:
+            yield from self._shards[exchange_code].values()
+
+    def __getitem__(self, symbol: str) -> Symbol:
+        market_symbol = self.get(symbol)
+        if market_symbol is None:
+            raise KeyError(symbol)
+        return market_symbol
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and self._find(symbol) is not None
@@ -24,16 +24,30 @@ class Balance(CustomBaseModel):
             currency=response["tr_crcy_cd"],
         )
 
+    @classmethod
+    def from_domestic_response(cls, response: dict[str, Any]) -> Self:
+        """국내주식 매수가능조회 응답 (원화)"""
+        return cls(
+            available_balance=response["ord_psbl_cash"],
+            buyable_balance=response["nrcvb_buy_amt"],
+            buyable_integrated_balance=response["max_buy_amt"],
+            exchange_rate="1",
+            currency="KRW",
+        )
+
 
 class Position(CustomBaseModel):
     symbol: str  # 종목코드
     item_name: str  # 종목명
-    quantity: str  # 보유수량
+    quantity: str  # 주문가능수량 (잔고수량 - 미체결 매도수량)
+    balance_quantity: str  # 잔고수량 (미체결 매도수량 포함)
     average_price: str  # 평균단가
     unrealized_pnl: str  # 외화평가손익금액
     pnl_percentage: str  # 평가손익율(%)
     current_price: str  # 현재가격
     market_value: str  # 평가금액
+    exchange_code: str = ""  # 해외거래소코드 (NASD, NYSE, ...)
+    currency: Currency | None = None  # 통화 (거래소별 조회에서 채움)
 
     @classmethod
     def from_response(cls, response: dict[str, Any]) -> Self:
@@ -42,11 +56,14 @@ class Position(CustomBaseModel):
             symbol=response["ovrs_pdno"],
             item_name=response["ovrs_item_name"],
             quantity=response["ord_psbl_qty"],
+            balance_quantity=response["ovrs_cblc_qty"],
             average_price=response["pchs_avg_pric"],
             unrealized_pnl=response["frcr_evlu_pfls_amt"],
             pnl_percentage=response["evlu_pfls_rt"],
             current_price=response["now_pric2"],
             market_value=response["ovrs_stck_evlu_amt"],
+            exchange_code=response.get("ovrs_excg_cd", ""),
+            currency=response.get("tr_crcy_cd") or None,
         )
 
 
@@ -61,6 +78,8 @@ class PendingOrder(CustomBaseModel):
     average_price: str  # 체결가격
     order_amount: str  # 체결금액
     locked_amount: str  # 주문중금액
+    exchange_code: str = ""  # 해외거래소코드 (NASD, NYSE, ...)
+    currency: Currency | None = None  # 통화 (거래소별 조회에서 채움)
 
     @classmethod
     def from_response(cls, response: dict[str, Any]) -> Self:
@@ -78,6 +97,7 @@ class PendingOrder(CustomBaseModel):
             remaining_quantity=remaining_quantity,
             order_amount=response["ft_ccld_amt3"],
             locked_amount=str(locked_amount),
+            exchange_code=response.get("ovrs_excg_cd", ""),
         )
 
 
@@ -95,11 +115,29 @@ class AccountSummary:
     total_pnl_percentage: str  # 총 평가손익율(%)
     positions: list[Position]
     pending_orders: list[PendingOrder]
+    snapshot_at: datetime | None = None  # 조회 시각 (잔고/보유종목/미체결을 동시에 요청한 시각)
 
     @classmethod
-    def create(cls, balance: Balance, positions: list[Position], pending_orders: list[PendingOrder]) -> Self:
+    def create(
+        cls,
+        balance: Balance,
+        positions: list[Position],
+        pending_orders: list[PendingOrder],
+        snapshot_at: datetime | None = None,
+    ) -> Self:
+        """한 통화의 잔고/보유종목/미체결로 총 자산 정보를 만듦
+
+        Raises:
+            ValueError: 잔고와 통화가 다른 보유종목/미체결 주문이 있는 경우 (통화별로 나눠 만들어야 함)
+        """
+        currencies = {position.currency for position in positions} | {order.currency for order in pending_orders}
+        if currencies - {balance.currency, None}:
+            raise ValueError(f"잔고({balance.currency})와 통화가 다른 보유종목/미체결 주문이 있습니다: {currencies}")
+
         total_position_market_value = sum(Decimal(position.market_value) for position in positions)
-        total_position_price = sum(Decimal(position.average_price) * Decimal(position.quantity) for position in positions)
+        total_position_price = sum(
+            Decimal(position.average_price) * Decimal(position.balance_quantity) for position in positions
+        )
         total_locked_balance = sum(Decimal(order.locked_amount) for order in pending_orders)
         total_balance = Decimal(balance.buyable_balance) + total_position_market_value + total_locked_balance
         total_integrated_balance = (
@@ -124,6 +162,7 @@ class AccountSummary:
             total_pnl_percentage=f"{total_pnl_percentage:.2f}",
             positions=positions,
             pending_orders=pending_orders,
+            snapshot_at=snapshot_at,
         )
 
 
@@ -143,6 +182,9 @@ class Order(CustomBaseModel):
     @classmethod
     def from_response(cls, response: dict[str, Any]) -> Self:
         order_date = datetime.strptime(response["ord_dt"] + response["ord_tmd"], "%Y%m%d%H%M%S")
+        if "ft_ord_qty" not in response:  # 국내주식 주식일별주문체결조회
+            return cls._from_domestic_response(response, order_date)
+
         process_status = response["prcs_stat_name"]
         reject_reason = response["rjct_rson_name"]
         revise_cancel_status = response["rvse_cncl_dvsn_name"]
@@ -172,3 +214,31 @@ class Order(CustomBaseModel):
             reject_reason=reject_reason,
             order_date=order_date,
         )
+
+    @classmethod
+    def _from_domestic_response(cls, response: dict[str, Any], order_date: datetime) -> Self:
+        requested_quantity = int(response["ord_qty"])
+        filled_quantity = int(response["tot_ccld_qty"])
+        status: OrderStatus = "open"
+        if int(response.get("rjct_qty") or 0):
+            status = "rejected"
+        elif response.get("cncl_yn") == "Y":
+            status = "canceled"
+        elif filled_quantity >= requested_quantity:
+            status = "closed"
+        elif order_date.date() < datetime.now().date():
+            status = "expired"  # 국내주식 주문은 당일에만 유효
+
+        return cls(
+            order_id=response["odno"],
+            symbol=response["pdno"],
+            side="sell" if response["sll_buy_dvsn_cd"] == "01" else "buy",
+            status=status,
+            requested_price=response["ord_unpr"],
+            requested_quantity=response["ord_qty"],
+            filled_quantity=response["tot_ccld_qty"],
+            average_price=response["avg_prvs"],
+            filled_amount=response["tot_ccld_amt"],
+            reject_reason="",
+            order_date=order_date,
+        )
@@ -6,11 +6,17 @@ from kispy.constants import ExchangeCode
 from kispy.models.base import CustomBaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     symbol: str
     exchange_code: ExchangeCode
     realtime_symbol: str
+    currency: str = ""
+    float_position: int = 0  # 가격 소수점 자리수
+    tick_size_type: str = ""
+    korean_name: str = ""
+    english_name: str = ""
+    market: str = ""  # 국내주식 시장구분 (KOSPI, KOSDAQ)
 
 
 class OHLCV(CustomBaseModel):
@@ -23,6 +29,29 @@ class OHLCV(CustomBaseModel):
 
     @classmethod
     def from_response(cls, response: dict[str, Any]) -> Self:
+        if "stck_cntg_hour" in response:  # 국내주식 분봉
+            date = response["stck_cntg_hour"]
+            if not isinstance(date, datetime):
+                date = datetime.strptime(response["stck_bsop_date"] + date, "%Y%m%d%H%M%S")
+            return cls(
+                date=date,
+                open=response["stck_oprc"],
+                high=response["stck_hgpr"],
+                low=response["stck_lwpr"],
+                close=response["stck_prpr"],
+                volume=response["cntg_vol"],
+            )
+
+        if "stck_bsop_date" in response:  # 국내주식 기간별 시세
+            return cls(
+                date=datetime.strptime(response["stck_bsop_date"], "%Y%m%d"),
+                open=response["stck_oprc"],
+                high=response["stck_hgpr"],
+                low=response["stck_lwpr"],
+                close=response["stck_clpr"],
+                volume=response["acml_vol"],
+            )
+
         if "xhms" in response:
             date = datetime.strptime(response["xymd"] + response["xhms"], "%Y%m%d%H%M%S")
             volume = response["evol"]
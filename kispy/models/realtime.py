@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from kispy.constants import OrderSide, Period
+from kispy.models.market import OHLCV
+
+
+@dataclass(slots=True)
+class Trade:
+    tr_id: str
+    symbol: str  # 종목코드
+    time: datetime  # 체결시각 (거래소 현지시각)
+    price: str  # 체결가
+    volume: str  # 체결량
+    accumulated_volume: str  # 누적거래량
+    open: str  # 시가
+    high: str  # 고가
+    low: str  # 저가
+
+
+@dataclass(slots=True)
+class OrderBook:
+    tr_id: str
+    symbol: str  # 종목코드
+    time: datetime  # 호가시각 (거래소 현지시각)
+    asks: list[tuple[str, str]]  # 매도호가 (가격, 잔량), 1호가부터
+    bids: list[tuple[str, str]]  # 매수호가 (가격, 잔량), 1호가부터
+
+
+@dataclass(slots=True)
+class SubscriptionResult:
+    tr_id: str
+    tr_key: str
+    success: bool
+    message: str  # 응답 메시지 (예: "SUBSCRIBE SUCCESS")
+    key: str | None = field(default=None, repr=False)  # 암호화된 실시간 데이터 복호화 키 (체결통보)
+    iv: str | None = field(default=None, repr=False)
+
+
+@dataclass(slots=True)
+class FillNotice:
+    tr_id: str
+    account_no: str  # 계좌번호
+    order_id: str  # 주문번호
+    original_order_id: str  # 원주문번호 (정정/취소 주문)
+    symbol: str  # 종목코드
+    side: OrderSide  # 매도매수구분
+    revise_cancel: str  # 정정구분 (0: 정상, 1: 정정, 2: 취소)
+    is_fill: bool  # 체결여부 (False면 접수/정정/취소/거부 통보)
+    is_rejected: bool  # 거부여부
+    quantity: str  # 체결수량 (이번 체결분)
+    price: str  # 체결단가 (접수 통보는 주문단가)
+    order_quantity: str  # 주문수량
+    order_price: str  # 주문가격
+    time: datetime  # 통보시각
+
+
+RealtimeEvent = Trade | OrderBook | FillNotice | SubscriptionResult
+
+
+@dataclass(slots=True)
+class BarClose:
+    symbol: str  # 종목코드
+    period: Period
+    bar: OHLCV  # 완성된 봉 (date는 봉 시작 시각)
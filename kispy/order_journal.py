@@ -0,0 +1,139 @@
+"""로컬 주문 일지
+- kispy로 주문/정정/취소할 때와 주문체결내역을 동기화할 때 주문을 sqlite3 파일에 기록
+- 주문번호로 바로 조회 (주문체결내역 API는 주문번호로 검색할 수 없어 기간 전체를 넘겨봐야 함)
+- 동기화 위치(마지막으로 본 주문일자 등)를 함께 저장해 다음 동기화를 이어서 시작
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+
+from kispy.models.account import Order
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    order_id TEXT PRIMARY KEY,
+    original_order_id TEXT NOT NULL DEFAULT '',
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    status TEXT NOT NULL,
+    requested_price TEXT NOT NULL,
+    requested_quantity TEXT NOT NULL,
+    filled_quantity TEXT NOT NULL,
+    average_price TEXT NOT NULL,
+    filled_amount TEXT NOT NULL,
+    reject_reason TEXT NOT NULL,
+    order_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_status ON orders (status, order_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "order_id",
+    "symbol",
+    "side",
+    "status",
+    "requested_price",
+    "requested_quantity",
+    "filled_quantity",
+    "average_price",
+    "filled_amount",
+    "reject_reason",
+    "order_date",
+)
+
+
+class OrderJournal:
+    """주문번호로 색인한 주문 일지 (sqlite3)
+
+    Example:
+        >>> journal = OrderJournal("orders.db")
+        >>> kis = KisClientV2(auth, journal=journal)
+        >>> order_id = kis.create_order("AAPL", "buy", "180", 1)
+        >>> journal.get(order_id).status
+        'open'
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): sqlite3 파일 경로 (":memory:"이면 메모리에만 기록)
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def record(self, orders: Order | list[Order], original_order_id: str = "") -> None:
+        """주문 기록 (같은 주문번호는 최신 상태로 덮어씀)
+
+        Args:
+            orders (Order | list[Order]): 기록할 주문
+            original_order_id (str): 원주문번호 (정정/취소 주문)
+        """
+        rows = [
+            (*(self._value(order, column) for column in _COLUMNS), original_order_id)
+            for order in (orders if isinstance(orders, list) else [orders])
+        ]
+        placeholders = ", ".join("?" * (len(_COLUMNS) + 1))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO orders ({', '.join(_COLUMNS)}, original_order_id) VALUES ({placeholders}) "
+                f"ON CONFLICT (order_id) DO UPDATE SET {updates}",
+                rows,
+            )
+
+    def get(self, order_id: str) -> Order | None:
+        """주문번호로 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM orders WHERE order_id = ?", (order_id,)
+            ).fetchone()
+        return self._order(row) if row else None
+
+    def original_order_id(self, order_id: str) -> str:
+        """정정/취소 주문의 원주문번호 (없으면 빈 문자열)"""
+        with self._lock:
+            row = self._conn.execute("SELECT original_order_id FROM orders WHERE order_id = ?", (order_id,)).fetchone()
+        return row[0] if row else ""
+
+    def open_orders(self) -> list[Order]:
+        """미완료(open) 주문, 주문일시 순"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM orders WHERE status = 'open' ORDER BY order_date"
+            ).fetchall()
+        return [self._order(row) for row in rows]
+
+    def get_state(self, name: str) -> str | None:
+        """동기화 위치 등 저장한 값"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sync_state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, name: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (name, value) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                (name, value),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _value(order: Order, column: str) -> str:
+        value = getattr(order, column)
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    @staticmethod
+    def _order(row: tuple) -> Order:
+        values = dict(zip(_COLUMNS, row, strict=True))
+        values["order_date"] = datetime.fromisoformat(values["order_date"])
+        return Order(**values)
@@ -0,0 +1,153 @@
+"""주문체결내역 증분 동기화
+- 마지막으로 본 주문(주문일시, 주문번호)을 기준점으로 저장하고, 최근 주문부터 조회하다 기준점에 닿으면 중단
+- 기준점보다 오래된 미완료 주문은 가장 오래된 주문일자부터(최대 rescan_days일 전부터) 다시 조회하고, 모두 찾으면 중단
+- 다시 조회해도 찾지 못한 미완료 주문은 하루가 지나면 만료(expired)로 기록해 다음 동기화부터 조회하지 않음
+- 새 주문과 상태가 바뀐 주문만 변경 목록으로 반환하고 주문 일지에 기록
+  (접수할 때 기록한 주문은 주문일시/가격 표기가 달라도 상태/체결이 같으면 변경으로 보지 않고 조회한 값으로 덮어씀)
+"""
+
+import logging
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Literal
+
+from kispy.constants import DOMESTIC_TIME_ZONE
+from kispy.models.account import Order
+from kispy.order_journal import OrderJournal
+from kispy.overseas_stock.order import OrderAPI
+
+logger = logging.getLogger(__name__)
+
+HIGH_WATER_STATE = "orders.high_water"  # 주문 일지에 저장하는 기준점 이름
+EXPIRE_AFTER = timedelta(days=1)  # 주문체결내역에서 찾지 못한 미완료 주문을 만료로 기록하기까지의 시간
+NOT_FOUND_REASON = "주문체결내역에 없음"
+
+OrderChangeKind = Literal["added", "updated"]
+
+
+@dataclass(slots=True)
+class OrderChange:
+    kind: OrderChangeKind  # added: 일지에 없던 주문, updated: 상태/체결이 바뀐 주문
+    order: Order
+
+
+def _sort_key(order: Order) -> tuple[str, str]:
+    return order.order_date.strftime("%Y%m%d%H%M%S"), order.order_id
+
+
+def _same_state(previous: Order, order: Order) -> bool:
+    """상태와 체결수량/체결금액이 같은지 (주문일시, 주문가격/수량의 표기 차이는 비교하지 않음)"""
+    return (
+        previous.status == order.status
+        and previous.reject_reason == order.reject_reason
+        and all(
+            Decimal(getattr(previous, field) or 0) == Decimal(getattr(order, field) or 0)
+            for field in ("filled_quantity", "filled_amount")
+        )
+    )
+
+
+class OrderSync:
+    def __init__(self, order_api: OrderAPI, journal: OrderJournal, lookback_days: int = 30, rescan_days: int = 7):
+        """주문체결내역을 주문 일지에 증분 동기화
+
+        Args:
+            order_api (OrderAPI): 해외주식 주문 API
+            journal (OrderJournal): 동기화한 주문과 기준점을 기록할 주문 일지
+            lookback_days (int): 기준점이 없을 때(처음 동기화) 조회할 기간(일)
+            rescan_days (int): 미완료 주문을 다시 조회할 최대 기간(일), 이보다 오래된 미완료 주문은 찾지 못하면 만료
+
+        Example:
+            >>> sync = OrderSync(kis.client.overseas_stock.order, journal)
+            >>> for change in sync.watch(interval=5):
+            ...     print(change.kind, change.order.order_id, change.order.status)
+        """
+        self._order_api = order_api
+        self._journal = journal
+        self._lookback_days = lookback_days
+        self._rescan_days = rescan_days
+        self._lock = threading.Lock()
+
+    def high_water(self) -> tuple[str, str] | None:
+        """기준점 (주문일시 YYYYMMDDHHMMSS, 주문번호), 동기화한 적이 없으면 None"""
+        value = self._journal.get_state(HIGH_WATER_STATE)
+        if value is None:
+            return None
+        timestamp, order_id = value.split("|")
+        return timestamp, order_id
+
+    def sync(self) -> list[OrderChange]:
+        """기준점 이후의 주문과 미완료 주문의 변경 사항을 조회해 기록
+
+        Returns:
+            list[OrderChange]: 새 주문과 바뀐 주문 (주문일시 순)
+        """
+        with self._lock:
+            now = datetime.now(DOMESTIC_TIME_ZONE).replace(tzinfo=None)  # 주문체결내역의 주문일시는 한국 시각
+            today = now.strftime("%Y%m%d")
+            mark = self.high_water()
+            start_date = mark[0][:8] if mark else (now - timedelta(days=self._lookback_days)).strftime("%Y%m%d")
+
+            # 최근 주문부터 기준점까지
+            fetched: dict[str, Order] = {}
+            for item in self._order_api.iter_orders(start_date, today, desc=True):
+                order = Order.from_response(item)
+                if mark is not None and _sort_key(order) <= mark:
+                    break
+                fetched[order.order_id] = order
+
+            # 기준점보다 오래된 미완료 주문은 가장 오래된 주문일자부터 다시 조회
+            # (접수 시각과 주문일자가 자정 전후로 엇갈릴 수 있어 하루 앞당겨 조회, 최대 rescan_days일 전부터)
+            pending = {order.order_id: order for order in self._journal.open_orders() if order.order_id not in fetched}
+            expired: dict[str, Order] = {}
+            if pending:
+                oldest = min(order.order_date for order in pending.values()) - timedelta(days=1)
+                oldest = max(oldest, now - timedelta(days=self._rescan_days))
+                for item in self._order_api.iter_orders(oldest.strftime("%Y%m%d"), today, desc=False):
+                    order = Order.from_response(item)
+                    fetched[order.order_id] = order
+                    pending.pop(order.order_id, None)
+                    if not pending:
+                        break
+                # 조회 기간을 모두 봐도 없는 주문은 만료로 기록 (방금 접수한 주문은 다음 동기화에서 다시 찾음)
+                for order in pending.values():
+                    if now - order.order_date >= EXPIRE_AFTER:
+                        expired[order.order_id] = order.model_copy(
+                            update={"status": "expired", "reject_reason": NOT_FOUND_REASON}
+                        )
+                if expired:
+                    logger.debug("주문체결내역에서 찾지 못해 만료로 기록한 주문: %s", list(expired))
+
+            changes = []
+            records = []
+            for order in sorted([*fetched.values(), *expired.values()], key=_sort_key):
+                previous = self._journal.get(order.order_id)
+                if previous is None:
+                    changes.append(OrderChange("added", order))
+                elif not _same_state(previous, order):
+                    changes.append(OrderChange("updated", order))
+                elif previous == order:
+                    continue
+                records.append(order)
+            self._journal.record(records)
+
+            if fetched:
+                latest = max(_sort_key(order) for order in fetched.values())
+                if mark is None or latest > mark:
+                    self._journal.set_state(HIGH_WATER_STATE, "|".join(latest))
+            return changes
+
+    def watch(self, interval: float = 5.0, stop: threading.Event | None = None) -> Iterator[OrderChange]:
+        """interval(초)마다 동기화해 변경 사항을 반복
+
+        Args:
+            interval (float): 동기화 주기(초)
+            stop (threading.Event | None): 설정하면 반복을 끝냄
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            yield from self.sync()
+            stop.wait(interval)
@@ -18,15 +18,16 @@ from kispy.exceptions import InvalidAccount
 
 
 class AccountAPI(BaseAPI):
-    def inquire_nccs(self, exchange_code: LongExchangeCode, desc: bool = False) -> dict:
+    def inquire_nccs(self, exchange_code: LongExchangeCode, desc: bool = False, limit: int | None = None) -> list[dict]:
         """해외주식 미체결내역[v1_해외주식-005]
 
         Args:
             exchange_code (LongExchangeCode): 거래소코드
             desc (bool): 시간 역순 정렬 여부, 기본값은 False
+            limit (int | None): 최대 조회 건수, None이면 연속조회로 전체
 
         Returns:
-            dict: 미체결내역
+            list[dict]: 미체결내역
 
         접수된 해외주식 주문 중 체결되지 않은 미체결 내역을 조회하는 API입니다.
         실전계좌의 경우, 한 번의 호출에 최대 40건까지 확인 가능하며, 이후의 값은 연속조회를 통해 확인하실 수 있습니다.
@@ -47,7 +48,6 @@ class AccountAPI(BaseAPI):
         tr_id = "TTTS3018R" if self._auth.is_real else "VTTS3018R"
         headers["tr_id"] = tr_id
 
-        # TODO: 40개 이상 조회 지원
         params = {
             "CANO": self._auth.cano,
             "ACNT_PRDT_CD": self._auth.acnt_prdt_cd,
@@ -57,8 +57,7 @@ class AccountAPI(BaseAPI):
             "CTX_AREA_NK200": "",
         }
 
-        resp = self._request(method="get", url=url, headers=headers, params=params)
-        return resp.json["output"]  # type: ignore[no-any-return]
+        return list(self._paginate("get", url, headers, params, limit=limit, prefetch=True))
 
     def inquire_balance(self, exchange_code: LongExchangeCode, currency: Currency) -> dict:
         """해외주식 잔고[v1_해외주식-006]
@@ -69,6 +68,7 @@ class AccountAPI(BaseAPI):
         (주간시간 시간대에 HTS는 주간시세로 노출, API로는 야간시세로 노출)
 
         실전계좌의 경우, 한 번의 호출에 최대 100건까지 확인 가능하며, 이후의 값은 연속조회를 통해 확인하실 수 있습니다.
+        (보유종목은 연속조회로 모두 조회합니다.)
 
         * 해외주식 서비스 신청 후 이용 가능합니다. (아래 링크 3번 해외증권 거래신청 참고)
         https://securities.koreainvestment.com/main/bond/research/_static/TF03ca010001.jsp
@@ -85,7 +85,6 @@ class AccountAPI(BaseAPI):
 
         headers = self._auth.get_header()
         headers["tr_id"] = tr_id
-        # TODO: 100개 이상 조회 지원
         params = {
             "CANO": self._auth.cano,
             "ACNT_PRDT_CD": self._auth.acnt_prdt_cd,
@@ -95,8 +94,13 @@ class AccountAPI(BaseAPI):
             "CTX_AREA_NK200": "",
         }
 
-        resp = self._request(method="get", url=url, headers=headers, params=params)
-        return resp.json
+        # 보유종목(output1)은 연속조회로 모두 모으고, 잔고 요약(output2)은 마지막 페이지 기준
+        result: dict = {}
+        positions: list[dict] = []
+        for resp in self._paginate_pages("get", url, headers, params, output_key="output1", prefetch=True):
+            positions.extend(resp.json.get("output1") or [])
+            result = resp.json
+        return {**result, "output1": positions}
 
     def inquire_order_resv_list(self, start_date: str, end_date: str, division_code: str = "01") -> dict:
         """해외주식 예약주문조회[v1_해외주식-013]"""
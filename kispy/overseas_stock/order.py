@@ -7,7 +7,7 @@
 - 해외주식 주문체결내역
 """
 
-from datetime import datetime
+from collections.abc import Iterator
 
 from kispy.base import BaseAPI
 
@@ -213,11 +213,11 @@ class OrderAPI(BaseAPI):
         resp = self._request(method="post", url=url, headers=headers, json=body)
         return resp.json["output"]  # type: ignore[no-any-return]
 
-    def inquire_outstanding_orders(self) -> dict:
+    def inquire_outstanding_orders(self, limit: int | None = None) -> dict:
         """
         해외주식 미체결내역[v1_해외주식-005]
 
-        - 한번 호출에 40개 그 이후 조회는 FK, NK를 활용한 구현 필요
+        - 한번 호출에 40개, 이후는 FK, NK 연속조회로 limit건(None이면 전체)까지 output에 모아서 반환
         """
         # TODO: 다른 거래소도 조회 가능하도록 지원
         path = "uapi/overseas-stock/v1/trading/inquire-nccs"
@@ -239,8 +239,12 @@ class OrderAPI(BaseAPI):
             "CTX_AREA_NK200": "",
         }
 
-        resp = self._request(method="get", url=url, headers=headers, params=params)
-        return resp.json
+        result: dict = {}
+        orders: list[dict] = []
+        for resp in self._paginate_pages("get", url, headers, params, limit=limit, prefetch=True):
+            orders.extend(resp.json.get("output") or [])
+            result = resp.json
+        return {**result, "output": orders[:limit]}
 
     def inquire_orders(
         self,
@@ -273,6 +277,32 @@ class OrderAPI(BaseAPI):
         3) 상해 : 10:30 ~ 16:00
         4) 홍콩 : (오전) 10:30 ~ 13:00, (오후) 14:00 ~ 17:00
         """
+        if order_id:
+            # 주문번호를 찾으면 이후 페이지는 요청하지 않음 (미리 요청하지도 않음)
+            items = self.iter_orders(start_date, end_date, desc)
+            return next(([item] for item in items if item["odno"] == order_id), [])
+        return list(self.iter_orders(start_date, end_date, desc, limit, prefetch=True))
+
+    def iter_orders(
+        self,
+        start_date: str,
+        end_date: str | None = None,
+        desc: bool = True,
+        limit: int | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict]:
+        """해외주식 주문체결내역[v1_해외주식-007]을 한 건씩 반복 (다음 페이지는 필요할 때 요청)
+
+        Args:
+            start_date (str): 조회시작일자 (YYYYMMDD)
+            end_date (str): 조회종료일자 (YYYYMMDD)
+            desc (bool): 최근 주문부터 반복
+            limit (int | None): 최대 건수
+            prefetch (bool): 처리하는 동안 다음 페이지를 미리 요청 (중간에 멈추지 않고 모두 읽는 경우에만 사용)
+
+        Yields:
+            dict: 주문 체결 내역
+        """
         path = "uapi/overseas-stock/v1/trading/inquire-ccnl"
         url = f"{self._url}/{path}"
 
@@ -284,57 +314,23 @@ class OrderAPI(BaseAPI):
         headers = self._auth.get_header()
         headers["tr_id"] = tr_id
 
-        now = datetime.now()
-        cur_end_date = datetime.strptime(end_date, "%Y%m%d") if end_date else now
-        cur_end_date = min(cur_end_date, now)
-
-        result: list[dict] = []
-        ctx_area_fk200 = ""
-        ctx_area_nk200 = ""
-        tr_content = ""
-        while True:
-            headers["tr_cont"] = tr_content
-            params = {
-                "CANO": self._auth.cano,
-                "ACNT_PRDT_CD": self._auth.acnt_prdt_cd,
-                "PDNO": "%",
-                "ORD_STRT_DT": start_date,
-                "ORD_END_DT": end_date,
-                "SLL_BUY_DVSN": "00",  # 매도매수구분: 00-전체, 01-매도, 02-매수
-                "CCLD_NCCS_DVSN": "00",  # 체결미체결구분: 00-전체, 01-체결, 02-미체결
-                "OVRS_EXCG_CD": "%",  # 거래소코드, 전종목일 경우 % 입력
-                "SORT_SQN": "AS" if desc else "DS",  # 정렬순서: DS-정순, AS-역순
-                "ORD_DT": "",
-                "ORD_GNO_BRNO": "",
-                "ODNO": "",  # 주문번호로 검색 불가능
-                "CTX_AREA_FK200": ctx_area_fk200,
-                "CTX_AREA_NK200": ctx_area_nk200,
-            }
-
-            resp = self._request(method="get", url=url, headers=headers, params=params)
-            items = resp.json["output"]
-            ctx_area_fk200 = resp.json["ctx_area_fk200"].strip()
-            ctx_area_nk200 = resp.json["ctx_area_nk200"].strip()
-            tr_content = "N"
-            if len(items) == 0:
-                break
-
-            if order_id:
-                matching_items = [item for item in items if item["odno"] == order_id]
-                if matching_items:
-                    result.extend(matching_items)
-                    break
-            else:
-                result.extend(items)
-
-            if limit and len(result) >= limit:
-                result = result[:limit]
-                break
-
-            if resp.headers["tr_cont"] in ["D", "E"]:
-                break
-
-        return result
+        params = {
+            "CANO": self._auth.cano,
+            "ACNT_PRDT_CD": self._auth.acnt_prdt_cd,
+            "PDNO": "%",
+            "ORD_STRT_DT": start_date,
+            "ORD_END_DT": end_date,
+            "SLL_BUY_DVSN": "00",  # 매도매수구분: 00-전체, 01-매도, 02-매수
+            "CCLD_NCCS_DVSN": "00",  # 체결미체결구분: 00-전체, 01-체결, 02-미체결
+            "OVRS_EXCG_CD": "%",  # 거래소코드, 전종목일 경우 % 입력
+            "SORT_SQN": "AS" if desc else "DS",  # 정렬순서: DS-정순, AS-역순
+            "ORD_DT": "",
+            "ORD_GNO_BRNO": "",
+            "ODNO": "",  # 주문번호로 검색 불가능
+            "CTX_AREA_FK200": "",
+            "CTX_AREA_NK200": "",
+        }
+        return self._paginate("get", url, headers, params, limit=limit, prefetch=prefetch)
 
 
 def _get_buy_tr_id(exchange: str, is_real: bool) -> str:
@@ -2,6 +2,7 @@
 - 기본적인 시세 정보 조회 (현재가, 호가, 체결, 일별 시세 등)
 """
 
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 
 from zoneinfo import ZoneInfo
@@ -96,6 +97,43 @@ class QuoteAPI(BaseAPI):
         Returns:
             list[dict]: 주식 기간별 시세
         """
+        result: list[dict] = []
+        for page in self.iter_stock_price_history_pages(symbol, exchange_code, start_date, end_date, period, is_adjust):
+            result.extend(page)
+            if limit and len(result) >= limit:
+                result = result[:limit]
+                break
+
+        if not desc:
+            result.reverse()
+        return result
+
+    def iter_stock_price_history_pages(
+        self,
+        symbol: str,
+        exchange_code: ExchangeCode,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        period: str = "d",
+        is_adjust: bool = True,
+    ) -> Iterator[list[dict]]:
+        """해외주식 기간별시세[v1_해외주식-010]를 한 페이지(API 호출 1회)씩 조회
+
+        Args:
+            symbol (str): 종목코드
+            exchange_code (str): 거래소코드
+            start_date (str): 조회시작일자 (YYYYMMDD)
+            end_date (str): 조회종료일자 (YYYYMMDD)
+            period (str): 조회기간, 기본값은 "d" (일) (옵션: "d" (일), "w" (주), "M" (월))
+            is_adjust (bool): 수정주가 여부, 기본값은 True
+
+        Yields:
+            list[dict]: 주식 기간별 시세 (시간 역순 정렬)
+
+        Note:
+            - 다음 페이지는 직전 페이지 마지막 일자의 전날부터 조회되므로,
+              중단된 조회는 end_date를 해당 일자로 지정하여 이어서 조회할 수 있습니다.
+        """
         period_map = {"d": "0", "w": "1", "M": "2"}
         if period not in period_map:
             raise ValueError(f"Invalid period: {period}")
@@ -112,7 +150,6 @@ class QuoteAPI(BaseAPI):
         parsed_end_date = self._parse_date(end_date, zone_info) if end_date else now
         parsed_end_date = min(parsed_end_date, now)
 
-        result: list[dict] = []
         cur_end_date = parsed_end_date
         while cur_end_date >= parsed_start_date if parsed_start_date else True:
             resp = self._request(
@@ -143,17 +180,9 @@ class QuoteAPI(BaseAPI):
             if not filtered_items:
                 break
 
-            result.extend(filtered_items)
+            yield filtered_items
             cur_end_date = self._parse_date(items[-1]["xymd"], zone_info) - timedelta(days=1)
 
-            if limit and len(result) >= limit:
-                result = result[:limit]
-                break
-
-        if not desc:
-            result.reverse()
-        return result
-
     def get_stock_price_history_by_minute(
         self,
         symbol: str,
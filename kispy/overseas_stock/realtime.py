@@ -0,0 +1,89 @@
+"""[해외주식] 실시간시세
+- 실시간 체결가/호가 TR의 필드 구성과 변환
+"""
+
+from datetime import datetime
+
+from kispy.constants import DOMESTIC_TIME_ZONE
+from kispy.models.realtime import FillNotice, OrderBook, Trade
+from kispy.utils import parse_compact_datetime
+
+TRADE_TR_ID = "HDFSCNT0"  # 해외주식 실시간지연체결가
+ORDER_BOOK_TR_ID = "HDFSASP0"  # 해외주식 실시간호가 (미국은 1호가)
+FILL_NOTICE_TR_ID = "H0GSCNI0"  # 해외주식 실시간체결통보 (실전투자, 암호화)
+VIRTUAL_FILL_NOTICE_TR_ID = "H0GSCNI9"  # 해외주식 실시간체결통보 (모의투자, 암호화)
+
+TRADE_FIELD_COUNT = 26
+ORDER_BOOK_FIELD_COUNT = 17
+FILL_NOTICE_FIELD_COUNT = 25
+
+# 해외주식 실시간지연체결가[실시간-007] 필드 위치
+TRADE_FIELDS = {
+    "symbol": 1,  # 종목코드
+    "date": 4,  # 현지일자
+    "time": 5,  # 현지시간
+    "open": 8,  # 시가
+    "high": 9,  # 고가
+    "low": 10,  # 저가
+    "price": 11,  # 현재가
+    "volume": 19,  # 체결량
+    "accumulated_volume": 20,  # 거래량
+}
+
+
+def parse_trade(fields: list[str], offset: int = 0) -> Trade:
+    """해외주식 실시간지연체결가[실시간-007] (필드 위치는 TRADE_FIELDS)"""
+    return Trade(
+        tr_id=TRADE_TR_ID,
+        symbol=fields[offset + 1],
+        time=parse_compact_datetime(fields[offset + 4], fields[offset + 5]),
+        price=fields[offset + 11],
+        volume=fields[offset + 19],
+        accumulated_volume=fields[offset + 20],
+        open=fields[offset + 8],
+        high=fields[offset + 9],
+        low=fields[offset + 10],
+    )
+
+
+def parse_order_book(fields: list[str], offset: int = 0) -> OrderBook:
+    """해외주식 실시간호가[실시간-021]
+
+    필드: 1 종목코드, 3 현지일자, 4 현지시간, 11 매수호가1, 12 매도호가1, 13 매수잔량1, 14 매도잔량1
+    """
+    return OrderBook(
+        tr_id=ORDER_BOOK_TR_ID,
+        symbol=fields[offset + 1],
+        time=parse_compact_datetime(fields[offset + 3], fields[offset + 4]),
+        asks=[(fields[offset + 12], fields[offset + 14])],
+        bids=[(fields[offset + 11], fields[offset + 13])],
+    )
+
+
+def parse_fill_notice(fields: list[str], offset: int = 0) -> FillNotice:
+    """해외주식 실시간체결통보[실시간-009] (복호화한 데이터, 모의투자 TR도 tr_id는 FILL_NOTICE_TR_ID)
+
+    필드: 1 계좌번호, 2 주문번호, 3 원주문번호, 4 매도매수구분, 5 정정구분, 7 종목코드, 8 체결수량, 9 체결단가,
+    10 체결시간(한국시각), 11 거부여부, 12 체결여부, 15 주문수량
+
+    Note:
+        주문가격 필드가 없으므로 접수 통보의 체결단가(주문단가)를 주문가격으로 사용
+    """
+    today = datetime.now(DOMESTIC_TIME_ZONE).strftime("%Y%m%d")
+    is_fill = fields[offset + 12] == "2"
+    return FillNotice(
+        tr_id=FILL_NOTICE_TR_ID,
+        account_no=fields[offset + 1],
+        order_id=fields[offset + 2],
+        original_order_id=fields[offset + 3],
+        symbol=fields[offset + 7],
+        side="sell" if fields[offset + 4] == "01" else "buy",
+        revise_cancel=fields[offset + 5],
+        is_fill=is_fill,
+        is_rejected=fields[offset + 11] == "1",
+        quantity=fields[offset + 8],
+        price=fields[offset + 9],
+        order_quantity=fields[offset + 15],
+        order_price="" if is_fill else fields[offset + 9],
+        time=parse_compact_datetime(today, fields[offset + 10]),
+    )
@@ -0,0 +1,99 @@
+"""연속조회
+- tr_cont 헤더와 CTX_AREA_* 연속조회키로 다음 페이지를 요청하는 공통 반복자
+- 필요한 건수(limit)를 채우면 다음 페이지를 요청하지 않음
+- 모든 페이지를 읽는 조회는 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청 (prefetch, 선택)
+
+연속조회 방식:
+    첫 요청은 tr_cont 헤더 "", 응답 헤더 tr_cont가 F/M이면 다음 페이지가 있음 (D/E는 마지막)
+    다음 요청은 tr_cont 헤더 "N"과 응답의 ctx_area_*(예: ctx_area_fk200, ctx_area_nk200)를 대문자 파라미터로 전달
+"""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from kispy.responses import BaseResponse
+
+HAS_NEXT = ("F", "M")  # 다음 페이지가 있는 응답 tr_cont
+
+PageRequest = Callable[[dict, dict], BaseResponse]  # (headers, params) -> 응답
+
+
+def _next_params(params: dict, resp: BaseResponse) -> dict:
+    cursors = {key.upper(): value.strip() for key, value in resp.json.items() if key.startswith("ctx_area_")}
+    return {**params, **cursors}
+
+
+def iter_pages(
+    request: PageRequest,
+    headers: dict,
+    params: dict,
+    output_key: str = "output",
+    limit: int | None = None,
+    prefetch: bool = False,
+) -> Iterator[BaseResponse]:
+    """연속조회 응답을 페이지 단위로 반복
+
+    Args:
+        request (PageRequest): (headers, params)로 한 페이지를 요청하는 함수
+        headers (dict): 요청 헤더 (tr_cont는 자동 설정)
+        params (dict): 첫 요청 파라미터 (CTX_AREA_*는 빈 값)
+        output_key (str): 레코드 목록이 담긴 응답 키 (limit 계산에 사용)
+        limit (int | None): 필요한 최대 레코드 수, 채우면 다음 페이지를 요청하지 않음
+        prefetch (bool): 페이지를 처리하는 동안 다음 페이지를 미리 요청
+            (중간에 반복을 멈추면 미리 요청한 페이지가 낭비되므로 모든 페이지를 읽는 경우에만 사용)
+
+    Yields:
+        BaseResponse: 페이지 응답
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        resp = request({**headers, "tr_cont": ""}, params)
+        received = 0
+        while True:
+            items = resp.json.get(output_key) or []
+            received += len(items)
+            has_next = bool(items) and resp.headers.get("tr_cont") in HAS_NEXT and (limit is None or received < limit)
+
+            next_request = None
+            if has_next:
+                next_headers, next_params = {**headers, "tr_cont": "N"}, _next_params(params, resp)
+                if executor is not None:
+                    next_request = executor.submit(request, next_headers, next_params)
+
+            yield resp
+            if not has_next:
+                return
+            resp = next_request.result() if next_request is not None else request(next_headers, next_params)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def paginate(
+    request: PageRequest,
+    headers: dict,
+    params: dict,
+    output_key: str = "output",
+    limit: int | None = None,
+    prefetch: bool = False,
+) -> Iterator[dict]:
+    """연속조회 응답의 레코드를 하나씩 반복 (필요한 만큼만 요청)
+
+    Args:
+        request (PageRequest): (headers, params)로 한 페이지를 요청하는 함수
+        headers (dict): 요청 헤더
+        params (dict): 첫 요청 파라미터
+        output_key (str): 레코드 목록이 담긴 응답 키
+        limit (int | None): 최대 레코드 수
+        prefetch (bool): 레코드를 처리하는 동안 다음 페이지를 미리 요청 (모든 레코드를 읽는 경우에만 사용)
+
+    Yields:
+        dict: 레코드
+    """
+    count = 0
+    for resp in iter_pages(request, headers, params, output_key, limit, prefetch):
+        for item in resp.json.get(output_key) or []:
+            if limit is not None and count >= limit:
+                return
+            yield item
+            count += 1
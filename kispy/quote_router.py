@@ -0,0 +1,101 @@
+"""현재가 조회 경로 선택
+- 실시간 체결가를 등록한 종목은 마지막 체결가가 충분히 최신이면 메모리에서 바로 응답
+- 등록하지 않았거나 오래된 종목은 REST로 조회
+- 응답에 어느 경로로 조회했는지(source)를 함께 반환
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+from kispy.client import KisClientV2
+from kispy.models.realtime import Trade
+from kispy.realtime import RealtimeClient
+
+QuoteSource = Literal["realtime", "rest"]
+
+
+@dataclass(slots=True)
+class Quote:
+    symbol: str
+    price: str
+    source: QuoteSource  # 조회 경로
+    age: float  # 받은 지 지난 시간(초), REST는 0
+    time: datetime | None = None  # 체결시각 (실시간, 거래소 현지시각)
+
+
+class QuoteRouter:
+    def __init__(self, client: KisClientV2, realtime: RealtimeClient | None = None, max_age: float = 2.0):
+        """실시간 체결가 캐시와 REST 중에서 현재가 조회 경로를 선택
+
+        Args:
+            client (KisClientV2): REST 조회에 사용할 클라이언트
+            realtime (RealtimeClient | None): 체결가를 등록할 실시간 클라이언트, None이면 등록은 직접 관리
+            max_age (float): 실시간 체결가를 사용할 최대 경과 시간(초)
+
+        Example:
+            >>> router = QuoteRouter(kis, realtime)
+            >>> router.subscribe("AAPL")
+            >>> threading.Thread(target=lambda: [router.on_event(e) for e in realtime.events()], daemon=True).start()
+            >>> router.get_price("AAPL")
+            Quote(symbol='AAPL', price='181.90', source='realtime', age=0.12, ...)
+        """
+        self._client = client
+        self._realtime = realtime
+        self._max_age = max_age
+        self._subscribed: set[str] = set()
+        self._last_trades: dict[str, tuple[float, Trade]] = {}  # 종목코드 -> (받은 시각, 체결)
+        self._lock = threading.Lock()
+
+    def subscribe(self, symbol: str) -> None:
+        """종목의 실시간 체결가를 캐시 대상으로 등록 (realtime이 있으면 실시간 TR도 등록)"""
+        if self._realtime is not None:
+            self._realtime.subscribe_trades(self._client.get_symbol(symbol))
+        with self._lock:
+            self._subscribed.add(symbol)
+
+    def unsubscribe(self, symbol: str) -> None:
+        """종목을 캐시 대상에서 해제 (realtime이 있으면 실시간 TR도 해제해 등록 한도를 돌려받음)"""
+        with self._lock:
+            if symbol not in self._subscribed:
+                return
+            self._subscribed.discard(symbol)
+            self._last_trades.pop(symbol, None)
+        if self._realtime is not None:
+            self._realtime.unsubscribe_trades(self._client.get_symbol(symbol))
+
+    def on_event(self, event: object) -> None:
+        """실시간 이벤트 반영 (등록한 종목의 체결만 저장)"""
+        if isinstance(event, Trade) and event.symbol in self._subscribed:
+            with self._lock:
+                self._last_trades[event.symbol] = (time.monotonic(), event)
+
+    def get_price(self, symbol: str) -> Quote:
+        """현재가 (최신 실시간 체결가가 있으면 실시간, 없으면 REST)"""
+        quote = self._cached(symbol)
+        if quote is not None:
+            return quote
+        return Quote(symbol=symbol, price=self._client.get_price(symbol), source="rest", age=0.0)
+
+    def get_prices(self, symbols: list[str]) -> dict[str, Quote]:
+        """여러 종목의 현재가 (실시간으로 응답할 수 없는 종목만 REST로 동시에 조회)"""
+        quotes = {symbol: self._cached(symbol) for symbol in symbols}
+        missing = [symbol for symbol, quote in quotes.items() if quote is None]
+        for symbol, price in self._client.get_prices(missing).items():
+            quotes[symbol] = Quote(symbol=symbol, price=price, source="rest", age=0.0)
+        return {symbol: quote for symbol, quote in quotes.items() if quote is not None}
+
+    def _cached(self, symbol: str) -> Quote | None:
+        with self._lock:
+            if symbol not in self._subscribed:
+                return None
+            cached = self._last_trades.get(symbol)
+        if cached is None:
+            return None
+        received_at, trade = cached
+        age = time.monotonic() - received_at
+        if age > self._max_age:
+            return None
+        return Quote(symbol=symbol, price=trade.price, source="realtime", age=age, time=trade.time)
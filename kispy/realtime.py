@@ -0,0 +1,468 @@
+"""실시간 시세
+- 웹소켓 접속키 발급, 실시간 TR 등록/해제
+- PINGPONG 응답, 연결이 끊기면 재접속 후 등록했던 TR을 다시 등록
+- 수신한 데이터를 Trade/OrderBook/FillNotice/SubscriptionResult 이벤트로 변환
+- 체결통보는 등록 응답으로 받은 key/iv로 복호화 (AES-256-CBC)
+- 체결가는 레코드 객체 없이 필드별 배열(TradeColumns)로 바로 변환할 수도 있음
+
+실시간 데이터 형식:
+    암호화여부(0/1)|TR_ID|데이터건수|필드1^필드2^...  (데이터건수만큼 레코드가 이어짐)
+"""
+
+import base64
+import json
+import logging
+import threading
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from decimal import Decimal
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import unpad
+from websockets.exceptions import ConnectionClosed, InvalidHandshake, InvalidURI
+from websockets.sync.client import ClientConnection, connect
+
+from kispy.auth import KisAuth
+from kispy.constants import DOMESTIC_EXCHANGE_CODE, REAL_WS_URL, VIRTUAL_WS_URL, Nation
+from kispy.domestic_stock import realtime as domestic_realtime
+from kispy.models.account import Order
+from kispy.models.market import Symbol
+from kispy.models.realtime import FillNotice, RealtimeEvent, SubscriptionResult
+from kispy.overseas_stock import realtime as overseas_realtime
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_REJECTED = "invalid approval"  # 접속키가 만료/무효일 때 TR 등록 응답 메시지
+
+# TR별 (레코드당 필드 수, 변환 함수)
+RECORD_PARSERS: dict[str, tuple[int, Callable[[list[str], int], RealtimeEvent]]] = {
+    domestic_realtime.TRADE_TR_ID: (domestic_realtime.TRADE_FIELD_COUNT, domestic_realtime.parse_trade),
+    domestic_realtime.ORDER_BOOK_TR_ID: (domestic_realtime.ORDER_BOOK_FIELD_COUNT, domestic_realtime.parse_order_book),
+    overseas_realtime.TRADE_TR_ID: (overseas_realtime.TRADE_FIELD_COUNT, overseas_realtime.parse_trade),
+    overseas_realtime.ORDER_BOOK_TR_ID: (overseas_realtime.ORDER_BOOK_FIELD_COUNT, overseas_realtime.parse_order_book),
+    domestic_realtime.FILL_NOTICE_TR_ID: (domestic_realtime.FILL_NOTICE_FIELD_COUNT, domestic_realtime.parse_fill_notice),
+    domestic_realtime.VIRTUAL_FILL_NOTICE_TR_ID: (
+        domestic_realtime.FILL_NOTICE_FIELD_COUNT,
+        domestic_realtime.parse_fill_notice,
+    ),
+    overseas_realtime.FILL_NOTICE_TR_ID: (overseas_realtime.FILL_NOTICE_FIELD_COUNT, overseas_realtime.parse_fill_notice),
+    overseas_realtime.VIRTUAL_FILL_NOTICE_TR_ID: (
+        overseas_realtime.FILL_NOTICE_FIELD_COUNT,
+        overseas_realtime.parse_fill_notice,
+    ),
+}
+
+
+# 체결가 TR별 (레코드당 필드 수, 필드 위치)
+TRADE_LAYOUTS: dict[str, tuple[int, dict[str, int]]] = {
+    domestic_realtime.TRADE_TR_ID: (domestic_realtime.TRADE_FIELD_COUNT, domestic_realtime.TRADE_FIELDS),
+    overseas_realtime.TRADE_TR_ID: (overseas_realtime.TRADE_FIELD_COUNT, overseas_realtime.TRADE_FIELDS),
+}
+
+
+def decrypt_frame(frame: str, key: str, iv: str) -> str:
+    """암호화된 실시간 데이터(체결통보)를 복호화한 데이터로 변환
+
+    Args:
+        frame (str): 암호화된 실시간 데이터 (암호화여부가 1, 데이터는 base64)
+        key (str): TR 등록 응답의 복호화 키 (32자)
+        iv (str): TR 등록 응답의 초기화 벡터 (16자)
+
+    Returns:
+        str: 암호화여부를 0으로 바꾼 실시간 데이터
+    """
+    _, tr_id, count, payload = frame.split("|", 3)
+    cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
+    plain = unpad(cipher.decrypt(base64.b64decode(payload)), AES.block_size).decode("utf-8")
+    return f"0|{tr_id}|{count}|{plain}"
+
+
+def _split_frame(frame: str, field_count: int) -> tuple[list[str], int, int]:
+    """실시간 데이터를 (전체 필드, 레코드 수, 레코드당 필드 수)로 분리"""
+    _, _, count, payload = frame.split("|", 3)
+    fields = payload.split("^")
+    record_count = int(count)
+    # 레코드의 필드 수는 TR 명세보다 늘어날 수 있으므로 전체 필드 수로 계산
+    width = max(len(fields) // record_count, field_count) if record_count else field_count
+    return fields, record_count, width
+
+
+def parse_frame(frame: str) -> list[RealtimeEvent]:
+    """실시간 데이터 한 건을 이벤트로 변환 (지원하지 않는 TR은 빈 목록)"""
+    tr_id = frame[2 : frame.index("|", 2)]
+    parser = RECORD_PARSERS.get(tr_id)
+    if parser is None:
+        logger.debug(f"unsupported realtime tr: {tr_id}")
+        return []
+
+    field_count, parse = parser
+    fields, record_count, width = _split_frame(frame, field_count)
+    # 레코드마다 필드 목록을 잘라내지 않고 위치만 넘김
+    return [parse(fields, i * width) for i in range(record_count)]
+
+
+class TradeColumns:
+    """실시간 체결가를 필드별 배열로 모아두는 버퍼
+
+    레코드마다 객체를 만들지 않으므로 많은 종목의 체결을 받을 때 parse_frame보다 빠름.
+    i번째 체결은 각 배열의 i번째 값 (time은 YYYYMMDDHHMMSS 정수, 거래소 현지시각)
+
+    Example:
+        >>> columns = TradeColumns()
+        >>> for frame in client.frames():
+        ...     if isinstance(frame, str):
+        ...         decode_trades(frame, columns)
+        >>> columns.symbols[-1], columns.prices[-1]
+        ('AAPL', 181.9)
+    """
+
+    __slots__ = ("tr_ids", "symbols", "times", "prices", "volumes", "accumulated_volumes", "opens", "highs", "lows")
+
+    def __init__(self) -> None:
+        self.tr_ids: list[str] = []
+        self.symbols: list[str] = []
+        self.times = array("q")
+        self.prices = array("d")
+        self.volumes = array("q")
+        self.accumulated_volumes = array("q")
+        self.opens = array("d")
+        self.highs = array("d")
+        self.lows = array("d")
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def clear(self) -> None:
+        """모아둔 체결을 비움 (배치 단위로 처리한 뒤 재사용)"""
+        for name in self.__slots__:
+            del getattr(self, name)[:]
+
+
+def decode_trades(frame: str, columns: TradeColumns) -> int:
+    """실시간 체결가 데이터를 columns 뒤에 추가
+
+    프레임 전체를 한 번만 나누고, 필드마다 레코드 간격으로 건너뛰며 잘라 배열에 바로 넣음
+
+    Args:
+        frame (str): 실시간 데이터 한 건 (여러 레코드 가능)
+        columns (TradeColumns): 체결을 추가할 버퍼
+
+    Returns:
+        int: 추가한 체결 수 (체결가 TR이 아니면 0)
+    """
+    tr_id = frame[2 : frame.index("|", 2)]
+    layout = TRADE_LAYOUTS.get(tr_id)
+    if layout is None:
+        return 0
+
+    field_count, positions = layout
+    fields, record_count, width = _split_frame(frame, field_count)
+    end = record_count * width
+
+    def column(name: str) -> list[str]:
+        return fields[positions[name] : end : width]
+
+    columns.tr_ids.extend([tr_id] * record_count)
+    columns.symbols.extend(column("symbol"))
+    columns.times.extend(map(int, map(str.__add__, column("date"), column("time"))))
+    columns.prices.extend(map(float, column("price")))
+    columns.volumes.extend(map(int, column("volume")))
+    columns.accumulated_volumes.extend(map(int, column("accumulated_volume")))
+    columns.opens.extend(map(float, column("open")))
+    columns.highs.extend(map(float, column("high")))
+    columns.lows.extend(map(float, column("low")))
+    return record_count
+
+
+class OrderTracker:
+    """체결통보를 누적해 주문 상태를 갱신
+
+    Example:
+        >>> tracker = OrderTracker()
+        >>> for event in client.events():
+        ...     if isinstance(event, FillNotice) and (order := tracker.update(event)):
+        ...         print(order.order_id, order.status, order.filled_quantity)
+    """
+
+    def __init__(self, orders: Iterable[Order] = ()):
+        """
+        Args:
+            orders (Iterable[Order]): 이미 알고 있는 주문 (REST로 조회한 주문 등)
+        """
+        self._orders = {order.order_id: order for order in orders}
+
+    def get(self, order_id: str) -> Order | None:
+        return self._orders.get(order_id)
+
+    def update(self, notice: FillNotice) -> Order | None:
+        """체결통보를 반영한 주문 (상태가 바뀌지 않는 통보는 None)
+
+        Note:
+            - 취소 통보는 원주문을 canceled로 바꿈
+            - 정정 통보는 새 주문번호로 주문을 만들고 원주문을 canceled로 바꿈
+            - 체결 통보는 이번 체결분을 누적하며, 주문수량을 모두 채우면 closed
+        """
+        if notice.revise_cancel != "0" and not notice.is_fill:
+            if notice.is_rejected:
+                return None  # 정정/취소 거부는 원주문에 영향 없음
+            original = self._orders.get(notice.original_order_id)
+            if original is not None:
+                self._orders[original.order_id] = original.model_copy(update={"status": "canceled"})
+            if notice.revise_cancel == "2":
+                return self._orders.get(notice.original_order_id)
+
+        order = self._orders.get(notice.order_id) or self._new_order(notice)
+        if notice.is_rejected:
+            order = order.model_copy(update={"status": "rejected", "reject_reason": "거부"})
+        elif notice.is_fill:
+            filled_quantity = Decimal(order.filled_quantity) + Decimal(notice.quantity)
+            filled_amount = Decimal(order.filled_amount) + Decimal(notice.quantity) * Decimal(notice.price)
+            average_price = (filled_amount / filled_quantity).quantize(Decimal("0.0001")).normalize()
+            order = order.model_copy(
+                update={
+                    "status": "closed" if filled_quantity >= Decimal(order.requested_quantity) else "open",
+                    "filled_quantity": f"{filled_quantity:f}",
+                    "filled_amount": f"{filled_amount.normalize():f}",
+                    "average_price": f"{average_price:f}",
+                }
+            )
+        elif order.order_id in self._orders:
+            return None  # 이미 접수된 주문의 중복 통보
+
+        self._orders[order.order_id] = order
+        return order
+
+    @staticmethod
+    def _new_order(notice: FillNotice) -> Order:
+        order_price = notice.order_price or ("" if notice.is_fill else notice.price)
+        return Order(
+            order_id=notice.order_id,
+            symbol=notice.symbol,
+            side=notice.side,
+            status="open",
+            requested_price=f"{Decimal(order_price):f}" if order_price else "",
+            requested_quantity=f"{Decimal(notice.order_quantity):f}",
+            filled_quantity="0",
+            average_price="0",
+            filled_amount="0",
+            reject_reason="",
+            order_date=notice.time,
+        )
+
+
+class RealtimeClient:
+    def __init__(
+        self,
+        auth: KisAuth,
+        url: str | None = None,
+        heartbeat_timeout: float = 60.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """실시간 시세 웹소켓 클라이언트
+
+        Args:
+            auth (KisAuth): 인증 정보
+            url (str | None): 웹소켓 주소, 기본값은 실전/모의투자 실시간 API
+            heartbeat_timeout (float): 이 시간(초) 동안 아무 메시지도 받지 못하면 재접속
+            reconnect_delay (float): 첫 재접속 대기시간(초), 실패할 때마다 두 배로 늘어남
+            max_reconnect_delay (float): 최대 재접속 대기시간(초)
+
+        Example:
+            >>> client = RealtimeClient(auth)
+            >>> client.subscribe_trades(kis.get_symbol("AAPL"))
+            >>> for event in client.events():
+            ...     print(event)
+        """
+        self._auth = auth
+        self._url = url or (REAL_WS_URL if auth.is_real else VIRTUAL_WS_URL)
+        self._heartbeat_timeout = heartbeat_timeout
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._subscriptions: dict[tuple[str, str], None] = {}  # 등록 순서 유지
+        self._cipher_keys: dict[str, tuple[str, str]] = {}  # TR_ID별 체결통보 복호화 (key, iv)
+        self._lock = threading.Lock()
+        self._connection: ClientConnection | None = None
+        self._closed = threading.Event()
+
+    @property
+    def subscriptions(self) -> list[tuple[str, str]]:
+        """등록한 (TR_ID, TR_KEY) 목록"""
+        with self._lock:
+            return list(self._subscriptions)
+
+    def subscribe(self, tr_id: str, tr_key: str) -> None:
+        """실시간 TR 등록 (접속 전이면 접속할 때 등록)"""
+        with self._lock:
+            if (tr_id, tr_key) in self._subscriptions:
+                return
+            self._subscriptions[(tr_id, tr_key)] = None
+            self._send_request(tr_id, tr_key, "1")
+
+    def unsubscribe(self, tr_id: str, tr_key: str) -> None:
+        """실시간 TR 해제"""
+        with self._lock:
+            if (tr_id, tr_key) not in self._subscriptions:
+                return
+            del self._subscriptions[(tr_id, tr_key)]
+            self._send_request(tr_id, tr_key, "2")
+
+    def subscribe_trades(self, symbol: Symbol) -> None:
+        """종목의 실시간 체결가 등록 (국내주식/해외주식)"""
+        if symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            self.subscribe(domestic_realtime.TRADE_TR_ID, symbol.symbol)
+        else:
+            self.subscribe(overseas_realtime.TRADE_TR_ID, symbol.realtime_symbol)
+
+    def unsubscribe_trades(self, symbol: Symbol) -> None:
+        """종목의 실시간 체결가 해제 (국내주식/해외주식)"""
+        if symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            self.unsubscribe(domestic_realtime.TRADE_TR_ID, symbol.symbol)
+        else:
+            self.unsubscribe(overseas_realtime.TRADE_TR_ID, symbol.realtime_symbol)
+
+    def subscribe_order_book(self, symbol: Symbol) -> None:
+        """종목의 실시간 호가 등록 (국내주식/해외주식)"""
+        if symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            self.subscribe(domestic_realtime.ORDER_BOOK_TR_ID, symbol.symbol)
+        else:
+            self.subscribe(overseas_realtime.ORDER_BOOK_TR_ID, symbol.realtime_symbol)
+
+    def subscribe_fill_notices(self, hts_id: str, nation: Nation | None = None) -> None:
+        """계좌의 실시간 체결통보 등록 (주문 접수/체결/정정/취소/거부)
+
+        Args:
+            hts_id (str): HTS ID (계좌번호가 아님)
+            nation (Nation | None): "KR"이면 국내주식, 그 외 국가는 해외주식, None이면 둘 다 등록
+        """
+        real = self._auth.is_real
+        if nation in (None, "KR"):
+            tr_id = domestic_realtime.FILL_NOTICE_TR_ID if real else domestic_realtime.VIRTUAL_FILL_NOTICE_TR_ID
+            self.subscribe(tr_id, hts_id)
+        if nation != "KR":
+            tr_id = overseas_realtime.FILL_NOTICE_TR_ID if real else overseas_realtime.VIRTUAL_FILL_NOTICE_TR_ID
+            self.subscribe(tr_id, hts_id)
+
+    def events(self) -> Iterator[RealtimeEvent]:
+        """실시간 이벤트 (close()를 호출할 때까지 재접속하며 계속 수신)
+
+        Yields:
+            RealtimeEvent: Trade, OrderBook 또는 TR 등록/해제 결과
+        """
+        for frame in self.frames():
+            if isinstance(frame, str):
+                yield from parse_frame(frame)
+            else:
+                yield frame
+
+    def frames(self) -> Iterator[str | SubscriptionResult]:
+        """변환하지 않은 실시간 데이터 (decode_trades 등으로 직접 변환할 때 사용)
+
+        Yields:
+            str | SubscriptionResult: 실시간 데이터 한 건 또는 TR 등록/해제 결과
+        """
+        delay = self._reconnect_delay
+        while not self._closed.is_set():
+            try:
+                with connect(self._url, ping_interval=None, open_timeout=10) as connection:
+                    with self._lock:
+                        self._connection = connection
+                        for tr_id, tr_key in self._subscriptions:
+                            self._send_request(tr_id, tr_key, "1")
+                    for frame in self._receive(connection):
+                        # 수신이 확인된 접속만 정상으로 보고 재접속 대기 시간을 초기화
+                        delay = self._reconnect_delay
+                        yield frame
+            except ConnectionClosed as e:
+                logger.warning(f"realtime connection closed: {e}")
+            except (OSError, InvalidHandshake, InvalidURI) as e:
+                # 접속 실패, heartbeat_timeout 동안 수신 없음(TimeoutError), 소켓 오류
+                logger.warning(f"realtime connection lost: {e!r}")
+            finally:
+                with self._lock:
+                    self._connection = None
+
+            # 접속 직후 끊기는 경우에도 대기 시간을 늘려가며 재접속
+            logger.warning(f"realtime reconnecting in {delay:.1f}s")
+            if self._closed.wait(delay):
+                return
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    def close(self) -> None:
+        """접속을 끊고 events() 반복을 종료"""
+        self._closed.set()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+
+    def _receive(self, connection: ClientConnection) -> Iterator[str | SubscriptionResult]:
+        retried: set[tuple[str, str]] = set()  # 접속키를 새로 발급받아 다시 등록한 TR
+        while not self._closed.is_set():
+            message = connection.recv(timeout=self._heartbeat_timeout)
+            if isinstance(message, bytes):
+                message = message.decode("utf-8")
+
+            if message[:1] == "0":
+                yield message
+                continue
+            if message[:1] == "1":
+                tr_id = message[2 : message.index("|", 2)]
+                cipher_key = self._cipher_keys.get(tr_id)
+                if cipher_key is None:
+                    logger.warning(f"no decryption key for realtime tr: {tr_id}")
+                    continue
+                yield decrypt_frame(message, *cipher_key)
+                continue
+
+            try:
+                data = json.loads(message)
+            except json.JSONDecodeError:
+                logger.warning(f"skipping malformed realtime message: {message[:100]!r}")
+                continue
+            header = data.get("header", {})
+            if header.get("tr_id") == "PINGPONG":
+                connection.send(message)
+                continue
+
+            body = data.get("body", {})
+            output = body.get("output") or {}
+            result = SubscriptionResult(
+                tr_id=header.get("tr_id", ""),
+                tr_key=header.get("tr_key", ""),
+                success=body.get("rt_cd") == "0",
+                message=body.get("msg1", ""),
+                key=output.get("key"),
+                iv=output.get("iv"),
+            )
+            if result.success and result.key and result.iv:
+                self._cipher_keys[result.tr_id] = (result.key, result.iv)
+            elif APPROVAL_REJECTED in result.message.lower() and (result.tr_id, result.tr_key) not in retried:
+                # 접속키가 만료되어 등록이 거부되면 새로 발급받아 한 번 더 등록 (발급은 접속당 한 번)
+                retried.add((result.tr_id, result.tr_key))
+                logger.warning(f"realtime approval key rejected, retrying {result.tr_id} {result.tr_key}")
+                if len(retried) == 1:
+                    self._auth.get_approval_key(refresh=True)
+                with self._lock:
+                    if (result.tr_id, result.tr_key) in self._subscriptions:
+                        self._send_request(result.tr_id, result.tr_key, "1")
+                continue
+            yield result
+
+    def _send_request(self, tr_id: str, tr_key: str, tr_type: str) -> None:
+        # self._lock을 잡은 상태에서 호출
+        if self._connection is None:
+            return
+        request = {
+            "header": {
+                "approval_key": self._auth.get_approval_key(),
+                "custtype": "P",  # 개인
+                "tr_type": tr_type,  # 1: 등록, 2: 해제
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": tr_id, "tr_key": tr_key}},
+        }
+        try:
+            self._connection.send(json.dumps(request))
+        except ConnectionClosed:
+            # 재접속할 때 다시 등록
+            logger.debug(f"realtime connection closed while sending {tr_id} {tr_key}")
@@ -0,0 +1,219 @@
+"""실시간 세션 풀
+- 세션당 등록 한도(41건)를 넘는 실시간 TR을 여러 앱키의 웹소켓 세션에 나누어 등록 (앱키당 세션은 하나)
+- 등록/해제할 때 필요한 세션 수만 유지하도록 재배치
+- 모든 세션의 이벤트를 하나의 스트림으로 합쳐서 전달 (세션 안의 순서는 유지, 세션 사이는 도착 순서)
+"""
+
+import logging
+import math
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+
+from kispy.auth import KisAuth
+from kispy.constants import DOMESTIC_EXCHANGE_CODE, REALTIME_SUBSCRIPTION_LIMIT
+from kispy.domestic_stock import realtime as domestic_realtime
+from kispy.models.market import Symbol
+from kispy.models.realtime import RealtimeEvent
+from kispy.overseas_stock import realtime as overseas_realtime
+from kispy.realtime import RealtimeClient
+
+logger = logging.getLogger(__name__)
+
+_CLOSED = object()  # 세션 스레드 종료 표시
+
+
+@dataclass
+class SessionStats:
+    session_id: int
+    subscriptions: int  # 등록한 TR 수
+    events: int = 0  # 받은 이벤트 수
+    last_event_at: float | None = None  # 마지막 이벤트 수신 시각 (time.time())
+    lag: float = 0.0  # 마지막 이벤트가 합쳐진 스트림에서 기다린 시간(초)
+    max_lag: float = 0.0
+
+
+@dataclass
+class _Session:
+    session_id: int
+    auth: KisAuth
+    client: RealtimeClient
+    subscriptions: dict[tuple[str, str], None] = field(default_factory=dict)
+    stats: SessionStats = field(init=False)
+    thread: threading.Thread | None = None
+
+    def __post_init__(self) -> None:
+        self.stats = SessionStats(self.session_id, 0)
+
+
+class RealtimeSessionPool:
+    def __init__(
+        self,
+        auth: KisAuth | list[KisAuth],
+        max_subscriptions: int = REALTIME_SUBSCRIPTION_LIMIT,
+        max_sessions: int | None = None,
+        client_factory: Callable[[KisAuth], RealtimeClient] = RealtimeClient,
+        queue_size: int = 0,
+    ):
+        """여러 실시간 세션에 TR을 나누어 등록하는 클라이언트
+
+        Args:
+            auth (KisAuth | list[KisAuth]): 인증 정보, 세션마다 사용하지 않은 앱키를 하나씩 사용
+            max_subscriptions (int): 세션당 최대 등록 수
+            max_sessions (int | None): 최대 세션 수, None이면 앱키 수
+            client_factory (Callable[[KisAuth], RealtimeClient]): 세션 생성 함수
+            queue_size (int): 합쳐진 스트림의 최대 대기 이벤트 수, 0이면 제한 없음
+
+        Raises:
+            ValueError: max_sessions가 앱키 수보다 많은 경우 (KIS는 앱키당 실시간 세션을 하나만 허용)
+
+        Example:
+            >>> pool = RealtimeSessionPool([auth1, auth2])
+            >>> for symbol in symbols:  # 수백 종목
+            ...     pool.subscribe_trades(symbol)
+            >>> for event in pool.events():
+            ...     print(event)
+        """
+        auths: dict[str, KisAuth] = {}  # 앱키 중복 제거 (먼저 나온 인증 정보 사용)
+        for item in auth if isinstance(auth, list) else [auth]:
+            auths.setdefault(item.app_key, item)
+        self._auths = list(auths.values())
+        if max_sessions is not None and max_sessions > len(self._auths):
+            raise ValueError(f"max_sessions ({max_sessions}) exceeds the number of app keys ({len(self._auths)})")
+        self._max_subscriptions = max_subscriptions
+        self._max_sessions = len(self._auths) if max_sessions is None else max_sessions
+        self._client_factory = client_factory
+        self._sessions: list[_Session] = []
+        self._next_session_id = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._closed = threading.Event()
+
+    @property
+    def subscriptions(self) -> list[tuple[str, str]]:
+        """등록한 (TR_ID, TR_KEY) 목록"""
+        with self._lock:
+            return [key for session in self._sessions for key in session.subscriptions]
+
+    def subscribe(self, tr_id: str, tr_key: str) -> None:
+        """실시간 TR 등록 (등록 수가 가장 적은 세션, 모두 가득 차면 새 세션)
+
+        Raises:
+            ValueError: max_sessions개의 세션이 모두 가득 찬 경우 (앱키를 더 주면 세션을 늘릴 수 있음)
+        """
+        key = (tr_id, tr_key)
+        with self._lock:
+            if any(key in session.subscriptions for session in self._sessions):
+                return
+            session = self._least_loaded()
+            if session is None:
+                session = self._open_session()
+            session.subscriptions[key] = None
+        session.client.subscribe(tr_id, tr_key)
+
+    def unsubscribe(self, tr_id: str, tr_key: str) -> None:
+        """실시간 TR 해제 후 남은 등록을 더 적은 세션으로 재배치"""
+        key = (tr_id, tr_key)
+        with self._lock:
+            session = next((session for session in self._sessions if key in session.subscriptions), None)
+            if session is None:
+                return
+            del session.subscriptions[key]
+        session.client.unsubscribe(tr_id, tr_key)
+        self.rebalance()
+
+    def subscribe_trades(self, symbol: Symbol) -> None:
+        """종목의 실시간 체결가 등록 (국내주식/해외주식)"""
+        if symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            self.subscribe(domestic_realtime.TRADE_TR_ID, symbol.symbol)
+        else:
+            self.subscribe(overseas_realtime.TRADE_TR_ID, symbol.realtime_symbol)
+
+    def subscribe_order_book(self, symbol: Symbol) -> None:
+        """종목의 실시간 호가 등록 (국내주식/해외주식)"""
+        if symbol.exchange_code == DOMESTIC_EXCHANGE_CODE:
+            self.subscribe(domestic_realtime.ORDER_BOOK_TR_ID, symbol.symbol)
+        else:
+            self.subscribe(overseas_realtime.ORDER_BOOK_TR_ID, symbol.realtime_symbol)
+
+    def rebalance(self) -> None:
+        """등록 수에 필요한 만큼의 세션만 남기고, 등록이 가장 적은 세션부터 다른 세션으로 옮겨서 닫음"""
+        while True:
+            with self._lock:
+                total = sum(len(session.subscriptions) for session in self._sessions)
+                if len(self._sessions) <= math.ceil(total / self._max_subscriptions):
+                    return
+                source = min(self._sessions, key=lambda session: len(session.subscriptions))
+                self._sessions.remove(source)
+                moves = []
+                for key in source.subscriptions:
+                    target = self._least_loaded()
+                    assert target is not None  # 남은 세션에 자리가 있으므로 세션 수를 줄일 수 있음
+                    target.subscriptions[key] = None
+                    moves.append((target, key))
+
+            for target, (tr_id, tr_key) in moves:
+                target.client.subscribe(tr_id, tr_key)
+            source.client.close()
+            logger.info(f"realtime session {source.session_id} closed, moved {len(moves)} subscriptions")
+
+    def stats(self) -> list[SessionStats]:
+        """세션별 등록 수/수신 이벤트 수/지연 시간"""
+        with self._lock:
+            for session in self._sessions:
+                session.stats.subscriptions = len(session.subscriptions)
+            return [SessionStats(**vars(session.stats)) for session in self._sessions]
+
+    def events(self) -> Iterator[RealtimeEvent]:
+        """모든 세션의 실시간 이벤트 (close()를 호출할 때까지)"""
+        while not self._closed.is_set():
+            try:
+                item = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if item is _CLOSED:
+                continue
+            session, queued_at, event = item
+            lag = time.monotonic() - queued_at
+            session.stats.lag = lag
+            session.stats.max_lag = max(session.stats.max_lag, lag)
+            yield event
+
+    def close(self) -> None:
+        """모든 세션을 닫고 events() 반복을 종료"""
+        self._closed.set()
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.client.close()
+        self._queue.put(_CLOSED)
+
+    def _least_loaded(self) -> _Session | None:
+        # self._lock을 잡은 상태에서 호출
+        available = [session for session in self._sessions if len(session.subscriptions) < self._max_subscriptions]
+        return min(available, key=lambda session: len(session.subscriptions)) if available else None
+
+    def _open_session(self) -> _Session:
+        # self._lock을 잡은 상태에서 호출
+        if len(self._sessions) >= self._max_sessions:
+            raise ValueError(f"all {self._max_sessions} realtime sessions are full (one session per app key)")
+        in_use = {session.auth.app_key for session in self._sessions}
+        auth = next(auth for auth in self._auths if auth.app_key not in in_use)
+        session_id = self._next_session_id
+        self._next_session_id += 1
+        session = _Session(session_id, auth, self._client_factory(auth))
+        session.thread = threading.Thread(target=self._run, args=(session,), daemon=True)
+        self._sessions.append(session)
+        session.thread.start()
+        return session
+
+    def _run(self, session: _Session) -> None:
+        try:
+            for event in session.client.events():
+                session.stats.events += 1
+                session.stats.last_event_at = time.time()
+                self._queue.put((session, time.monotonic(), event))
+        except Exception:
+            logger.exception(f"realtime session {session.session_id} stopped")
@@ -0,0 +1,221 @@
+"""분봉 기록기
+- 거래소 장 마감 후 설정된 종목의 분봉을 조회하여 로컬 저장소에 추가
+- API 제공 기간(해외 약 1개월, 국내 당일)을 넘어서는 분봉 이력을 누적
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from functools import partial
+
+from zoneinfo import ZoneInfo
+
+from kispy.client import KisClient
+from kispy.constants import (
+    DOMESTIC_EXCHANGE_CODE,
+    DOMESTIC_MARKET_SESSION,
+    DOMESTIC_TIME_ZONE,
+    MarketBreakMap,
+    MarketSessionMap,
+    TimeZoneMap,
+)
+from kispy.models.market import OHLCV, Symbol
+from kispy.store import BarStore
+
+logger = logging.getLogger(__name__)
+
+DOMESTIC = DOMESTIC_EXCHANGE_CODE  # 국내주식 일정 그룹
+
+
+@dataclass
+class RecordReport:
+    symbol: str
+    recorded: int = 0  # 새로 기록한 분봉 수
+    gaps: list[tuple[datetime, datetime]] = field(default_factory=list)  # 누락 구간 (직전 분봉, 다음 분봉)
+    empty_gaps: int = 0  # 조회 범위 안이라 거래가 없었던 것으로 확인된 구간 수 (누락으로 보고하지 않음)
+    error: str | None = None
+
+
+class MinuteBarRecorder:
+    def __init__(
+        self,
+        client: KisClient,
+        store: BarStore,
+        symbols: list[Symbol] | None = None,
+        domestic_symbols: list[str] | None = None,
+        max_bars_per_symbol: int | None = 120 * 40,
+        close_delay: timedelta = timedelta(minutes=10),
+    ):
+        """1분봉 기록기
+
+        Args:
+            client (KisClient): KIS API 클라이언트
+            store (BarStore): 분봉 저장소
+            symbols (list[Symbol] | None): 기록할 해외주식 종목
+            domestic_symbols (list[str] | None): 기록할 국내주식 종목코드
+            max_bars_per_symbol (int | None): 한 번의 기록에서 종목별로 조회할 최대 분봉 수
+            close_delay (timedelta): 장 마감 후 기록을 시작하기까지 대기 시간
+
+        Note:
+            - 종목은 순차적으로 조회하며, 호출 빈도는 RateLimiter로 제한됩니다.
+            - 마지막으로 기록된 분봉 이후만 조회하므로 매일 기록하면 종목당 몇 번의 호출로 끝납니다.
+        """
+        self._client = client
+        self._store = store
+        self._symbols = symbols or []
+        self._domestic_symbols = domestic_symbols or []
+        self._max_bars_per_symbol = max_bars_per_symbol
+        self._close_delay = close_delay
+        self._last_dates: dict[str, datetime | None] = {}  # 종목별 마지막으로 기록한 분봉 일시
+
+    def sweep(self, exchange_code: str | None = None) -> list[RecordReport]:
+        """종목별 새 분봉을 기록
+
+        Args:
+            exchange_code (str | None): 기록할 거래소코드 (국내주식은 "KRX"), None이면 전체
+
+        Returns:
+            list[RecordReport]: 종목별 기록 결과
+        """
+        reports = []
+        for symbol in self._symbols:
+            if exchange_code in (None, symbol.exchange_code):
+                session = MarketSessionMap[symbol.exchange_code]
+                lunch_break = MarketBreakMap.get(symbol.exchange_code)
+                reports.append(self._record(symbol.symbol, partial(self._fetch_overseas, symbol), session, lunch_break))
+        if exchange_code in (None, DOMESTIC):
+            for stock_code in self._domestic_symbols:
+                reports.append(
+                    self._record(stock_code, partial(self._fetch_domestic, stock_code), DOMESTIC_MARKET_SESSION)
+                )
+
+        for report in reports:
+            if report.error:
+                logger.warning(f"{report.symbol}: {report.error}")
+            elif report.gaps:
+                logger.warning(f"{report.symbol}: {len(report.gaps)} gaps {report.gaps}")
+        return reports
+
+    def run_forever(self, stop_event: threading.Event | None = None) -> None:
+        """거래소별 장 마감 시각마다 sweep을 반복 실행"""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            exchange_code, run_at = self.next_run()
+            wait = (run_at - datetime.now(run_at.tzinfo)).total_seconds()
+            logger.info(f"next sweep: {exchange_code} at {run_at.isoformat()}")
+            if stop_event.wait(max(wait, 0)):
+                break
+            self.sweep(exchange_code)
+
+    def next_run(self, now: datetime | None = None) -> tuple[str, datetime]:
+        """다음으로 기록할 (거래소코드, 실행시각)"""
+        schedules: dict[str, tuple[ZoneInfo, time]] = {
+            symbol.exchange_code: (TimeZoneMap[symbol.exchange_code], MarketSessionMap[symbol.exchange_code][1])
+            for symbol in self._symbols
+        }
+        if self._domestic_symbols:
+            schedules[DOMESTIC] = (DOMESTIC_TIME_ZONE, DOMESTIC_MARKET_SESSION[1])
+        if not schedules:
+            raise ValueError("기록할 종목이 없습니다.")
+
+        candidates = []
+        for exchange_code, (zone_info, close_time) in schedules.items():
+            local_now = (now or datetime.now(zone_info)).astimezone(zone_info)
+            run_at = datetime.combine(local_now.date(), close_time, zone_info) + self._close_delay
+            while run_at <= local_now or run_at.weekday() >= 5:
+                run_at += timedelta(days=1)
+            candidates.append((run_at, exchange_code))
+
+        run_at, exchange_code = min(candidates)
+        return exchange_code, run_at
+
+    def _record(
+        self,
+        symbol: str,
+        fetch: Callable[[datetime | None], list[OHLCV]],
+        session: tuple[time, time],
+        lunch_break: tuple[time, time] | None = None,
+    ) -> RecordReport:
+        report = RecordReport(symbol=symbol)
+        if symbol not in self._last_dates:
+            # 저장소 파일은 처음 한 번만 읽고, 이후에는 기록한 분봉으로 갱신
+            self._last_dates[symbol] = self._store.last_date(symbol)
+        last_date = self._last_dates[symbol]
+        try:
+            bars: list[OHLCV] = fetch(last_date)
+        except Exception as e:
+            report.error = str(e)
+            return report
+
+        new_bars = sorted((bar for bar in bars if last_date is None or bar.date > last_date), key=lambda bar: bar.date)
+        self._store.append(symbol, new_bars)
+        if new_bars:
+            self._last_dates[symbol] = new_bars[-1].date
+        report.recorded = len(new_bars)
+        gaps = _find_gaps(
+            ([] if last_date is None else [last_date]) + [bar.date for bar in new_bars], session, lunch_break
+        )
+        # 조회한 범위 안의 빈 구간은 거래가 없었던 분봉 (거래가 드문 종목), 조회가 닿지 않은 구간만 누락으로 보고
+        covered_from = min((bar.date for bar in bars), default=None)
+        report.gaps = [gap for gap in gaps if covered_from is None or gap[0] < covered_from]
+        report.empty_gaps = len(gaps) - len(report.gaps)
+        return report
+
+    def _fetch_overseas(self, symbol: Symbol, last_date: datetime | None) -> list[OHLCV]:
+        histories = self._client.overseas_stock.quote.get_stock_price_history_by_minute(
+            symbol=symbol.symbol,
+            exchange_code=symbol.exchange_code,
+            period="1",
+            start_date=last_date.strftime("%Y%m%d%H%M%S") if last_date else None,
+            limit=self._max_bars_per_symbol,
+        )
+        return [OHLCV.from_response(history) for history in histories]
+
+    def _fetch_domestic(self, stock_code: str, last_date: datetime | None) -> list[OHLCV]:
+        # 마지막 기록일부터 오늘까지 일자별로 조회하여 기록하지 못한 날의 분봉도 보충
+        start_date = last_date or datetime.now(DOMESTIC_TIME_ZONE)
+        histories = self._client.domestic_stock.quote.get_stock_price_history_by_minute_range(
+            symbol=stock_code,
+            start_date=start_date.strftime("%Y%m%d"),
+        )
+        return [OHLCV.from_response(history) for history in histories]
+
+
+def _find_gaps(
+    dates: list[datetime],
+    session: tuple[time, time],
+    lunch_break: tuple[time, time] | None = None,
+    period: timedelta = timedelta(minutes=1),
+) -> list[tuple[datetime, datetime]]:
+    """분봉 간격이 period보다 큰 구간 (누락 후보)
+
+    Note:
+        - 같은 날짜 안에서는 분봉 간격으로 판단하며, 점심시간(lunch_break)에 걸친 간격은 제외합니다.
+        - 날짜가 바뀌면 직전 분봉이 정규장 마감 전에 끝났거나, 다음 분봉이 정규장 시작 후에 시작했거나,
+          사이에 평일이 있으면(기록하지 못한 거래일) 누락으로 봅니다. 휴장일도 누락으로 보고될 수 있습니다.
+        - 거래가 없었던 분봉도 후보가 되므로, 조회 범위 안의 후보는 호출하는 쪽에서 제외합니다.
+    """
+    open_time, close_time = session
+    gaps = []
+    for prev, cur in zip(dates, dates[1:], strict=False):
+        if prev.date() == cur.date():
+            start, end = prev + period, cur  # 비어 있는 분봉 [start, end)
+            if lunch_break is not None:
+                break_start, break_end = (datetime.combine(prev.date(), t, prev.tzinfo) for t in lunch_break)
+                if break_start <= start < break_end:
+                    start = break_end
+                if break_start < end <= break_end:
+                    end = break_start
+            missing = start < end
+        else:
+            session_end = datetime.combine(prev.date(), close_time, prev.tzinfo) - period
+            session_start = datetime.combine(cur.date(), open_time, cur.tzinfo) + period
+            missed_days = any(
+                (prev.date() + timedelta(days=days)).weekday() < 5 for days in range(1, (cur.date() - prev.date()).days)
+            )
+            missing = prev < session_end or cur > session_start or missed_days
+        if missing:
+            gaps.append((prev, cur))
+    return gaps
@@ -0,0 +1,199 @@
+"""종목별 최근 체결/봉 링 버퍼
+- 용량이 고정된 배열에 O(1)로 추가하고, 최근 n건을 복사 없이 연속된 memoryview로 제공
+- 실시간 체결(Trade, TradeColumns)과 REST로 조회한 봉(OHLCV)을 모두 받음
+
+저장 방식:
+    용량의 두 배 크기 배열에 각 값을 i와 i + capacity 위치에 함께 기록하므로,
+    최근 n건은 항상 [head + capacity - n, head + capacity) 구간에 이어져 있음
+    (numpy가 있으면 np.frombuffer(view)로 복사 없이 벡터 연산에 사용 가능)
+"""
+
+from array import array
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from kispy.models.market import OHLCV
+from kispy.models.realtime import Trade
+from kispy.realtime import TradeColumns
+
+
+def _to_int_time(value: datetime) -> int:
+    """datetime을 YYYYMMDDHHMMSS 정수로 변환 (TradeColumns.times와 같은 형식)"""
+    return int(f"{value:%Y%m%d%H%M%S}")
+
+
+class RingBuffer:
+    __slots__ = ("_buffer", "_capacity", "_head", "_size")
+
+    def __init__(self, capacity: int, typecode: str = "d"):
+        """고정 용량 링 버퍼
+
+        Args:
+            capacity (int): 최대 보관 건수
+            typecode (str): array 타입코드 ("d": 실수, "q": 정수)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._buffer: array[Any] = array(typecode, bytes(array(typecode).itemsize * capacity * 2))
+        self._capacity = capacity
+        self._head = 0  # 다음에 기록할 위치
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float) -> None:
+        buffer, head = self._buffer, self._head
+        buffer[head] = value
+        buffer[head + self._capacity] = value
+        self._head = head + 1 if head + 1 < self._capacity else 0
+        if self._size < self._capacity:
+            self._size += 1
+
+    def replace_last(self, value: float) -> None:
+        """마지막 값을 바꿈 (만들어지는 중인 봉 갱신)"""
+        if not self._size:
+            raise IndexError("replace_last on empty buffer")
+        last = self._head - 1 if self._head else self._capacity - 1
+        self._buffer[last] = value
+        self._buffer[last + self._capacity] = value
+
+    def view(self, n: int | None = None) -> memoryview:
+        """최근 n건(기본값은 전체)을 오래된 순서로 담은 연속 memoryview (복사 없음)
+
+        Note:
+            다음 append 이후에는 내용이 바뀔 수 있으므로 계산에 바로 사용하세요.
+        """
+        n = self._size if n is None else min(n, self._size)
+        end = self._head + self._capacity
+        return memoryview(self._buffer)[end - n : end]
+
+    def last(self) -> float:
+        if not self._size:
+            raise IndexError("last on empty buffer")
+        value: float = self._buffer[self._head + self._capacity - 1]
+        return value
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+
+class TickBuffer:
+    """종목의 최근 체결 (시각/가격/체결량)"""
+
+    __slots__ = ("times", "prices", "volumes")
+
+    def __init__(self, capacity: int):
+        self.times = RingBuffer(capacity, "q")  # YYYYMMDDHHMMSS (거래소 현지시각)
+        self.prices = RingBuffer(capacity, "d")
+        self.volumes = RingBuffer(capacity, "q")
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def append(self, time: int, price: float, volume: int) -> None:
+        self.times.append(time)
+        self.prices.append(price)
+        self.volumes.append(volume)
+
+
+class BarBuffer:
+    """종목의 최근 봉 (시각/시가/고가/저가/종가/거래량)
+
+    시각이 마지막 봉과 같으면 마지막 봉을 갱신하고, 더 이전 봉은 무시하므로
+    실시간으로 만드는 봉과 주기적으로 조회한 봉을 함께 넣어도 중복되지 않음
+    """
+
+    __slots__ = ("times", "opens", "highs", "lows", "closes", "volumes")
+
+    def __init__(self, capacity: int):
+        self.times = RingBuffer(capacity, "q")  # 봉 시작 시각 YYYYMMDDHHMMSS
+        self.opens = RingBuffer(capacity, "d")
+        self.highs = RingBuffer(capacity, "d")
+        self.lows = RingBuffer(capacity, "d")
+        self.closes = RingBuffer(capacity, "d")
+        self.volumes = RingBuffer(capacity, "d")
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def append(self, bar: OHLCV) -> bool:
+        """봉 추가 또는 마지막 봉 갱신
+
+        Returns:
+            bool: 추가/갱신 여부 (마지막 봉보다 이전 봉이면 False)
+        """
+        time = _to_int_time(bar.date)
+        if self.times and time <= self.times.last():
+            if time < self.times.last():
+                return False
+            write = RingBuffer.replace_last
+        else:
+            write = RingBuffer.append
+        write(self.times, time)
+        write(self.opens, float(bar.open))
+        write(self.highs, float(bar.high))
+        write(self.lows, float(bar.low))
+        write(self.closes, float(bar.close))
+        write(self.volumes, float(bar.volume))
+        return True
+
+
+class MarketBuffers:
+    def __init__(self, tick_capacity: int = 10_000, bar_capacity: int = 1_000):
+        """종목별 최근 체결/봉 저장소
+
+        Args:
+            tick_capacity (int): 종목별 최대 체결 보관 건수
+            bar_capacity (int): 종목별 최대 봉 보관 건수
+
+        Example:
+            >>> buffers = MarketBuffers(bar_capacity=500)
+            >>> buffers.add_bars("AAPL", kis.fetch_ohlcv("AAPL", period="1m", limit=500))
+            >>> for event in client.events():
+            ...     buffers.add_trade(event)
+            ...     closes = buffers.bars("AAPL").closes.view(20)  # 최근 20개 종가
+        """
+        self._tick_capacity = tick_capacity
+        self._bar_capacity = bar_capacity
+        self._ticks: dict[str, TickBuffer] = {}
+        self._bars: dict[str, BarBuffer] = {}
+
+    def ticks(self, symbol: str) -> TickBuffer:
+        buffer = self._ticks.get(symbol)
+        if buffer is None:
+            buffer = self._ticks[symbol] = TickBuffer(self._tick_capacity)
+        return buffer
+
+    def bars(self, symbol: str) -> BarBuffer:
+        buffer = self._bars.get(symbol)
+        if buffer is None:
+            buffer = self._bars[symbol] = BarBuffer(self._bar_capacity)
+        return buffer
+
+    def add_trade(self, event: object) -> None:
+        """실시간 체결 추가 (체결이 아닌 이벤트는 무시하므로 events()의 모든 이벤트를 넘겨도 됨)"""
+        if isinstance(event, Trade):
+            self.ticks(event.symbol).append(_to_int_time(event.time), float(event.price), int(event.volume))
+
+    def add_trade_columns(self, columns: TradeColumns) -> None:
+        """decode_trades로 모은 체결 추가"""
+        for symbol, time, price, volume in zip(
+            columns.symbols, columns.times, columns.prices, columns.volumes, strict=True
+        ):
+            self.ticks(symbol).append(time, price, volume)
+
+    def add_bars(self, symbol: str, bars: Iterable[OHLCV]) -> int:
+        """조회한 봉 추가 (시간순), 이미 있는 봉 이전의 봉은 무시
+
+        Returns:
+            int: 추가/갱신한 봉 수
+        """
+        buffer = self.bars(symbol)
+        return sum(buffer.append(bar) for bar in bars)
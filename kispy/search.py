@@ -0,0 +1,113 @@
+"""종목 검색
+- 종목코드/한글 이름/영문 이름의 앞부분 또는 일부로 종목을 검색
+- 정렬된 검색어 목록(이진 탐색)으로 앞부분 일치, 2-gram 색인으로 부분 일치를 찾음
+"""
+
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+
+from kispy.models.market import Symbol
+
+
+def normalize(text: str) -> str:
+    """검색용 문자열 정규화 (전각/반각 통일, 대소문자 무시, 공백/기호 제거)"""
+    return "".join(char for char in unicodedata.normalize("NFKC", text).casefold() if char.isalnum())
+
+
+def _words(text: str) -> list[str]:
+    words = ["".join(char for char in word if char.isalnum()) for word in unicodedata.normalize("NFKC", text).split()]
+    return [word.casefold() for word in words if word]
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+class SymbolSearchIndex:
+    def __init__(self, symbols: Iterable[Symbol]):
+        """종목 검색 색인
+
+        Args:
+            symbols (Iterable[Symbol]): 검색 대상 종목, 같은 순위 안에서는 먼저 나온 종목이 우선
+
+        Example:
+            >>> index = SymbolSearchIndex(MasterCache().load("NAS"))
+            >>> [symbol.symbol for symbol in index.search("apple", limit=3)]
+            ['AAPL', ...]
+        """
+        self._symbols = list(symbols)
+        self._names: list[str] = []
+
+        symbol_terms: list[tuple[str, int]] = []
+        name_terms: list[tuple[str, int]] = []
+        postings: dict[str, array] = {}
+        for i, symbol in enumerate(self._symbols):
+            symbol_terms.append((normalize(symbol.symbol), i))
+            names = [normalize(symbol.korean_name), normalize(symbol.english_name)]
+            self._names.append(" ".join(names))
+
+            terms = {name for name in names if name}
+            terms.update(_words(symbol.korean_name))
+            terms.update(_words(symbol.english_name))
+            name_terms.extend((term, i) for term in terms)
+
+            for bigram in _bigrams(names[0]) | _bigrams(names[1]):
+                postings.setdefault(bigram, array("I")).append(i)
+
+        symbol_terms.sort()
+        name_terms.sort()
+        self._symbol_terms = [term for term, _ in symbol_terms]
+        self._symbol_ids = array("I", [i for _, i in symbol_terms])
+        self._name_terms = [term for term, _ in name_terms]
+        self._name_ids = array("I", [i for _, i in name_terms])
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def search(self, query: str, limit: int = 10) -> list[Symbol]:
+        """종목 검색
+
+        Args:
+            query (str): 검색어 (종목코드, 한글 이름, 영문 이름의 앞부분 또는 일부)
+            limit (int): 최대 결과 수
+
+        Returns:
+            list[Symbol]: 검색 결과, 종목코드 일치 > 종목코드 앞부분 > 이름 앞부분 > 이름 일부 순
+        """
+        term = normalize(query)
+        if not term or limit <= 0:
+            return []
+
+        # 순위가 높은 방식부터 찾으므로 찾은 순서가 곧 순위
+        # (종목코드 앞부분 일치 중에서는 종목코드가 정확히 일치하는 종목이 가장 먼저 나옴)
+        found: dict[int, None] = {}
+        for ids in (
+            self._prefix(self._symbol_terms, self._symbol_ids, term),
+            self._prefix(self._name_terms, self._name_ids, term),
+            self._substring(term),
+        ):
+            for i in ids:
+                found[i] = None
+                if len(found) >= limit:
+                    return [self._symbols[i] for i in found]
+        return [self._symbols[i] for i in found]
+
+    @staticmethod
+    def _prefix(terms: list[str], ids: array, prefix: str) -> Iterator[int]:
+        for position in range(bisect_left(terms, prefix), len(terms)):
+            if not terms[position].startswith(prefix):
+                return
+            yield ids[position]
+
+    def _substring(self, term: str) -> Iterator[int]:
+        bigrams = _bigrams(term)
+        if not bigrams:
+            return
+        # 가장 짧은 2-gram 목록의 종목만 확인 (필요한 개수를 찾으면 호출자가 중단)
+        candidates = min((self._postings.get(bigram, array("I")) for bigram in bigrams), key=len)
+        for i in candidates:
+            if term in self._names[i]:
+                yield i
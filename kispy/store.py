@@ -0,0 +1,67 @@
+"""로컬 시세 저장소
+- 종목별 JSON Lines 파일에 OHLCV를 추가 기록
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+from kispy.models.market import OHLCV
+
+
+class BarStore:
+    """종목별 OHLCV를 `{directory}/{symbol}.jsonl` 파일에 추가 기록하는 저장소
+
+    같은 일시의 시세가 여러 번 기록되면 마지막에 기록된 값을 사용하므로,
+    중단 후 재개하면서 같은 페이지를 다시 기록해도 안전합니다.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self._directory, f"{symbol}.jsonl")
+
+    def append(self, symbol: str, bars: list[OHLCV]) -> None:
+        if not bars:
+            return
+
+        lines = "".join(bar.model_dump_json() + "\n" for bar in bars)
+        with self._lock, open(self._path(symbol), "a+b") as f:
+            # 비정상 종료로 마지막 줄이 잘린 경우 새 줄에서 이어서 기록
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    lines = "\n" + lines
+            f.write(lines.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read(self, symbol: str) -> list[OHLCV]:
+        """시간순으로 정렬된 OHLCV (중복 일시 제거)"""
+        path = self._path(symbol)
+        if not os.path.exists(path):
+            return []
+
+        bars: dict[datetime, OHLCV] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    bar = OHLCV.model_validate(json.loads(line))
+                except ValueError:
+                    # 비정상 종료로 마지막 줄이 잘린 경우
+                    continue
+                bars[bar.date] = bar
+        return [bars[date] for date in sorted(bars)]
+
+    def last_date(self, symbol: str) -> datetime | None:
+        bars = self.read(symbol)
+        return bars[-1].date if bars else None
+
+    def symbols(self) -> list[str]:
+        return sorted(name[: -len(".jsonl")] for name in os.listdir(self._directory) if name.endswith(".jsonl"))
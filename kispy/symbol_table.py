@@ -0,0 +1,194 @@
+"""종목 테이블 파일
+- 종목 마스터를 종목코드 순으로 정렬한 고정 길이 레코드와 문자열 영역으로 저장
+- mmap으로 읽기 전용으로 열어 여러 프로세스가 같은 물리 메모리를 공유
+- 파일을 열 때 헤더만 읽고, 조회는 레코드 배열에 대한 이진 탐색 (O(log n))
+
+파일 구조:
+    [파일 헤더 16바이트] [레코드 58바이트 * n] [문자열 영역]
+    레코드 = symbol(16) exchange_code(4) currency(4) float_position(1)
+             realtime_symbol/tick_size_type/korean_name/english_name/market (문자열 영역 offset, length)
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+
+from kispy.constants import ExchangeCode
+from kispy.models.market import Symbol
+
+MAGIC = b"KISSYMT\x00"
+VERSION = 3
+
+_FILE_HEADER = struct.Struct("<8sHxxI")
+_STRING_FIELDS = ("realtime_symbol", "tick_size_type", "korean_name", "english_name", "market")
+_RECORD = struct.Struct("<16s4s4sB3x" + "IH" * len(_STRING_FIELDS))
+_KEY_SIZE = 16
+
+
+def _encode(value: str, size: int, field: str) -> bytes:
+    encoded = value.encode("utf-8")
+    if len(encoded) > size:
+        raise ValueError(f"{field} too long: {value}")
+    return encoded
+
+
+def compile_symbol_table(path: str, symbols: Iterable[Symbol]) -> int:
+    """종목 테이블 파일 생성 (임시 파일에 기록한 뒤 교체하므로 열려 있는 테이블에는 영향 없음)
+
+    Args:
+        path (str): 종목 테이블 파일 경로
+        symbols (Iterable[Symbol]): 종목 목록, 같은 종목코드가 여러 개면 먼저 나온 종목이 우선
+
+    Returns:
+        int: 기록한 종목 수
+
+    Raises:
+        ValueError: 종목코드가 16바이트, 거래소코드/통화가 4바이트를 넘는 경우
+    """
+    entries = sorted(
+        ((_encode(symbol.symbol, _KEY_SIZE, "Symbol"), order, symbol) for order, symbol in enumerate(symbols)),
+        key=lambda entry: (entry[0], entry[1]),
+    )
+
+    strings = bytearray()
+    string_offsets: dict[str, int] = {}
+
+    def add_string(value: str) -> tuple[int, int]:
+        encoded = value.encode("utf-8")
+        if value not in string_offsets:
+            string_offsets[value] = len(strings)
+            strings.extend(encoded)
+        return string_offsets[value], len(encoded)
+
+    records = bytearray()
+    for key, _, symbol in entries:
+        records += _RECORD.pack(
+            key,
+            _encode(symbol.exchange_code, 4, "Exchange code"),
+            _encode(symbol.currency, 4, "Currency"),
+            symbol.float_position,
+            *(value for field in _STRING_FIELDS for value in add_string(getattr(symbol, field))),
+        )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(_FILE_HEADER.pack(MAGIC, VERSION, len(entries)))
+        f.write(records)
+        f.write(strings)
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+class SymbolTable:
+    """mmap으로 연 읽기 전용 종목 테이블
+
+    SymbolRegistry와 같은 방식으로 조회할 수 있어 KisClientV2의 종목 조회기로 사용할 수 있습니다.
+
+    Example:
+        >>> MasterCache().build_symbol_table("US", "us.symtab")  # 한 번만 생성
+        >>> with SymbolTable("us.symtab") as table:  # 각 프로세스에서 열기
+        ...     table["AAPL"].exchange_code
+        'NAS'
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._open()
+
+    def _open(self) -> None:
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _FILE_HEADER.unpack_from(self._mmap, 0)
+        self._count: int = count
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Invalid symbol table: {self.path}")
+        self._strings = _FILE_HEADER.size + self._count * _RECORD.size
+
+    def __enter__(self) -> "SymbolTable":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key(self, index: int) -> bytes:
+        offset = _FILE_HEADER.size + index * _RECORD.size
+        return self._mmap[offset : offset + _KEY_SIZE]
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._key(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _symbol(self, index: int) -> Symbol:
+        key, exchange_code, currency, float_position, *string_fields = _RECORD.unpack_from(
+            self._mmap, _FILE_HEADER.size + index * _RECORD.size
+        )
+        strings = {}
+        for i, field in enumerate(_STRING_FIELDS):
+            start = self._strings + string_fields[i * 2]
+            strings[field] = self._mmap[start : start + string_fields[i * 2 + 1]].decode("utf-8")
+        return Symbol(
+            symbol=key.rstrip(b"\x00").decode("utf-8"),
+            exchange_code=exchange_code.rstrip(b"\x00").decode("ascii"),
+            currency=currency.rstrip(b"\x00").decode("ascii"),
+            float_position=float_position,
+            **strings,
+        )
+
+    def get(self, symbol: str, exchange_code: ExchangeCode | None = None) -> Symbol | None:
+        """종목 조회
+
+        Args:
+            symbol (str): 종목코드
+            exchange_code (ExchangeCode | None): 거래소코드, 지정하면 해당 거래소의 종목만 조회
+
+        Returns:
+            Symbol | None: 종목, 없으면 None
+        """
+        key = symbol.encode("utf-8")
+        if len(key) > _KEY_SIZE:
+            return None
+        key = key.ljust(_KEY_SIZE, b"\x00")
+
+        index = self._lower_bound(key)
+        while index < self._count and self._key(index) == key:
+            market_symbol = self._symbol(index)
+            if exchange_code is None or market_symbol.exchange_code == exchange_code:
+                return market_symbol
+            index += 1
+        return None
+
+    def __iter__(self) -> Iterator[Symbol]:
+        """모든 종목 (종목코드 순서)"""
+        for index in range(self._count):
+            yield self._symbol(index)
+
+    def clear(self) -> None:
+        """종목 테이블 파일을 다시 열어 새로 생성된 테이블을 반영"""
+        self.close()
+        self._open()
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __getitem__(self, symbol: str) -> Symbol:
+        market_symbol = self.get(symbol)
+        if market_symbol is None:
+            raise KeyError(symbol)
+        return market_symbol
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and self.get(symbol) is not None
@@ -1,63 +1,258 @@
 import csv
 import io
+import sys
+import tempfile
 import zipfile
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import IO
 
 import requests
 
-from kispy.constants import ExchangeCode, Nation, NationExchangeCodeMap
+from kispy.constants import (
+    DOMESTIC_EXCHANGE_CODE,
+    DOMESTIC_MARKETS,
+    DomesticMarket,
+    ExchangeCode,
+    Nation,
+    NationExchangeCodeMap,
+)
 from kispy.models.market import Symbol
 
+OVERSEAS_MASTER_COLUMNS = [
+    "national_code",  # 국가코드
+    "exchange_id",  # 거래소 코드
+    "exchange_code",  # 거래소 코드
+    "exchange_name",  # 거래소 이름
+    "symbol",  # 심볼
+    "realtime_symbol",  # 실시간 심볼
+    "korean_name",  # 한글 이름
+    "english_name",  # 영어 이름
+    "security_type",  # 종목 유형 (1:지수, 2:주식, 3:ETP(ETF), 4:레버리지/언더라이트)
+    "currency",  # 통화
+    "float_position",  # 부동 소수점 위치
+    "data_type",  # 데이터 유형
+    "base_price",  # 기준 가격
+    "bid_order_size",  # 매수 주문 크기
+    "ask_order_size",  # 매도 주문 크기
+    "market_start_time",  # 시장 시작 시간
+    "market_end_time",  # 시장 종료 시간
+    "dr_yn",  # DR 여부(Y/N)
+    "dr_nation_code",  # DR 국가코드
+    "industry_classification_code",  # 업종분류코드
+    "index_constituent_existence",  # 지수구성종목 존재 여부(0:구성종목없음,1:구성종목있음)
+    "tick_size_type",  # Tick size Type
+    "classification_code",  # 구분코드(001:ETF,002:ETN,003:ETC,004:Others,005:VIX Underlying ETF,006:VIX Underlying ETN)  # noqa: E501
+    "tick_size_type_detail",  # Tick size type 상세
+]
+
+# Symbol을 만드는 데 필요한 컬럼
+SYMBOL_COLUMNS = [
+    "symbol",
+    "exchange_code",
+    "realtime_symbol",
+    "currency",
+    "float_position",
+    "tick_size_type",
+    "korean_name",
+    "english_name",
+]
+
+# 국내주식 종목 마스터 각 줄 끝의 고정 길이 부분 (종목 속성), 앞부분은 단축코드(9) + 표준코드(12) + 한글명
+DOMESTIC_MASTER_TAIL_LENGTH: dict[DomesticMarket, int] = {"KOSPI": 228, "KOSDAQ": 222}
+
+SPOOL_MAX_SIZE = 4 * 1024 * 1024  # 다운로드한 마스터 파일을 메모리에 보관할 최대 크기
+
+
+def get_overseas_master_url(exchange_code: ExchangeCode) -> str:
+    return f"https://new.real.download.dws.co.kr/common/master/{exchange_code.lower()}mst.cod.zip"
+
+
+def download_master(url: str, headers: dict | None = None) -> tuple[requests.Response, IO[bytes]]:
+    """마스터 파일을 청크 단위로 받아 임시 파일에 기록 (SPOOL_MAX_SIZE 이하면 메모리에 보관)
+
+    Returns:
+        tuple[requests.Response, IO[bytes]]: 응답과 처음 위치로 되돌린 파일, 파일은 호출자가 닫아야 함
+    """
+    resp = requests.get(url, headers=headers, stream=True)
+    file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    if resp.status_code == 200:
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            file.write(chunk)
+        file.seek(0)
+    return resp, file
+
 
 def get_overseas_master_data(exchange_code: ExchangeCode) -> list[dict]:
-    url = f"https://new.real.download.dws.co.kr/common/master/{exchange_code.lower()}mst.cod.zip"
-    resp = requests.get(url)
-
-    columns = [
-        "national_code",  # 국가코드
-        "exchange_id",  # 거래소 코드
-        "exchange_code",  # 거래소 코드
-        "exchange_name",  # 거래소 이름
-        "symbol",  # 심볼
-        "realtime_symbol",  # 실시간 심볼
-        "korean_name",  # 한글 이름
-        "english_name",  # 영어 이름
-        "security_type",  # 종목 유형 (1:지수, 2:주식, 3:ETP(ETF), 4:레버리지/언더라이트)
-        "currency",  # 통화
-        "float_position",  # 부동 소수점 위치
-        "data_type",  # 데이터 유형
-        "base_price",  # 기준 가격
-        "bid_order_size",  # 매수 주문 크기
-        "ask_order_size",  # 매도 주문 크기
-        "market_start_time",  # 시장 시작 시간
-        "market_end_time",  # 시장 종료 시간
-        "dr_yn",  # DR 여부(Y/N)
-        "dr_nation_code",  # DR 국가코드
-        "industry_classification_code",  # 업종분류코드
-        "index_constituent_existence",  # 지수구성종목 존재 여부(0:구성종목없음,1:구성종목있음)
-        "tick_size_type",  # Tick size Type
-        "classification_code",  # 구분코드(001:ETF,002:ETN,003:ETC,004:Others,005:VIX Underlying ETF,006:VIX Underlying ETN)  # noqa: E501
-        "tick_size_type_detail",  # Tick size type 상세
+    resp, file = download_master(get_overseas_master_url(exchange_code))
+    with file:
+        resp.raise_for_status()
+        return parse_overseas_master_data(file, exchange_code)
+
+
+def parse_overseas_master_data(source: bytes | IO[bytes], exchange_code: ExchangeCode) -> list[dict]:
+    """해외주식 종목 마스터 파일(zip)의 모든 컬럼을 파싱"""
+    with _open_master(source, exchange_code) as text:
+        reader = csv.DictReader(text, fieldnames=OVERSEAS_MASTER_COLUMNS, delimiter="\t")
+        return list(reader)
+
+
+def iter_overseas_master_rows(
+    source: bytes | IO[bytes],
+    exchange_code: ExchangeCode,
+    columns: Sequence[str],
+) -> Iterator[tuple[str, ...]]:
+    """해외주식 종목 마스터 파일(zip)을 한 줄씩 읽어 요청한 컬럼만 반환
+
+    Args:
+        source (bytes | IO[bytes]): 마스터 파일(zip) 내용 또는 파일
+        exchange_code (ExchangeCode): 거래소코드
+        columns (Sequence[str]): 읽을 컬럼 (OVERSEAS_MASTER_COLUMNS 중 일부)
+
+    Yields:
+        tuple[str, ...]: columns 순서의 값
+    """
+    indices = [OVERSEAS_MASTER_COLUMNS.index(column) for column in columns]
+    width = max(indices) + 1
+    with _open_master(source, exchange_code) as text:
+        for row in csv.reader(text, delimiter="\t"):
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            yield tuple(row[index] for index in indices)
+
+
+def parse_overseas_symbols(source: bytes | IO[bytes], exchange_code: ExchangeCode) -> list[Symbol]:
+    """해외주식 종목 마스터 파일(zip)에서 Symbol에 필요한 컬럼만 읽어 변환
+
+    Note:
+        - 파일 전체를 dict로 만들지 않고 한 줄씩 필요한 컬럼만 남기므로 최대 메모리 사용량이 크게 줄어듭니다.
+        - 거래소코드/통화처럼 반복되는 값은 하나의 문자열을 공유합니다.
+    """
+    return [
+        Symbol(
+            symbol=symbol,
+            exchange_code=sys.intern(code),  # type: ignore[arg-type]
+            realtime_symbol=realtime_symbol,
+            currency=sys.intern(currency),
+            float_position=int(float_position or 0),
+            tick_size_type=sys.intern(tick_size_type),
+            korean_name=korean_name,
+            english_name=english_name,
+        )
+        for (
+            symbol,
+            code,
+            realtime_symbol,
+            currency,
+            float_position,
+            tick_size_type,
+            korean_name,
+            english_name,
+        ) in iter_overseas_master_rows(source, exchange_code, SYMBOL_COLUMNS)
     ]
 
-    with zipfile.ZipFile(io.BytesIO(resp.content)) as zip_file:
-        with zip_file.open(f"{exchange_code}mst.cod".upper()) as file:
-            text = io.TextIOWrapper(file, encoding="cp949")
-            reader = csv.DictReader(text, fieldnames=columns, delimiter="\t")
-            return list(reader)
+
+def get_overseas_symbols(exchange_code: ExchangeCode) -> list[Symbol]:
+    resp, file = download_master(get_overseas_master_url(exchange_code))
+    with file:
+        resp.raise_for_status()
+        return parse_overseas_symbols(file, exchange_code)
+
+
+def get_domestic_master_url(market: DomesticMarket) -> str:
+    return f"https://new.real.download.dws.co.kr/common/master/{market.lower()}_code.mst.zip"
+
+
+def parse_domestic_symbols(source: bytes | IO[bytes], market: DomesticMarket) -> list[Symbol]:
+    """국내주식 종목 마스터 파일(zip)에서 단축코드와 한글명을 읽어 변환
+
+    Note:
+        - 각 줄은 단축코드(9) + 표준코드(12) + 한글명 + 고정 길이 종목 속성으로 구성됩니다.
+        - 실시간 시세의 종목코드(tr_key)는 단축코드와 같습니다.
+    """
+    tail_length = DOMESTIC_MASTER_TAIL_LENGTH[market]
+    symbols = []
+    with zipfile.ZipFile(io.BytesIO(source) if isinstance(source, bytes) else source) as zip_file:
+        with zip_file.open(f"{market.lower()}_code.mst") as file:
+            for row in io.TextIOWrapper(file, encoding="cp949"):
+                head = row[: len(row) - tail_length]
+                symbol = head[0:9].rstrip()
+                if not symbol:
+                    continue
+                symbols.append(
+                    Symbol(
+                        symbol=symbol,
+                        exchange_code=DOMESTIC_EXCHANGE_CODE,
+                        realtime_symbol=symbol,
+                        currency="KRW",
+                        korean_name=head[21:].strip(),
+                        market=market,
+                    )
+                )
+    return symbols
+
+
+def get_domestic_symbols(market: DomesticMarket) -> list[Symbol]:
+    resp, file = download_master(get_domestic_master_url(market))
+    with file:
+        resp.raise_for_status()
+        return parse_domestic_symbols(file, market)
+
+
+def get_symbols(exchange_code: ExchangeCode) -> list[Symbol]:
+    """거래소 종목 마스터 다운로드 (국내주식은 코스피와 코스닥을 동시에 다운로드하여 병합)"""
+    if exchange_code != DOMESTIC_EXCHANGE_CODE:
+        return get_overseas_symbols(exchange_code)
+
+    with ThreadPoolExecutor(max_workers=len(DOMESTIC_MARKETS)) as executor:
+        shards = list(executor.map(get_domestic_symbols, DOMESTIC_MARKETS))
+    return [symbol for symbols in shards for symbol in symbols]
 
 
 def get_symbol_map(nation: Nation) -> dict[str, Symbol]:
+    """국가의 모든 거래소 종목 마스터를 동시에 다운로드하여 병합"""
+    exchange_codes = NationExchangeCodeMap[nation]
+    with ThreadPoolExecutor(max_workers=len(exchange_codes)) as executor:
+        shards = list(executor.map(get_symbols, exchange_codes))
+
     symbol_map: dict[str, Symbol] = {}
-    for exchange_code in NationExchangeCodeMap[nation]:
-        master_data = get_overseas_master_data(exchange_code)
-        symbol_map.update(
-            {
-                data["symbol"]: Symbol(
-                    symbol=data["symbol"],
-                    exchange_code=data["exchange_code"],
-                    realtime_symbol=data["realtime_symbol"],
-                )
-                for data in master_data
-            }
-        )
+    for symbols in shards:
+        symbol_map.update({symbol.symbol: symbol for symbol in symbols})
     return symbol_map
+
+
+def to_symbols(master_data: list[dict]) -> list[Symbol]:
+    return [
+        Symbol(
+            symbol=data["symbol"],
+            exchange_code=data["exchange_code"],
+            realtime_symbol=data["realtime_symbol"],
+            currency=data["currency"],
+            float_position=int(data["float_position"] or 0),
+            tick_size_type=data["tick_size_type"],
+            korean_name=data["korean_name"],
+            english_name=data["english_name"],
+        )
+        for data in master_data
+    ]
+
+
+def parse_compact_datetime(date: str, time: str) -> datetime:
+    """YYYYMMDD, HHMMSS 문자열을 datetime으로 변환 (실시간 데이터처럼 많은 건을 변환할 때 strptime보다 빠름)"""
+    return datetime(int(date[:4]), int(date[4:6]), int(date[6:8]), int(time[:2]), int(time[2:4]), int(time[4:6]))
+
+
+class _open_master:
+    """마스터 zip 안의 .cod 파일을 텍스트로 여는 컨텍스트 매니저"""
+
+    def __init__(self, source: bytes | IO[bytes], exchange_code: ExchangeCode):
+        self._zip_file = zipfile.ZipFile(io.BytesIO(source) if isinstance(source, bytes) else source)
+        self._file = self._zip_file.open(f"{exchange_code}mst.cod".upper())
+
+    def __enter__(self) -> io.TextIOWrapper:
+        return io.TextIOWrapper(self._file, encoding="cp949")
+
+    def __exit__(self, *args: object) -> None:
+        self._file.close()
+        self._zip_file.close()
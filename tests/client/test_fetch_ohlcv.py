@@ -62,3 +62,10 @@ def test_fetch_ohlcv_by_minute_with_limit(auth: KisAuth):
     client = KisClientV2(auth, "US")
     resp = client.fetch_ohlcv("AAPL", None, None, "1m", limit=240)
     assert len(resp) == 240
+
+
+def test_fetch_ohlcv_domestic(auth: KisAuth):
+    client = KisClientV2(auth)
+    resp = client.fetch_ohlcv("005930", "2024-01-01", "2024-01-31", "d")
+    assert len(resp) == 21
+    assert resp[0].date == datetime(2024, 1, 2)
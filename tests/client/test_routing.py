@@ -0,0 +1,267 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_mock import MockerFixture
+
+from kispy.auth import KisAuth
+from kispy.client import KisClientV2
+from kispy.models.account import Balance
+from kispy.models.market import Symbol
+from kispy.symbol_table import SymbolTable, compile_symbol_table
+
+
+def test_route_domestic_and_overseas_symbols(mocker: MockerFixture, tmp_path):
+    path = str(tmp_path / "all.symtab")
+    compile_symbol_table(
+        path,
+        [
+            Symbol(symbol="005930", exchange_code="KRX", realtime_symbol="005930", currency="KRW", market="KOSPI"),
+            Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL", currency="USD"),
+        ],
+    )
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth, symbol_table=SymbolTable(path))
+    domestic_price = mocker.patch.object(client.client.domestic_stock.quote, "get_price", return_value=71000.0)
+    overseas_price = mocker.patch.object(client.client.overseas_stock.quote, "get_price", return_value="190.5")
+    domestic_sell = mocker.patch.object(
+        client.client.domestic_stock.order,
+        "sell",
+        return_value={"rt_cd": "0", "output": {"ODNO": "0001", "KRX_FWDG_ORD_ORGNO": "91252", "ORD_TMD": "090000"}},
+    )
+    domestic_cancel = mocker.patch.object(client.client.domestic_stock.order, "cancel", return_value={"ODNO": "0002"})
+    domestic_update = mocker.patch.object(
+        client.client.domestic_stock.order, "update", return_value={"ODNO": "0004", "KRX_FWDG_ORD_ORGNO": "91252"}
+    )
+    inquire_order = mocker.patch.object(
+        client.client.domestic_stock.order, "inquire_order", return_value={"odno": "0003", "ord_gno_brno": "06010"}
+    )
+
+    assert client.get_symbol("005930").currency == "KRW"
+    assert client.get_price("005930") == "71000.0"
+    assert client.get_price("AAPL") == "190.5"
+    assert client.create_order("005930", "sell", "71000", 1) == "0001"
+    # 국내주식 취소는 주문조직번호가 필요: 접수한 주문은 주문 응답, 그 밖의 주문은 오늘 주문체결내역에서 조회
+    assert client.cancel_order("005930", "0001") == "0002"
+    client.cancel_order("005930", "0003")
+    assert domestic_cancel.call_args_list == [mocker.call("0001", "91252"), mocker.call("0003", "06010")]
+    inquire_order.assert_called_once_with("0003")
+
+    # 국내주식 정정: 정정 주문도 주문조직번호를 기억해 이어서 정정/취소 가능
+    assert client.edit_order("005930", "0001", "70900", 1) == "0004"
+    domestic_update.assert_called_once_with("0001", "91252", 1, "70900")
+    client.cancel_order("005930", "0004")
+    assert domestic_cancel.call_args_list[-1] == mocker.call("0004", "91252")
+    inquire_order.return_value = None
+    with pytest.raises(ValueError):
+        client.edit_order("005930", "9999", "70900", 1)
+    assert client.get_prices(["AAPL", "005930"]) == {"AAPL": "190.5", "005930": "71000.0"}
+    assert client.get_prices([]) == {}
+
+    assert domestic_price.call_args_list == [mocker.call("005930")] * 2
+    assert overseas_price.call_args_list == [mocker.call("AAPL", "NAS")] * 2
+    domestic_sell.assert_called_once_with(stock_code="005930", quantity=1, price="71000")
+
+
+def test_fetch_positions_and_pending_orders_across_exchanges(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth, nation="US")
+    position = {
+        "ovrs_pdno": "AAPL",
+        "ovrs_item_name": "APPLE INC",
+        "ord_psbl_qty": "3",
+        "ovrs_cblc_qty": "3",
+        "pchs_avg_pric": "180",
+        "frcr_evlu_pfls_amt": "3",
+        "evlu_pfls_rt": "0.5",
+        "now_pric2": "181",
+        "ovrs_stck_evlu_amt": "543",
+        "ovrs_excg_cd": "NASD",
+    }
+    pending = {
+        "odno": "0001",
+        "pdno": "AAPL",
+        "sll_buy_dvsn_cd_name": "02",
+        "ft_ord_unpr3": "180",
+        "ft_ord_qty": "2",
+        "ft_ccld_qty": "0",
+        "nccs_qty": "2",
+        "ft_ccld_unpr3": "0",
+        "ft_ccld_amt3": "0",
+        "ovrs_excg_cd": "NASD",
+    }
+    # 미국 거래소 조회는 미국 전체를 반환하므로 같은 종목/주문이 여러 번 포함되어도 한 번만 반환
+    inquire_balance = mocker.patch.object(
+        client.client.overseas_stock.account,
+        "inquire_balance",
+        side_effect=lambda exchange_code, currency: {"output1": [position] if exchange_code != "AMEX" else []},
+    )
+    inquire_nccs = mocker.patch.object(client.client.overseas_stock.account, "inquire_nccs", return_value=[pending])
+
+    positions = client.fetch_positions()
+    pending_orders = client.fetch_pending_orders()
+
+    assert [(p.symbol, p.exchange_code, p.currency) for p in positions] == [("AAPL", "NASD", "USD")]
+    assert [(o.order_id, o.exchange_code, o.currency) for o in pending_orders] == [("0001", "NASD", "USD")]
+    assert sorted(call.kwargs["exchange_code"] for call in inquire_balance.call_args_list) == ["AMEX", "NASD", "NYSE"]
+    assert sorted(call.args[0] for call in inquire_nccs.call_args_list) == ["AMEX", "NASD", "NYSE"]
+
+
+def test_fetch_account_summary_reuses_snapshot(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth, nation="US")
+    barrier = threading.Barrier(3, timeout=5)  # 세 조회가 동시에 실행되어야 통과
+
+    def balance(currency: str) -> Balance:
+        barrier.wait()
+        return Balance(
+            available_balance="100",
+            buyable_balance="100",
+            buyable_integrated_balance="200",
+            exchange_rate="1300",
+            currency="USD",
+        )
+
+    def empty(currency: str) -> list:
+        barrier.wait()
+        return []
+
+    mocker.patch.object(client, "fetch_balance", side_effect=balance)
+    positions = mocker.patch.object(client, "fetch_positions", side_effect=empty)
+    mocker.patch.object(client, "fetch_pending_orders", side_effect=empty)
+    clock = mocker.patch("kispy.client.time.monotonic", return_value=100.0)
+
+    summary = client.fetch_account_summary(max_age=5)
+    assert summary.total_balance == "100"
+    assert summary.snapshot_at is not None
+
+    clock.return_value = 104.0
+    assert client.fetch_account_summary(max_age=5) is summary
+    assert client.fetch_account_summary() is not summary  # 기본값은 항상 조회
+    assert client.fetch_account_summary(max_age=5, refresh=True) is not summary
+    assert positions.call_count == 3
+
+
+def test_fetch_account_summary_shares_in_flight_fetch(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth, nation="US")
+    release = threading.Event()
+
+    def balance(currency: str) -> Balance:
+        release.wait(5)
+        return Balance(
+            available_balance="100",
+            buyable_balance="100",
+            buyable_integrated_balance="200",
+            exchange_rate="1300",
+            currency="USD",
+        )
+
+    fetch_balance = mocker.patch.object(client, "fetch_balance", side_effect=balance)
+    mocker.patch.object(client, "fetch_positions", return_value=[])
+    mocker.patch.object(client, "fetch_pending_orders", return_value=[])
+
+    # max_age=0이어도 진행 중인 조회가 있으면 결과를 기다려 공유
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first = executor.submit(client.fetch_account_summary)
+        while not client._account_summary_fetch:
+            time.sleep(0.001)
+        others = [executor.submit(client.fetch_account_summary, 0.0, True) for _ in range(2)]
+        time.sleep(0.05)
+        release.set()
+        summaries = [first.result(), *(other.result() for other in others)]
+
+    assert summaries[1] is summaries[0] and summaries[2] is summaries[0]
+    assert fetch_balance.call_count == 1
+
+
+def test_fetch_account_summaries_per_currency(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth)
+
+    def psamount(symbol: str, exchange_code: str) -> dict:
+        currency = {"NASD": "USD", "SEHK": "HKD", "SHAA": "CNY", "TKSE": "JPY", "VNSE": "VND"}[exchange_code]
+        return {
+            "ord_psbl_frcr_amt": "10",
+            "ovrs_ord_psbl_amt": "10",
+            "frcr_ord_psbl_amt1": "10",
+            "exrt": "1",
+            "tr_crcy_cd": currency,
+        }
+
+    def balance(exchange_code: str, currency: str) -> dict:
+        if exchange_code not in ("NASD", "SEHK"):
+            return {"output1": []}
+        symbol, value = ("AAPL", "543") if exchange_code == "NASD" else ("00700", "3000")
+        position = {
+            "ovrs_pdno": symbol,
+            "ovrs_item_name": symbol,
+            "ord_psbl_qty": "3",
+            "ovrs_cblc_qty": "3",
+            "pchs_avg_pric": "100",
+            "frcr_evlu_pfls_amt": "0",
+            "evlu_pfls_rt": "0",
+            "now_pric2": "100",
+            "ovrs_stck_evlu_amt": value,
+            "ovrs_excg_cd": exchange_code,
+        }
+        return {"output1": [position]}
+
+    mocker.patch.object(client.client.overseas_stock.account, "inquire_psamount", side_effect=psamount)
+    mocker.patch.object(client.client.overseas_stock.account, "inquire_balance", side_effect=balance)
+    mocker.patch.object(client.client.overseas_stock.account, "inquire_nccs", return_value=[])
+    inquire_psbl_order = mocker.patch.object(
+        client.client.domestic_stock.order,
+        "inquire_psbl_order",
+        return_value={"ord_psbl_cash": "50000", "nrcvb_buy_amt": "49000", "max_buy_amt": "49000"},
+    )
+
+    # 국가가 정해지지 않은 클라이언트는 통화를 지정해야 함 (다른 통화를 더하지 않음)
+    with pytest.raises(ValueError):
+        client.fetch_balance()
+    with pytest.raises(ValueError):
+        client.fetch_account_summary()
+
+    krw = client.fetch_balance("KRW")
+    assert (krw.currency, krw.available_balance) == ("KRW", "50000")
+    inquire_psbl_order.assert_called_once_with()
+
+    summaries = client.fetch_account_summaries()
+    assert set(summaries) == {"USD", "HKD", "CNY", "JPY", "VND"}
+    assert summaries["USD"].total_balance == "553"
+    assert [p.symbol for p in summaries["USD"].positions] == ["AAPL"]
+    assert summaries["HKD"].total_balance == "3010"
+    assert (summaries["JPY"].currency, summaries["JPY"].total_balance) == ("JPY", "10")
+
+
+def test_fetch_domestic_minute_bars_resampled(mocker: MockerFixture, tmp_path):
+    path = str(tmp_path / "kr.symtab")
+    compile_symbol_table(path, [Symbol(symbol="005930", exchange_code="KRX", realtime_symbol="005930", currency="KRW")])
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth, symbol_table=SymbolTable(path))
+
+    def minute(hhmm: str, high: str, low: str, volume: str) -> dict:
+        return {
+            "stck_bsop_date": "20240105",
+            "stck_cntg_hour": f"{hhmm}00",
+            "stck_oprc": low,
+            "stck_hgpr": high,
+            "stck_lwpr": low,
+            "stck_prpr": high,
+            "cntg_vol": volume,
+        }
+
+    # 최신순 1분봉
+    histories = [minute("0905", "71300", "71200", "5"), minute("0902", "71500", "71100", "3")]
+    histories += [minute("0901", "71400", "71000", "2"), minute("0900", "71200", "71000", "1")]
+    mocker.patch.object(
+        client.client.domestic_stock.quote, "get_stock_price_history_by_minute_range", return_value=histories
+    )
+
+    bars = client.fetch_ohlcv("005930", "2024-01-05", "2024-01-05", "3m")
+
+    assert [(bar.date.strftime("%H%M"), bar.open, bar.high, bar.low, bar.close, bar.volume) for bar in bars] == [
+        ("0900", "71000", "71500", "71000", "71500", "6"),
+        ("0903", "71200", "71300", "71200", "71300", "5"),
+    ]
@@ -5,6 +5,19 @@ import pytest
 from kispy.auth import KisAuth
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--benchmark", action="store_true", help="성능 테스트(benchmark)도 실행")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="성능 테스트는 --benchmark로 실행")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session")
 def auth():
     app_key = os.getenv("KISPY_APP_KEY")
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 
 from freezegun import freeze_time
+from pytest_mock import MockerFixture
 
 from kispy.auth import KisAuth
 from kispy.client import KisClient
@@ -119,3 +120,48 @@ def test_get_stock_price_history_by_minute_not_exists(auth: KisAuth):
     )
 
     assert resp == []
+
+
+def _daily_minute_response(date: str, times: list[str]) -> dict:
+    return {
+        "output2": [
+            {
+                "stck_bsop_date": date,
+                "stck_cntg_hour": time,
+                "stck_prpr": "1",
+                "stck_oprc": "1",
+                "stck_hgpr": "1",
+                "stck_lwpr": "1",
+                "cntg_vol": "1",
+            }
+            for time in times
+        ]
+    }
+
+
+def test_get_stock_price_history_by_minute_range(auth: KisAuth, mocker: MockerFixture):
+    """일자별 분봉을 나누어 조회한 뒤 시간순으로 병합"""
+    quote = KisClient(auth).domestic_stock.quote
+    mocker.patch.object(auth, "get_header", return_value={})
+
+    def request(method, url, headers, params):
+        date = params["FID_INPUT_DATE_1"]
+        if params["FID_INPUT_HOUR_1"] == "153000":
+            return mocker.Mock(json=_daily_minute_response(date, ["153000", "152900"]))
+        return mocker.Mock(json=_daily_minute_response(date, []))
+
+    mock_request = mocker.patch.object(quote, "_request", side_effect=request)
+
+    # 2024-01-05 (금) ~ 2024-01-08 (월), 주말 제외
+    resp = quote.get_stock_price_history_by_minute_range("005930", "2024-01-05", "2024-01-08")
+
+    assert [record["stck_cntg_hour"] for record in resp] == [
+        datetime(2024, 1, 5, 15, 29),
+        datetime(2024, 1, 5, 15, 30),
+        datetime(2024, 1, 8, 15, 29),
+        datetime(2024, 1, 8, 15, 30),
+    ]
+    assert {call.kwargs["params"]["FID_INPUT_DATE_1"] for call in mock_request.call_args_list} == {
+        "20240105",
+        "20240108",
+    }
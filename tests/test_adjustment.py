@@ -0,0 +1,93 @@
+from datetime import datetime
+from decimal import Decimal
+
+from pytest_mock import MockerFixture
+
+from kispy.adjustment import AdjustmentFactors, AdjustmentStore, infer_adjustment_events
+from kispy.auth import KisAuth
+from kispy.client import KisClientV2
+from kispy.models.market import OHLCV
+
+
+def _bar(day: int, close: str, volume: str = "100") -> OHLCV:
+    return OHLCV(date=datetime(2024, 1, day), open=close, high=close, low=close, close=close, volume=volume)
+
+
+# 2024-01-04에 2:1 분할
+unadjusted = [_bar(2, "200.00"), _bar(3, "210.00"), _bar(4, "105.00", "200"), _bar(5, "106.00", "200")]
+adjusted = [_bar(2, "100.00", "200"), _bar(3, "105.00", "200"), _bar(4, "105.00", "200"), _bar(5, "106.00", "200")]
+
+
+def test_infer_adjustment_events():
+    events = infer_adjustment_events(adjusted, unadjusted)
+
+    assert len(events) == 1
+    assert events[0].date == datetime(2024, 1, 4)
+    assert events[0].price_ratio == Decimal("0.5")
+    assert events[0].volume_ratio == Decimal("2")
+
+
+def test_infer_adjustment_events_ignores_rounding():
+    rounded = [_bar(2, "100.01", "200"), _bar(3, "105.00", "200"), _bar(4, "105.00", "200"), _bar(5, "106.00", "200")]
+
+    events = infer_adjustment_events(rounded, unadjusted)
+
+    assert len(events) == 1
+
+
+def test_infer_adjustment_events_ignores_tick_rounding_on_low_prices():
+    # 배당으로 0.95배 조정된 저가 종목, 수정주가는 1원 단위로 반올림 (2024-01-04에 2:1 분할)
+    raw = [_bar(2, "202"), _bar(3, "206"), _bar(4, "99", "200"), _bar(5, "100", "200")]
+    rounded = [_bar(2, "96", "200"), _bar(3, "98", "200"), _bar(4, "94", "200"), _bar(5, "95", "200")]
+
+    events = infer_adjustment_events(rounded, raw)
+
+    assert [(event.date, event.volume_ratio) for event in events] == [(datetime(2024, 1, 4), Decimal("2"))]
+    assert abs(events[0].price_ratio - Decimal("0.5")) < Decimal("0.01")
+
+
+def test_adjust_and_unadjust():
+    factors = AdjustmentFactors(symbol="AAPL", events=infer_adjustment_events(adjusted, unadjusted))
+
+    assert factors.adjust(unadjusted) == adjusted
+    assert factors.unadjust(adjusted) == unadjusted
+
+
+def test_store_roundtrip(tmp_path):
+    store = AdjustmentStore(str(tmp_path))
+    factors = AdjustmentFactors(
+        symbol="AAPL",
+        events=infer_adjustment_events(adjusted, unadjusted),
+        start_date=datetime(2024, 1, 2),
+        as_of=datetime(2024, 1, 5),
+    )
+
+    store.save(factors)
+
+    assert store.load("AAPL") == factors
+    assert store.load("MSFT") is None
+
+
+def test_fetch_ohlcv_pair_incremental(auth: KisAuth, mocker: MockerFixture, tmp_path):
+    client = KisClientV2(auth, "US")
+    store = AdjustmentStore(str(tmp_path))
+
+    def fetch_ohlcv(symbol, start_date, end_date, period, is_adjust):
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        bars = adjusted if is_adjust else unadjusted
+        return [bar for bar in bars if bar.date >= start]
+
+    mock_fetch = mocker.patch.object(client, "fetch_ohlcv", side_effect=fetch_ohlcv)
+
+    result_adjusted, result_unadjusted = client.fetch_ohlcv_pair("AAPL", "2024-01-02", store=store)
+
+    assert result_adjusted == adjusted
+    assert result_unadjusted == unadjusted
+    assert mock_fetch.call_count == 2
+
+    # 저장된 조정계수를 사용하므로 새 시세가 없으면 원주가만 조회
+    mock_fetch.reset_mock()
+    result_adjusted, _ = client.fetch_ohlcv_pair("AAPL", "2024-01-02", "2024-01-03", store=store)
+
+    assert result_adjusted == adjusted[:2]
+    assert mock_fetch.call_count == 1
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta
+
 import pytest
 from pytest_mock import MockerFixture
 
@@ -80,3 +82,16 @@ def test_auth_get_token_short_interval(auth_api: KisAuth, mocker: MockerFixture)
         auth_api._get_token()
 
     assert "접근토큰 발급 잠시 후 다시 시도하세요(1분당 1회)" in str(e.value)
+
+
+def test_auth_refreshes_expired_approval_key(auth_api: KisAuth, mocker: MockerFixture):
+    """웹소켓 접속키는 유효기간(24시간)이 지나기 전에 새로 발급받는다."""
+    _patch_requests(mocker, 200, {"approval_key": "first"}, {})
+    assert auth_api.get_approval_key() == "first"
+
+    _patch_requests(mocker, 200, {"approval_key": "second"}, {})
+    assert auth_api.get_approval_key() == "first"
+
+    auth_api._approval_key = ("first", datetime.now() - timedelta(seconds=1))
+    assert auth_api.get_approval_key() == "second"
+    assert auth_api._approval_key[1] > datetime.now() + timedelta(hours=22)
@@ -0,0 +1,85 @@
+import threading
+from datetime import datetime
+
+from zoneinfo import ZoneInfo
+
+from kispy.bar_builder import BarBuilder
+from kispy.models.market import OHLCV, Symbol
+from kispy.models.realtime import SubscriptionResult, Trade
+
+AAPL = Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL")
+
+
+def _trade(hour: int, minute: int, second: int, price: str, volume: str = "1") -> Trade:
+    return Trade("HDFSCNT0", "AAPL", datetime(2024, 1, 5, hour, minute, second), price, volume, "0", "0", "0", "0")
+
+
+def _minute(minute: int, close: str, volume: str = "10") -> OHLCV:
+    return OHLCV(date=datetime(2024, 1, 5, 9, minute), open=close, high=close, low=close, close=close, volume=volume)
+
+
+def test_bar_builder_aggregates_trades_by_session():
+    builder = BarBuilder([AAPL], ["1m", "5m", "1h", "d"])
+
+    assert builder.on_trade(_trade(9, 0, 0, "100")) == []  # 정규장 전 체결 무시
+    assert builder.on_trade(_trade(9, 30, 10, "1")) == []
+    assert builder.on_trade(_trade(9, 30, 50, "3", "2")) == []
+    closed = builder.on_trade(_trade(9, 31, 5, "2"))
+
+    assert [(event.period, event.bar.date) for event in closed] == [("1m", datetime(2024, 1, 5, 9, 30))]
+    bar = closed[0].bar
+    assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == ("1", "3", "1", "3", "3")
+
+    hour = builder.current("AAPL", "1h")
+    assert hour is not None and hour.date == datetime(2024, 1, 5, 9, 30)  # 정규장 시작 기준
+    day = builder.current("AAPL", "d")
+    assert day is not None and (day.date, day.low, day.high, day.volume) == (datetime(2024, 1, 5), "1", "3", "4")
+
+    # 체결이 없어도 구간이 끝나면 완성
+    closed = builder.flush(datetime(2024, 1, 5, 9, 35, tzinfo=ZoneInfo("America/New_York")))
+    assert [(event.period, event.bar.date) for event in closed] == [
+        ("1m", datetime(2024, 1, 5, 9, 31)),
+        ("5m", datetime(2024, 1, 5, 9, 30)),
+    ]
+    assert builder.current("AAPL", "5m") is None
+
+
+def test_bar_builder_reconciles_after_reconnect():
+    minutes = [_minute(minute, str(minute)) for minute in range(30, 37)]
+    fetched = threading.Event()
+
+    def fetch_minute_bars(symbol: Symbol) -> list[OHLCV]:
+        fetched.wait(5)
+        return minutes
+
+    builder = BarBuilder([AAPL], ["1m", "5m"], fetch_minute_bars=fetch_minute_bars)
+    ack = SubscriptionResult(tr_id="HDFSCNT0", tr_key="DNASAAPL", success=True, message="SUBSCRIBE SUCCESS")
+
+    assert builder.on_event(ack) == []  # 첫 등록
+    builder.on_event(_trade(9, 30, 10, "30", "4"))
+
+    # 재접속 후 다시 등록: 1분봉 조회는 백그라운드에서 하므로 이벤트 처리를 막지 않음
+    assert builder.on_event(ack) == []
+    assert builder.on_event(ack) == []  # 조회 중에는 다시 조회하지 않음
+    assert builder.poll_reconciled() == []
+    fetched.set()
+    closed = builder.poll_reconciled(timeout=None)
+
+    assert [(event.period, event.bar.date.minute) for event in closed] == [
+        ("1m", 30),
+        ("1m", 31),
+        ("1m", 32),
+        ("1m", 33),
+        ("1m", 34),
+        ("1m", 35),
+        ("5m", 30),
+    ]
+    five = closed[-1].bar
+    assert (five.open, five.high, five.low, five.close, five.volume) == ("30", "34", "30", "34", "50")
+    current = builder.current("AAPL", "5m")
+    assert current is not None and (current.date.minute, current.close) == (35, "36")
+
+    # 보정 후 실시간 체결은 이어서 반영
+    closed = builder.on_event(_trade(9, 37, 0, "40"))
+    assert [(event.period, event.bar.date.minute) for event in closed] == [("1m", 36)]
+    builder.close()
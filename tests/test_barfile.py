@@ -0,0 +1,140 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from kispy.barfile import BarFile, append_bars, pack_store
+from kispy.models.market import OHLCV
+from kispy.store import BarStore
+
+
+def _bars(start: datetime, count: int) -> list[OHLCV]:
+    return [
+        OHLCV(
+            date=start + timedelta(minutes=i),
+            open=f"{185 + i * 0.01:.2f}",
+            high="186.5",
+            low="184.1234",
+            close="185",
+            volume=str(1000 + i),
+        )
+        for i in range(count)
+    ]
+
+
+def test_append_and_read(tmp_path):
+    path = str(tmp_path / "bars.kbar")
+    first = _bars(datetime(2024, 1, 2, 9, 30), 3)
+    second = _bars(datetime(2024, 1, 2, 9, 33), 2)
+
+    append_bars(path, "AAPL", first)
+    append_bars(path, "MSFT", first)
+    append_bars(path, "AAPL", second)
+
+    with BarFile(path) as bar_file:
+        assert bar_file.symbols() == ["AAPL", "MSFT"]
+        assert len(bar_file.chunks("AAPL")) == 2
+
+        bars = bar_file.read("AAPL")
+        assert [bar.date for bar in bars] == [bar.date for bar in first + second]
+        assert [(bar.open, bar.low, bar.volume) for bar in bars[:2]] == [
+            ("185.0000", "184.1234", "1000"),
+            ("185.0100", "184.1234", "1001"),
+        ]
+
+        chunk = bar_file.chunks("MSFT")[0]
+        assert chunk.scale == 4
+        assert list(chunk.timestamps) == [0, 60, 120]
+        assert chunk.volume.tolist() == [1000, 1001, 1002]
+
+
+def test_truncated_chunk_is_ignored(tmp_path):
+    path = str(tmp_path / "bars.kbar")
+    append_bars(path, "AAPL", _bars(datetime(2024, 1, 2), 3))
+    append_bars(path, "MSFT", _bars(datetime(2024, 1, 2), 3))
+    with open(path, "r+b") as f:
+        f.truncate(f.seek(0, 2) - 10)
+
+    with BarFile(path) as bar_file:
+        assert bar_file.symbols() == ["AAPL"]
+
+
+def test_append_after_torn_write(tmp_path):
+    path = str(tmp_path / "bars.kbar")
+    append_bars(path, "AAPL", _bars(datetime(2024, 1, 2), 3))
+    append_bars(path, "MSFT", _bars(datetime(2024, 1, 2), 3))
+    with open(path, "r+b") as f:
+        f.truncate(f.seek(0, 2) - 10)
+
+    append_bars(path, "NVDA", _bars(datetime(2024, 1, 2), 2))
+
+    with BarFile(path) as bar_file:
+        assert bar_file.symbols() == ["AAPL", "NVDA"]
+        assert len(bar_file.read("NVDA")) == 2
+
+
+def test_price_scale_limit(tmp_path):
+    bars = _bars(datetime(2024, 1, 2), 1)
+    bars[0].close = "185.123456789"
+
+    with pytest.raises(ValueError):
+        append_bars(str(tmp_path / "bars.kbar"), "AAPL", bars)
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "bars.kbar"
+    path.write_bytes(b"not a bar file..")
+
+    with pytest.raises(ValueError):
+        BarFile(str(path))
+
+
+def test_pack_store(tmp_path):
+    store = BarStore(str(tmp_path / "store"))
+    bars = _bars(datetime(2024, 1, 2), 3)
+    store.append("AAPL", bars)
+    path = str(tmp_path / "bars.kbar")
+
+    pack_store(store, path)
+    pack_store(store, path)  # 다시 변환해도 청크가 중복되지 않음
+
+    with BarFile(path) as bar_file:
+        assert len(bar_file.chunks("AAPL")) == 1
+        assert [bar.date for bar in bar_file.read("AAPL")] == [bar.date for bar in bars]
+
+
+def test_pack_store_splits_wide_ranges_and_writes_empty_file(tmp_path):
+    store = BarStore(str(tmp_path / "store"))
+    path = str(tmp_path / "bars.kbar")
+    pack_store(store, path)  # 종목이 없어도 빈 파일로 교체
+
+    with BarFile(path) as bar_file:
+        assert bar_file.symbols() == []
+
+    # 소수점 4자리 가격 범위가 int32를 넘으면 (약 21만) 청크를 나누어 기록
+    bars = _bars(datetime(2024, 1, 2), 3)
+    for bar, price in zip(bars, ["1.0001", "300000", "300001"], strict=True):
+        bar.open = bar.high = bar.low = bar.close = price
+    store.append("AAPL", bars)
+    store.append("MSFT", _bars(datetime(2024, 1, 2), 2))
+    pack_store(store, path)
+
+    with BarFile(path) as bar_file:
+        assert [chunk.count for chunk in bar_file.chunks("AAPL")] == [1, 2]
+        assert [bar.close for bar in bar_file.read("AAPL")] == ["1.0001", "300000.0000", "300001.0000"]
+        assert len(bar_file.read("MSFT")) == 2
+
+
+def test_open_performance(tmp_path):
+    """5,000 종목 파일을 여는 데 청크 헤더만 읽으므로 빠르게 열림"""
+    path = str(tmp_path / "bars.kbar")
+    bars = _bars(datetime(2024, 1, 2), 390)
+    for i in range(5000):
+        append_bars(path, f"S{i:05d}", bars[:10])
+
+    start = time.monotonic()
+    with BarFile(path) as bar_file:
+        assert len(bar_file.symbols()) == 5000
+    duration = time.monotonic() - start
+
+    assert duration < 0.5, "Opening 5,000 symbols should be quick"
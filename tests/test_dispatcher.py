@@ -0,0 +1,71 @@
+import queue
+import threading
+from datetime import datetime
+
+import pytest
+
+from kispy.dispatcher import RealtimeDispatcher
+from kispy.models.realtime import SubscriptionResult, Trade
+
+
+def _trade(symbol: str, price: str) -> Trade:
+    return Trade("HDFSCNT0", symbol, datetime(2024, 1, 5, 9, 30), price, "1", "1", "1", "1", "1")
+
+
+def _ack(tr_key: str) -> SubscriptionResult:
+    return SubscriptionResult(tr_id="HDFSCNT0", tr_key=tr_key, success=True, message="SUBSCRIBE SUCCESS")
+
+
+def test_overflow_policies():
+    dispatcher = RealtimeDispatcher()
+    dropping = dispatcher.subscribe("drop", maxsize=2, policy="drop_oldest")
+    conflating = dispatcher.subscribe("conflate", maxsize=2, policy="conflate")
+
+    for event in [_trade("AAPL", "1"), _trade("MSFT", "2"), _trade("AAPL", "3"), _ack("a"), _ack("b")]:
+        dispatcher.publish(event)
+
+    assert [event.tr_key for event in [dropping.get(), dropping.get()]] == ["a", "b"]  # type: ignore[attr-defined]
+    with pytest.raises(queue.Empty):
+        dropping.get(timeout=0)
+
+    # AAPL은 최신 값으로 합쳐지고, 합칠 수 없는 이벤트는 가득 차면 가장 오래된 이벤트를 밀어냄
+    assert [conflating.get().tr_key, conflating.get().tr_key] == ["a", "b"]  # type: ignore[attr-defined]
+    stats = {stats.name: stats for stats in dispatcher.stats()}
+    assert (stats["drop"].dropped, stats["drop"].delivered, stats["drop"].max_queued) == (3, 2, 2)
+    assert (stats["conflate"].conflated, stats["conflate"].dropped) == (1, 2)
+
+
+def test_conflate_keeps_latest_value_per_symbol():
+    dispatcher = RealtimeDispatcher()
+    subscriber = dispatcher.subscribe("db", maxsize=10, policy="conflate")
+    for price in ("1", "2", "3"):
+        dispatcher.publish(_trade("AAPL", price))
+    dispatcher.publish(_trade("MSFT", "9"))
+    dispatcher.publish(_ack("a"))
+    dispatcher.publish(_ack("a"))  # 시세가 아닌 이벤트는 합치지 않음
+    dispatcher.close()
+
+    events = list(subscriber)  # 닫힌 뒤에도 남은 이벤트는 전달
+    assert [(getattr(event, "symbol", None), getattr(event, "price", None)) for event in events] == [
+        ("AAPL", "3"),
+        ("MSFT", "9"),
+        (None, None),
+        (None, None),
+    ]
+    assert subscriber.stats().conflated == 2
+
+
+def test_block_policy_waits_for_slow_consumer():
+    dispatcher = RealtimeDispatcher()
+    blocking = dispatcher.subscribe("orders", maxsize=1, policy="block")
+    other = dispatcher.subscribe("other", maxsize=1, policy="drop_oldest")
+
+    producer = threading.Thread(target=dispatcher.run, args=([_trade("AAPL", str(i)) for i in range(5)],))
+    producer.start()
+    received = [event.price for event in blocking]  # type: ignore[attr-defined]
+    producer.join(timeout=5)
+
+    assert received == ["0", "1", "2", "3", "4"]
+    assert blocking.stats().dropped == 0
+    assert other.stats().dropped + other.stats().delivered + other.stats().queued == 5
+    assert other.stats().lag >= 0
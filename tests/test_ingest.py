@@ -0,0 +1,106 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from kispy.auth import KisAuth
+from kispy.client import KisClient
+from kispy.ingest import IngestCheckpoint, IngestJob
+from kispy.models.market import OHLCV, Symbol
+from kispy.store import BarStore
+
+
+def _item(date: str) -> dict:
+    return {"xymd": date, "open": "1", "high": "1", "low": "1", "clos": "1", "tvol": "1"}
+
+
+def _pages(end_date: str) -> list[list[dict]]:
+    pages = [
+        [_item("20240105"), _item("20240104")],
+        [_item("20240103"), _item("20240102")],
+    ]
+    cursor = end_date.replace("-", "")
+    return [page for page in pages if page[0]["xymd"] <= cursor]
+
+
+def test_ingest_resume_after_failure(auth: KisAuth, mocker: MockerFixture, tmp_path):
+    client = KisClient(auth)
+    store = BarStore(str(tmp_path / "bars"))
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    symbols = [Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL")]
+
+    def failing_pages(symbol, exchange_code, start_date, end_date, period, is_adjust):
+        yield _pages(end_date)[0]
+        raise ConnectionError("network down")
+
+    mock_pages = mocker.patch.object(client.overseas_stock.quote, "iter_stock_price_history_pages")
+    mock_pages.side_effect = failing_pages
+    result = IngestJob(client, store, IngestCheckpoint(checkpoint_path), symbols, "2024-01-01", "2024-01-05").run()
+
+    assert result.failed == {"AAPL": "network down"}
+    assert len(store.read("AAPL")) == 2
+
+    # 재실행 시 실패한 페이지부터 이어서 수집
+    mock_pages.side_effect = lambda symbol, exchange_code, start_date, end_date, period, is_adjust: iter(_pages(end_date))
+    result = IngestJob(client, store, IngestCheckpoint(checkpoint_path), symbols, "2024-01-01", "2024-01-05").run()
+
+    assert result.done == ["AAPL"]
+    assert mock_pages.call_args.kwargs["end_date"] == "2024-01-03"
+    assert [bar.date.day for bar in store.read("AAPL")] == [2, 3, 4, 5]
+
+    # 완료된 종목은 건너뜀
+    result = IngestJob(client, store, IngestCheckpoint(checkpoint_path), symbols, "2024-01-01", "2024-01-05").run()
+
+    assert result.skipped == ["AAPL"]
+
+
+def test_ingest_rejects_checkpoint_with_different_params(auth: KisAuth, tmp_path):
+    client = KisClient(auth)
+    store = BarStore(str(tmp_path / "bars"))
+    checkpoint = IngestCheckpoint(str(tmp_path / "checkpoint.json"))
+    IngestJob(client, store, checkpoint, [], "2024-01-01", "2024-01-05")
+
+    # 조건이 다르면 조용히 이전 조건으로 수집하지 않음
+    with pytest.raises(ValueError):
+        IngestJob(client, store, checkpoint, [], "2023-01-01", "2024-01-05")
+    IngestJob(client, store, checkpoint, [], "2023-01-01", "2024-01-05", resume=True)
+    assert checkpoint.params["start_date"] == "2024-01-01"  # type: ignore[index]
+
+    checkpoint.reset()
+    IngestJob(client, store, checkpoint, [], "2023-01-01", "2024-01-05")
+    assert checkpoint.params["start_date"] == "2023-01-01"  # type: ignore[index]
+
+
+def test_bar_store_recovers_truncated_line(tmp_path):
+    store = BarStore(str(tmp_path))
+    with open(tmp_path / "AAPL.jsonl", "w") as f:
+        f.write('{"date": "2024-01-0')
+
+    store.append("AAPL", [])
+    assert store.read("AAPL") == []
+
+    bar = OHLCV.from_response(_item("20240102"))
+    store.append("AAPL", [bar])
+
+    assert store.read("AAPL") == [bar]
+
+
+def test_checkpoint_appends_updates_and_compacts(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    checkpoint = IngestCheckpoint(path, compact_every=3)
+    checkpoint.set_params({"period": "d"})
+    snapshot = (tmp_path / "checkpoint.json").read_text()
+
+    checkpoint.update("AAPL", "running", "2024-01-03")
+    checkpoint.update("MSFT", "running", "2024-01-04")
+    assert (tmp_path / "checkpoint.json").read_text() == snapshot  # 페이지마다 전체 파일을 다시 쓰지 않음
+    with open(path + ".log", "a") as f:
+        f.write('{"symbol": "AAPL", "sta')  # 기록 중 중단
+
+    reopened = IngestCheckpoint(path, compact_every=10)
+    assert reopened.get("AAPL") == {"status": "running", "cursor": "2024-01-03"}
+    assert reopened.params == {"period": "d"}
+    reopened.update("AAPL", "running", "2024-01-02")
+    assert IngestCheckpoint(path).get("AAPL")["cursor"] == "2024-01-02"
+
+    checkpoint.update("AAPL", "done", "2024-01-01")  # compact_every건이 쌓이면 전체 상태를 기록하고 로그를 비움
+    assert (tmp_path / "checkpoint.json.log").read_text() == ""
+    assert IngestCheckpoint(path).get("AAPL")["status"] == "done"
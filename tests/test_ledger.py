@@ -0,0 +1,177 @@
+from dataclasses import replace
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from kispy.ledger import PortfolioLedger
+from kispy.models.account import AccountSummary, Balance, Order, PendingOrder, Position
+from kispy.models.realtime import FillNotice
+
+NOW = datetime(2024, 1, 5, 10, 0)
+
+
+def _summary(
+    cash: str, positions: list[Position], pending_orders: list[PendingOrder], currency: str = "USD"
+) -> AccountSummary:
+    balance = Balance(
+        available_balance=cash,
+        buyable_balance=cash,
+        buyable_integrated_balance=cash,
+        exchange_rate="1300",
+        currency=currency,  # type: ignore[arg-type]
+    )
+    return AccountSummary.create(balance, positions, pending_orders)
+
+
+def _position(symbol: str, quantity: str, average_price: str, orderable: str | None = None) -> Position:
+    return Position(
+        symbol=symbol,
+        item_name=symbol,
+        quantity=orderable or quantity,
+        balance_quantity=quantity,
+        average_price=average_price,
+        unrealized_pnl="0",
+        pnl_percentage="0",
+        current_price=average_price,
+        market_value=str(Decimal(quantity) * Decimal(average_price)),
+    )
+
+
+def _notice(order_id: str, quantity: str, price: str, is_fill: bool, **kwargs) -> FillNotice:
+    notice = FillNotice(
+        tr_id="H0GSCNI0",
+        account_no="12345678",
+        order_id=order_id,
+        original_order_id="",
+        symbol="AAPL",
+        side="buy",
+        revise_cancel="0",
+        is_fill=is_fill,
+        is_rejected=False,
+        quantity=quantity,
+        price=price,
+        order_quantity="10",
+        order_price="180",
+        time=NOW,
+    )
+    return replace(notice, **kwargs)
+
+
+def _order(order_id: str, side: str, status: str, requested: str, filled: str, amount: str) -> Order:
+    return Order(
+        order_id=order_id,
+        symbol="MSFT",
+        side=side,  # type: ignore[arg-type]
+        status=status,  # type: ignore[arg-type]
+        requested_price="400",
+        requested_quantity=requested,
+        filled_quantity=filled,
+        average_price="0",
+        filled_amount=amount,
+        reject_reason="",
+        order_date=NOW,
+    )
+
+
+def test_ledger_applies_fill_notices():
+    ledger = PortfolioLedger(_summary("10000", [_position("AAPL", "5", "170")], []))
+    assert (ledger.cash(), ledger.available_cash()) == (Decimal("10000"), Decimal("10000"))
+
+    ledger.on_notice(_notice("1", "0", "180", is_fill=False))  # 접수: 10주 x 180 주문중
+    ledger.on_notice(_notice("1", "0", "180", is_fill=False))  # 중복 접수 통보
+    assert (ledger.locked_cash(), ledger.available_cash()) == (Decimal("1800"), Decimal("8200"))
+
+    ledger.on_notice(_notice("1", "4", "179", is_fill=True))
+    holding = ledger.holding("AAPL")
+    assert holding is not None
+    assert (holding.quantity, holding.average_price) == (Decimal("9"), Decimal("1566") / 9)
+    assert (ledger.cash(), ledger.locked_cash()) == (Decimal("9284"), Decimal("1080"))
+
+    # 남은 6주 취소: 주문중금액 해제
+    ledger.on_notice(_notice("2", "0", "180", is_fill=False, revise_cancel="2", original_order_id="1"))
+    assert (ledger.locked_cash(), ledger.available_cash()) == (Decimal("0"), Decimal("9284"))
+
+    # 매도: 주문중 수량을 묶고, 체결되면 예수금 증가 (평균단가 유지)
+    ledger.on_notice(_notice("3", "0", "190", is_fill=False, side="sell", order_quantity="9", order_price="190"))
+    assert holding.available_quantity == 0 and ledger.locked_cash() == 0
+    ledger.on_notice(_notice("3", "9", "190", is_fill=True, side="sell", order_quantity="9", order_price="190"))
+    assert ledger.holding("AAPL") is None
+    assert ledger.cash() == Decimal("10994")
+
+
+def test_ledger_applies_polled_orders_and_reconciles():
+    pending = PendingOrder(
+        order_id="7",
+        symbol="MSFT",
+        side="buy",
+        requested_price="400",
+        requested_quantity="5",
+        filled_amount="2",
+        remaining_quantity="3",
+        average_price="400",
+        order_amount="800",
+        locked_amount="1200",
+    )
+    ledger = PortfolioLedger(_summary("5000", [_position("MSFT", "2", "400")], [pending]))
+    assert (ledger.cash(), ledger.locked_cash()) == (Decimal("6200"), Decimal("1200"))
+
+    ledger.apply(_order("7", "buy", "open", "5", "4", "1600"))
+    ledger.apply(_order("7", "buy", "open", "5", "4", "1600"))  # 같은 상태는 한 번만 반영
+    ledger.apply(_order("7", "buy", "open", "5", "3", "1200"))  # 오래된 상태는 무시
+    assert ledger.holding("MSFT").quantity == 4  # type: ignore[union-attr]
+    assert (ledger.cash(), ledger.locked_cash()) == (Decimal("5400"), Decimal("400"))
+
+    ledger.apply(_order("7", "buy", "closed", "5", "5", "2000"))
+    ledger.apply(_order("7", "buy", "closed", "5", "5", "2000"))
+    assert ledger.holding("MSFT").quantity == 5  # type: ignore[union-attr]
+    assert (ledger.cash(), ledger.locked_cash()) == (Decimal("5000"), Decimal("0"))
+
+    # 수수료 등으로 달라진 금액과 놓친 체결은 REST 잔고로 맞춤
+    drifted = ledger.reconcile(_summary("4990", [_position("MSFT", "5", "400"), _position("AAPL", "1", "180")], []))
+    assert drifted == ["AAPL"]
+    assert ledger.cash() == Decimal("4990")
+    assert not ledger.reconcile_due()
+
+
+def test_ledger_reconciles_pending_sells_against_balance_quantity():
+    pending = PendingOrder(
+        order_id="8",
+        symbol="AAPL",
+        side="sell",
+        requested_price="190",
+        requested_quantity="4",
+        filled_amount="0",
+        remaining_quantity="4",
+        average_price="0",
+        order_amount="0",
+        locked_amount="760",
+    )
+    # 잔고 10주 중 4주 매도 주문중: 주문가능수량은 6주 (미체결 매도를 두 번 빼지 않음)
+    ledger = PortfolioLedger(_summary("1000", [_position("AAPL", "10", "170", orderable="6")], [pending]))
+    holding = ledger.holding("AAPL")
+    assert holding is not None
+    assert (holding.quantity, holding.locked_quantity, holding.available_quantity) == (10, 4, 6)
+    assert ledger.locked_cash() == 0
+
+    ledger.on_notice(_notice("8", "4", "190", is_fill=True, side="sell", order_quantity="4", order_price="190"))
+    assert (holding.quantity, holding.available_quantity) == (6, 6)
+    assert ledger.cash() == Decimal("1760")
+
+
+def test_ledger_keeps_cash_per_currency():
+    ledger = PortfolioLedger(currency_of=lambda symbol: "HKD" if symbol.isdigit() else "USD")
+    ledger.reconcile(_summary("1000", [_position("AAPL", "1", "180")], []))
+    ledger.reconcile(_summary("5000", [_position("00700", "100", "300")], [], currency="HKD"))
+    with pytest.raises(ValueError):
+        ledger.cash()  # 통화가 여럿이면 지정해야 함
+    assert (ledger.cash("USD"), ledger.cash("HKD")) == (Decimal("1000"), Decimal("5000"))
+
+    ledger.on_notice(_notice("9", "0", "180", is_fill=False, order_quantity="2"))
+    assert (ledger.locked_cash("USD"), ledger.locked_cash("HKD")) == (Decimal("360"), Decimal("0"))
+
+    # 한 통화를 맞춰도 다른 통화의 보유종목/주문은 그대로
+    drifted = ledger.reconcile(_summary("4900", [_position("00700", "100", "300")], [], currency="HKD"))
+    assert drifted == []
+    assert ledger.holding("AAPL") is not None and ledger.locked_cash("USD") == Decimal("360")
+    assert ledger.available_cash("HKD") == Decimal("4900")
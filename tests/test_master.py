@@ -0,0 +1,242 @@
+import io
+import json
+import os
+import threading
+import tracemalloc
+import zipfile
+from datetime import timedelta
+
+import pytest
+from pytest_mock import MockerFixture
+
+from kispy.exceptions import AmbiguousSymbol
+from kispy.master import MasterCache, SymbolRegistry
+from kispy.models.market import Symbol
+from kispy.utils import parse_domestic_symbols, parse_overseas_master_data, parse_overseas_symbols, to_symbols
+
+
+def _master_zip(exchange_code: str, symbols: list[str]) -> bytes:
+    lines = []
+    for symbol in symbols:
+        row = ["US", "21", exchange_code, "나스닥", symbol, f"D{exchange_code}{symbol}", "이름", "Name", "2", "USD"]
+        row += [""] * 14
+        lines.append("\t".join(row))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr(f"{exchange_code}MST.COD", "\n".join(lines).encode("cp949"))
+    return buffer.getvalue()
+
+
+def _domestic_master_zip(market: str, rows: list[tuple[str, str, str]]) -> bytes:
+    tail_length = {"KOSPI": 228, "KOSDAQ": 222}[market]
+    lines = [f"{code:<9}{standard_code:<12}{name}" + "ST" + "0" * (tail_length - 3) for code, standard_code, name in rows]
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr(f"{market.lower()}_code.mst", "\n".join(lines).encode("cp949") + b"\n")
+    return buffer.getvalue()
+
+
+def _response(mocker: MockerFixture, status_code: int, content: bytes = b"", headers: dict | None = None):
+    resp = mocker.Mock(status_code=status_code, content=content, headers=headers or {})
+    resp.iter_content.return_value = [content]
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+@pytest.fixture
+def mock_get(mocker: MockerFixture):
+    return mocker.patch("kispy.utils.requests.get")
+
+
+def test_load_uses_disk_cache(mocker: MockerFixture, mock_get, tmp_path):
+    mock_get.return_value = _response(mocker, 200, _master_zip("NAS", ["AAPL", "MSFT"]), {"ETag": '"v1"'})
+
+    symbols = MasterCache(str(tmp_path)).load("NAS")
+    assert [symbol.symbol for symbol in symbols] == ["AAPL", "MSFT"]
+
+    # 새 프로세스에서도 디스크 캐시를 사용
+    symbols = MasterCache(str(tmp_path)).load("NAS")
+    assert [symbol.symbol for symbol in symbols] == ["AAPL", "MSFT"]
+    assert mock_get.call_count == 1
+
+
+def test_conditional_refresh(mocker: MockerFixture, mock_get, tmp_path):
+    mock_get.return_value = _response(mocker, 200, _master_zip("NAS", ["AAPL"]), {"ETag": '"v1"'})
+    MasterCache(str(tmp_path)).load("NAS")
+
+    mock_get.return_value = _response(mocker, 304)
+    symbols = MasterCache(str(tmp_path), max_age=timedelta(0)).load("NAS")
+
+    assert [symbol.symbol for symbol in symbols] == ["AAPL"]
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_cache_format_version_mismatch_redownloads(mocker: MockerFixture, mock_get, tmp_path):
+    mock_get.return_value = _response(mocker, 200, _master_zip("NAS", ["AAPL"]), {"ETag": '"v1"'})
+    MasterCache(str(tmp_path)).load("NAS")
+    meta_path = tmp_path / "NAS.json"
+    meta = json.loads(meta_path.read_text())
+    meta_path.write_text(json.dumps({**meta, "version": 1}))
+
+    # 이전 형식의 캐시는 조건부 요청 없이 다시 다운로드 (304로 오래된 캐시를 재사용하지 않음)
+    symbols = MasterCache(str(tmp_path)).load("NAS")
+
+    assert [symbol.symbol for symbol in symbols] == ["AAPL"]
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["headers"] == {}
+
+
+def test_stale_while_revalidate(mocker: MockerFixture, mock_get, tmp_path):
+    mock_get.return_value = _response(mocker, 200, _master_zip("NAS", ["AAPL"]))
+    MasterCache(str(tmp_path)).load("NAS")
+
+    mock_get.return_value = _response(mocker, 200, _master_zip("NAS", ["AAPL", "TSLA"]))
+    cache = MasterCache(str(tmp_path), max_age=timedelta(0), stale_while_revalidate=True)
+
+    # 기존 캐시를 즉시 반환하고 백그라운드에서 갱신
+    assert [symbol.symbol for symbol in cache.load("NAS")] == ["AAPL"]
+    cache.wait()
+    assert [symbol.symbol for symbol in MasterCache(str(tmp_path)).load("NAS")] == ["AAPL", "TSLA"]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_symbol_registry_loads_shards_lazily():
+    loaded = []
+
+    def loader(exchange_code):
+        loaded.append(exchange_code)
+        symbols = {"NAS": ["AAPL", "SPY"], "NYS": ["IBM", "SPY"], "AMS": ["GLD"]}[exchange_code]
+        return [Symbol(symbol=symbol, exchange_code=exchange_code, realtime_symbol="") for symbol in symbols]
+
+    registry = SymbolRegistry("US", loader)
+
+    assert registry["AAPL"].exchange_code == "NAS"
+    assert loaded == ["NAS"]
+
+    assert registry["IBM"].exchange_code == "NYS"
+    assert registry["SPY"].exchange_code == "NAS"
+    assert loaded == ["NAS", "NYS"]
+
+    assert registry.get("SPY", "NYS").exchange_code == "NYS"
+    assert "UNKNOWN" not in registry
+    assert loaded == ["NAS", "NYS", "AMS"]
+
+    with pytest.raises(KeyError):
+        registry["UNKNOWN"]
+
+
+def test_parse_overseas_symbols_memory():
+    content = _master_zip("NAS", [f"S{i:05d}" for i in range(20000)])
+
+    tracemalloc.start()
+    symbols = to_symbols(parse_overseas_master_data(content, "NAS"))
+    dict_size, dict_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del symbols
+
+    tracemalloc.start()
+    symbols = parse_overseas_symbols(io.BytesIO(content), "NAS")
+    streaming_size, streaming_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert symbols[0] == Symbol(
+        symbol="S00000",
+        exchange_code="NAS",
+        realtime_symbol="DNASS00000",
+        currency="USD",
+        korean_name="이름",
+        english_name="Name",
+    )
+    assert len(symbols) == 20000
+    assert streaming_peak * 3 < dict_peak
+    # 결과를 제외한 파싱 중 추가 메모리
+    assert (streaming_peak - streaming_size) * 10 < dict_peak - dict_size
+
+
+def test_parse_domestic_symbols():
+    content = _domestic_master_zip(
+        "KOSPI", [("005930", "KR7005930003", "삼성전자"), ("0000J0", "KR70000J0002", "KODEX 200")]
+    )
+
+    symbols = parse_domestic_symbols(content, "KOSPI")
+
+    assert symbols == [
+        Symbol(
+            symbol="005930",
+            exchange_code="KRX",
+            realtime_symbol="005930",
+            currency="KRW",
+            korean_name="삼성전자",
+            market="KOSPI",
+        ),
+        Symbol(
+            symbol="0000J0",
+            exchange_code="KRX",
+            realtime_symbol="0000J0",
+            currency="KRW",
+            korean_name="KODEX 200",
+            market="KOSPI",
+        ),
+    ]
+
+
+def test_load_domestic_and_overseas(mocker: MockerFixture, mock_get, tmp_path):
+    contents = {
+        "kospi_code.mst.zip": _domestic_master_zip("KOSPI", [("005930", "KR7005930003", "삼성전자")]),
+        "kosdaq_code.mst.zip": _domestic_master_zip("KOSDAQ", [("035720", "KR7035720002", "카카오")]),
+        "nasmst.cod.zip": _master_zip("NAS", ["AAPL"]),
+    }
+
+    def get(url, **kwargs):
+        name = url.rsplit("/", 1)[1]
+        return _response(mocker, 200, contents.get(name) or _master_zip(name[:3].upper(), []))
+
+    mock_get.side_effect = get
+
+    cache = MasterCache(str(tmp_path))
+    assert [(symbol.symbol, symbol.market) for symbol in cache.load("KRX")] == [
+        ("005930", "KOSPI"),
+        ("035720", "KOSDAQ"),
+    ]
+
+    registry = SymbolRegistry(None, cache.load)
+    assert registry["035720"].exchange_code == "KRX"
+    assert registry["AAPL"].exchange_code == "NAS"
+    # 국내 2개 + 숫자 종목코드 중복 확인용 HKS, TSE, SHS + NAS
+    assert mock_get.call_count == 6
+
+
+def test_symbol_registry_loads_remaining_shards_in_parallel():
+    loaded = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    def loader(exchange_code):
+        loaded.append(exchange_code)
+        if exchange_code in ("AMS", "BAY"):
+            barrier.wait()  # 나머지 거래소를 순차로 불러오면 BrokenBarrierError
+        return []
+
+    registry = SymbolRegistry("US", loader, priority=["NAS", "NYS", "AMS", "BAY"])
+
+    assert registry.get("UNKNOWN") is None
+    assert loaded[:2] == ["NAS", "NYS"]
+    assert sorted(loaded[2:]) == ["AMS", "BAY"]
+    assert registry.get("UNKNOWN") is None
+    assert len(loaded) == 4
+
+
+def test_symbol_registry_reports_ambiguous_numeric_symbol():
+    symbols = {"KRX": ["600000"], "NAS": [], "SHS": ["600000", "600519"], "HKS": []}
+
+    def loader(exchange_code):
+        return [
+            Symbol(symbol=symbol, exchange_code=exchange_code, realtime_symbol="") for symbol in symbols[exchange_code]
+        ]
+
+    registry = SymbolRegistry(None, loader, priority=["KRX", "NAS", "SHS", "HKS"])
+
+    with pytest.raises(AmbiguousSymbol, match="600000 is listed on KRX, SHS"):
+        registry["600000"]
+    assert "600000" in registry
+    assert registry.get("600000", "SHS").exchange_code == "SHS"
+    assert registry["600519"].exchange_code == "SHS"
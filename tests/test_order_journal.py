@@ -0,0 +1,101 @@
+from datetime import datetime
+
+from pytest_mock import MockerFixture
+
+from kispy.auth import KisAuth
+from kispy.client import KisClientV2
+from kispy.models.market import Symbol
+from kispy.order_journal import OrderJournal
+from kispy.symbol_table import SymbolTable, compile_symbol_table
+
+
+def _response(order_id: str, status: str, filled: str, date: str = "20240105") -> dict:
+    return {
+        "odno": order_id,
+        "pdno": "AAPL",
+        "sll_buy_dvsn_cd_name": "매수",
+        "prcs_stat_name": status,
+        "rjct_rson_name": "",
+        "rvse_cncl_dvsn_name": "",
+        "ft_ord_unpr3": "180",
+        "ft_ord_qty": "2",
+        "ft_ccld_qty": filled,
+        "ft_ccld_unpr3": "180" if filled != "0" else "0",
+        "ft_ccld_amt3": str(int(filled) * 180),
+        "ord_dt": date,
+        "ord_tmd": "093000",
+    }
+
+
+def _client(tmp_path) -> KisClientV2:
+    path = str(tmp_path / "all.symtab")
+    compile_symbol_table(
+        path,
+        [
+            Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL", currency="USD"),
+            Symbol(symbol="005930", exchange_code="KRX", realtime_symbol="005930", currency="KRW"),
+        ],
+    )
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    return KisClientV2(auth, symbol_table=SymbolTable(path), journal=OrderJournal(str(tmp_path / "orders.db")))
+
+
+def test_journal_records_submitted_orders(mocker: MockerFixture, tmp_path):
+    client = _client(tmp_path)
+    order_api = client.client.overseas_stock.order
+    mocker.patch.object(order_api, "buy", return_value={"ODNO": "0001"})
+    mocker.patch.object(order_api, "cancel", return_value={"ODNO": "0002"})
+    inquire_orders = mocker.patch.object(order_api, "inquire_orders", return_value=[_response("0001", "완료", "2")])
+
+    assert client.create_order("AAPL", "buy", "180", 2) == "0001"
+    assert client.cancel_order("AAPL", "0001") == "0002"
+    journal = client.journal
+    assert journal is not None
+    assert journal.get("0001").status == "open"  # type: ignore[union-attr]
+    assert journal.original_order_id("0002") == "0001"
+
+    # 미완료 주문은 주문일자부터만 다시 조회하고, 완료된 주문은 일지에서 바로 반환
+    order = client.fetch_order("0001")
+    assert order is not None and (order.status, order.filled_quantity) == ("closed", "2")
+    assert inquire_orders.call_args.args[0] == datetime.now().strftime("%Y%m%d")
+    assert client.fetch_order("0001") == order
+    assert inquire_orders.call_count == 1
+
+    # 다른 프로세스에서도 같은 일지를 읽을 수 있음
+    assert OrderJournal(str(tmp_path / "orders.db")).get("0001") == order
+
+
+def test_domestic_orders_are_fetched_from_domestic_history(mocker: MockerFixture, tmp_path):
+    client = _client(tmp_path)
+    order_api = client.client.domestic_stock.order
+    mocker.patch.object(order_api, "buy", return_value={"output": {"ODNO": "0001", "KRX_FWDG_ORD_ORGNO": "91252"}})
+    inquire_order = mocker.patch.object(
+        order_api,
+        "inquire_order",
+        return_value={
+            "odno": "0001",
+            "pdno": "005930",
+            "sll_buy_dvsn_cd": "02",
+            "ord_qty": "3",
+            "ord_unpr": "71000",
+            "tot_ccld_qty": "1",
+            "avg_prvs": "71000",
+            "tot_ccld_amt": "71000",
+            "cncl_yn": "N",
+            "rjct_qty": "0",
+            "ord_dt": datetime.now().strftime("%Y%m%d"),
+            "ord_tmd": "090000",
+        },
+    )
+    overseas_orders = mocker.patch.object(client.client.overseas_stock.order, "inquire_orders")
+
+    # 주문 일지는 해외주식 주문체결내역으로만 동기화하므로 국내주식 주문은 기록하지 않음
+    assert client.create_order("005930", "buy", "71000", 3) == "0001"
+    assert client.journal is not None and client.journal.get("0001") is None
+
+    order = client.fetch_order("0001")
+    assert order is not None
+    assert (order.side, order.status, order.filled_quantity) == ("buy", "open", "1")
+    assert client.fetch_order("0002", symbol="005930") is not None
+    assert [call.args[0] for call in inquire_order.call_args_list] == ["0001", "0002"]
+    overseas_orders.assert_not_called()
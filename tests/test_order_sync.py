@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+
+from pytest_mock import MockerFixture
+
+from kispy.auth import KisAuth
+from kispy.client import KisClientV2
+from kispy.constants import DOMESTIC_TIME_ZONE
+from kispy.models.account import Order
+from kispy.order_journal import OrderJournal
+from kispy.order_sync import OrderSync
+from kispy.overseas_stock.order import OrderAPI
+
+NOW = datetime.now(DOMESTIC_TIME_ZONE).replace(tzinfo=None)
+TODAY = NOW.strftime("%Y%m%d")
+YESTERDAY = (NOW - timedelta(days=1)).strftime("%Y%m%d")
+
+
+def _response(order_id: str, time: str, status: str = "완료", filled: str = "2", date: str = TODAY) -> dict:
+    return {
+        "odno": order_id,
+        "pdno": "AAPL",
+        "sll_buy_dvsn_cd_name": "매수",
+        "prcs_stat_name": status,
+        "rjct_rson_name": "",
+        "rvse_cncl_dvsn_name": "",
+        "ft_ord_unpr3": "180",
+        "ft_ord_qty": "2",
+        "ft_ccld_qty": filled,
+        "ft_ccld_unpr3": "180",
+        "ft_ccld_amt3": str(int(filled) * 180),
+        "ord_dt": date,
+        "ord_tmd": time,
+    }
+
+
+class FakeHistory:
+    """주문체결내역 대역: 정렬 순서대로 반복하고, 몇 건을 읽었는지 기록"""
+
+    def __init__(self, orders: list[dict]):
+        self.orders = orders
+        self.reads: list[list] = []  # [조회시작일자, 역순 여부, 읽은 건수]
+
+    def __call__(self, start_date: str, end_date: str, desc: bool = True):
+        read = [start_date, desc, 0]
+        self.reads.append(read)
+        for order in sorted(self.orders, key=lambda order: order["ord_dt"] + order["ord_tmd"], reverse=desc):
+            if order["ord_dt"] < start_date:
+                continue
+            read[2] += 1
+            yield order
+
+
+def test_order_sync_fetches_only_new_and_changed_orders(mocker: MockerFixture, tmp_path):
+    api = mocker.Mock(spec=OrderAPI)
+    history = FakeHistory(
+        [
+            _response("0001", "093000"),
+            _response("0002", "093100", status="", filled="0"),
+            _response("0003", "093200"),
+        ]
+    )
+    api.iter_orders.side_effect = history
+    journal = OrderJournal(str(tmp_path / "orders.db"))
+    sync = OrderSync(api, journal)
+
+    changes = sync.sync()
+    assert [(change.kind, change.order.order_id) for change in changes] == [
+        ("added", "0001"),
+        ("added", "0002"),
+        ("added", "0003"),
+    ]
+    assert sync.high_water() == (f"{TODAY}093200", "0003")
+
+    # 변경이 없으면 기준점까지 한 건만 읽고, 미완료 주문(0002)은 오래된 주문부터 찾을 때까지만 읽음
+    assert sync.sync() == []
+    assert [tuple(read) for read in history.reads[1:]] == [(TODAY, True, 1), (YESTERDAY, False, 2)]
+
+    # 새 주문과 미완료 주문의 상태 변경만 반환
+    history.orders[1] = _response("0002", "093100")
+    history.orders.append(_response("0004", "093300", status="", filled="0"))
+    changes = sync.sync()
+    assert [(change.kind, change.order.order_id, change.order.status) for change in changes] == [
+        ("updated", "0002", "closed"),
+        ("added", "0004", "open"),
+    ]
+    assert journal.get("0002").status == "closed"  # type: ignore[union-attr]
+    assert sync.high_water() == (f"{TODAY}093300", "0004")
+
+    # 새 기준점 이후 주문이 없고 미완료 주문(0004)이 기준점이면 기준점에서 멈추고 한 번 더 찾음
+    assert sync.sync() == []
+    assert [tuple(read) for read in history.reads[-2:]] == [(TODAY, True, 1), (YESTERDAY, False, 4)]
+
+
+def test_order_sync_expires_open_orders_missing_from_history(mocker: MockerFixture, tmp_path):
+    api = mocker.Mock(spec=OrderAPI)
+    history = FakeHistory([_response("0003", "093000")])
+    api.iter_orders.side_effect = history
+    journal = OrderJournal(str(tmp_path / "orders.db"))
+    now = NOW
+
+    def open_order(order_id: str, order_date: datetime) -> Order:
+        return Order.from_response(
+            {**_response(order_id, order_date.strftime("%H%M%S"), "", "0"), "ord_dt": order_date.strftime("%Y%m%d")}
+        )
+
+    # 접수 후 주문체결내역에 나타나지 않은 주문: 40일 전, 3일 전, 방금
+    journal.record([open_order("0001", now - timedelta(days=40)), open_order("0002", now - timedelta(days=3))])
+    journal.record(open_order("0004", now))
+    sync = OrderSync(api, journal, rescan_days=7)
+
+    changes = sync.sync()
+
+    # 다시 조회하는 기간은 rescan_days로 제한하고, 찾지 못한 오래된 주문은 만료로 기록
+    assert history.reads[-1][0] == (now - timedelta(days=7)).strftime("%Y%m%d")
+    assert [(change.order.order_id, change.order.status) for change in changes] == [
+        ("0001", "expired"),
+        ("0002", "expired"),
+        ("0003", "closed"),
+    ]
+    assert [order.order_id for order in journal.open_orders()] == ["0004"]
+    assert sync.high_water() == (f"{TODAY}093000", "0003")
+
+
+def test_client_sync_orders_uses_journal(mocker: MockerFixture, tmp_path):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth, journal=OrderJournal(str(tmp_path / "orders.db")))
+    history = FakeHistory([_response("0001", "093000")])
+    mocker.patch.object(client.client.overseas_stock.order, "iter_orders", side_effect=history)
+
+    assert [change.order.order_id for change in client.sync_orders()] == ["0001"]
+    assert client.sync_orders() == []
+    assert client.fetch_order("0001").status == "closed"  # type: ignore[union-attr]
+    assert len(history.reads) == 2
+
+
+def test_order_sync_does_not_report_orders_recorded_at_submission(mocker: MockerFixture, tmp_path):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth, journal=OrderJournal(str(tmp_path / "orders.db")))
+    history = FakeHistory([_response("0001", "000000", status="", filled="0")])
+    mocker.patch.object(client.client.overseas_stock.order, "iter_orders", side_effect=history)
+
+    # 접수할 때 기록한 주문은 주문일시와 가격 표기가 주문체결내역과 달라도 바뀐 주문이 아님
+    client._record_order("0001", "AAPL", "buy", "180.00", 2)
+    assert client.sync_orders() == []
+    assert client.journal.get("0001").order_date == datetime.strptime(f"{TODAY}000000", "%Y%m%d%H%M%S")  # type: ignore[union-attr]
+
+    history.orders[0] = _response("0001", "000000")
+    assert [(change.kind, change.order.status) for change in client.sync_orders()] == [("updated", "closed")]
@@ -0,0 +1,89 @@
+import threading
+
+from pytest_mock import MockerFixture
+
+from kispy.auth import KisAuth
+from kispy.overseas_stock.account import AccountAPI
+from kispy.overseas_stock.order import OrderAPI
+from kispy.pagination import paginate
+from kispy.responses import BaseResponse
+
+
+class FakePages:
+    """페이지당 size건씩 응답하는 연속조회 API 대역"""
+
+    def __init__(self, total: int, size: int, output_key: str = "output", **extra):
+        self.total = total
+        self.size = size
+        self.output_key = output_key
+        self.extra = extra
+        self.calls: list[tuple[dict, dict]] = []
+        self.threads: set[str] = set()
+
+    def __call__(self, headers: dict, params: dict) -> BaseResponse:
+        self.calls.append((dict(headers), dict(params)))
+        self.threads.add(threading.current_thread().name)
+        start = int(params["CTX_AREA_NK200"] or 0)
+        end = min(start + self.size, self.total)
+        json = {
+            self.output_key: [{"odno": str(i)} for i in range(start, end)],
+            "ctx_area_fk200": "FK  ",
+            "ctx_area_nk200": f"{end}   ",
+            **self.extra,
+        }
+        return BaseResponse(headers={"tr_cont": "M" if end < self.total else "D"}, status_code=200, json=json)
+
+
+PARAMS = {"CANO": "12345678", "CTX_AREA_FK200": "", "CTX_AREA_NK200": ""}
+
+
+def test_paginate_follows_continuation_keys():
+    pages = FakePages(total=95, size=40)
+
+    items = list(paginate(pages, {"tr_id": "TTTS3018R"}, PARAMS, prefetch=True))
+
+    assert [item["odno"] for item in items] == [str(i) for i in range(95)]
+    assert [(headers["tr_cont"], params["CTX_AREA_NK200"]) for headers, params in pages.calls] == [
+        ("", ""),
+        ("N", "40"),
+        ("N", "80"),
+    ]
+    assert pages.calls[1][1]["CTX_AREA_FK200"] == "FK"
+    assert len(pages.threads) == 2  # 다음 페이지는 미리 요청
+
+
+def test_paginate_pushes_down_limit():
+    pages = FakePages(total=200, size=40)
+    assert len(list(paginate(pages, {}, PARAMS, limit=40))) == 40
+    assert len(pages.calls) == 1  # 첫 페이지로 충분하면 다음 페이지를 요청하지 않음
+
+    pages = FakePages(total=200, size=40)
+    iterator = paginate(pages, {}, PARAMS)
+    assert [next(iterator)["odno"] for _ in range(41)][-1] == "40"
+    assert len(pages.calls) == 2  # 필요한 만큼만 요청
+    assert pages.threads == {threading.current_thread().name}  # 기본값은 미리 요청하지 않음
+
+
+def test_inquire_order_by_id_stops_without_prefetch(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    mocker.patch.object(auth, "get_header", return_value={})
+    api = OrderAPI(auth)
+    pages = FakePages(total=200, size=20)
+    mocker.patch.object(api, "_request", side_effect=lambda method, url, headers, params: pages(headers, params))
+
+    assert api.inquire_orders("20240101", "20240105", order_id="5") == [{"odno": "5"}]
+    assert len(pages.calls) == 1  # 찾은 뒤 다음 페이지를 요청하지 않음
+
+
+def test_inquire_balance_collects_all_positions(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    mocker.patch.object(auth, "get_header", return_value={})
+    api = AccountAPI(auth)
+    pages = FakePages(total=250, size=100, output_key="output1", output2={"tot_evlu_pfls_amt": "1"})
+    mocker.patch.object(api, "_request", side_effect=lambda method, url, headers, params: pages(headers, params))
+
+    resp = api.inquire_balance("NASD", "USD")
+
+    assert len(resp["output1"]) == 250
+    assert resp["output2"] == {"tot_evlu_pfls_amt": "1"}
+    assert len(pages.calls) == 3
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from pytest_mock import MockerFixture
+
+from kispy.auth import KisAuth
+from kispy.client import KisClientV2
+from kispy.models.market import Symbol
+from kispy.models.realtime import Trade
+from kispy.quote_router import QuoteRouter
+from kispy.realtime import RealtimeClient
+
+
+def _trade(symbol: str, price: str) -> Trade:
+    return Trade("HDFSCNT0", symbol, datetime(2024, 1, 5, 9, 30, 1), price, "1", "1", "1", "1", "1")
+
+
+def test_quote_router_prefers_fresh_realtime_price(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth)
+    get_price = mocker.patch.object(client, "get_price", side_effect=lambda symbol: f"rest-{symbol}")
+    clock = mocker.patch("kispy.quote_router.time.monotonic", return_value=100.0)
+
+    router = QuoteRouter(client, max_age=2.0)
+    router.subscribe("AAPL")
+    router.on_event(_trade("AAPL", "181.90"))
+    router.on_event(_trade("MSFT", "400.00"))  # 등록하지 않은 종목은 저장하지 않음
+
+    clock.return_value = 101.5
+    quote = router.get_price("AAPL")
+    assert (quote.price, quote.source, quote.age, quote.time) == (
+        "181.90",
+        "realtime",
+        1.5,
+        datetime(2024, 1, 5, 9, 30, 1),
+    )
+    assert get_price.call_count == 0
+
+    quotes = router.get_prices(["AAPL", "MSFT"])
+    assert {symbol: (quote.price, quote.source) for symbol, quote in quotes.items()} == {
+        "AAPL": ("181.90", "realtime"),
+        "MSFT": ("rest-MSFT", "rest"),
+    }
+
+    # 오래된 체결가는 REST로 조회
+    clock.return_value = 103.0
+    assert router.get_price("AAPL").source == "rest"
+
+    router.on_event(_trade("AAPL", "182.00"))
+    router.unsubscribe("AAPL")
+    assert router.get_price("AAPL").source == "rest"
+    assert get_price.call_args_list == [mocker.call("MSFT"), mocker.call("AAPL"), mocker.call("AAPL")]
+
+
+def test_quote_router_unsubscribes_realtime_trades(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = KisClientV2(auth)
+    symbol = Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL", currency="USD")
+    mocker.patch.object(client, "get_symbol", return_value=symbol)
+    realtime = RealtimeClient(auth)
+
+    router = QuoteRouter(client, realtime)
+    router.subscribe("AAPL")
+    assert realtime.subscriptions == [("HDFSCNT0", "DNASAAPL")]
+
+    router.unsubscribe("AAPL")
+    router.unsubscribe("AAPL")
+    assert realtime.subscriptions == []
@@ -0,0 +1,380 @@
+import base64
+import json
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+from pytest_mock import MockerFixture
+from websockets.sync.server import ServerConnection, serve
+
+from kispy.auth import KisAuth
+from kispy.models.market import Symbol
+from kispy.models.realtime import FillNotice, OrderBook, SubscriptionResult, Trade
+from kispy.realtime import OrderTracker, RealtimeClient, TradeColumns, decode_trades, parse_frame
+
+OVERSEAS_TRADE = [
+    "DNASAAPL", "AAPL", "4", "20240105", "20240105", "093001", "20240105", "233001", "181.50", "182.00",
+    "181.00", "181.90", "2", "0.40", "0.22", "181.89", "181.91", "100", "200", "15", "12345", "2245000",
+    "10", "5", "100.5", "1",
+]  # fmt: skip
+
+
+def _domestic_trade(price: str) -> list[str]:
+    fields = ["0"] * 46
+    fields[0], fields[1], fields[2], fields[12], fields[13], fields[33] = (
+        "005930",
+        "090001",
+        price,
+        "7",
+        "1007",
+        "20240105",
+    )
+    return fields
+
+
+def test_parse_frame_with_multiple_records():
+    frame = "0|H0STCNT0|002|" + "^".join(_domestic_trade("71000") + _domestic_trade("71100"))
+
+    events = parse_frame(frame)
+
+    assert [event.price for event in events] == ["71000", "71100"]  # type: ignore[union-attr]
+    assert events[0] == Trade(
+        tr_id="H0STCNT0",
+        symbol="005930",
+        time=datetime(2024, 1, 5, 9, 0, 1),
+        price="71000",
+        volume="7",
+        accumulated_volume="1007",
+        open="0",
+        high="0",
+        low="0",
+    )
+    assert parse_frame("0|UNKNOWN|001|a^b") == []
+
+
+def test_parse_overseas_frames():
+    trade = parse_frame("0|HDFSCNT0|001|" + "^".join(OVERSEAS_TRADE))[0]
+    assert isinstance(trade, Trade)
+    assert (trade.symbol, trade.time, trade.price, trade.volume) == (
+        "AAPL",
+        datetime(2024, 1, 5, 9, 30, 1),
+        "181.90",
+        "15",
+    )
+
+    fields = ["DNASAAPL", "AAPL", "4", "20240105", "093001"] + ["0"] * 6 + ["181.89", "181.91", "300", "200", "0", "0"]
+    order_book = parse_frame("0|HDFSASP0|001|" + "^".join(fields))[0]
+    assert isinstance(order_book, OrderBook)
+    assert order_book.asks == [("181.91", "200")]
+    assert order_book.bids == [("181.89", "300")]
+
+
+def test_decode_trades_into_columns():
+    columns = TradeColumns()
+    domestic = "0|H0STCNT0|002|" + "^".join(_domestic_trade("71000") + _domestic_trade("71100"))
+    overseas = "0|HDFSCNT0|001|" + "^".join(OVERSEAS_TRADE)
+
+    assert decode_trades(domestic, columns) == 2
+    assert decode_trades(overseas, columns) == 1
+    assert decode_trades("0|HDFSASP0|001|a^b", columns) == 0
+
+    assert columns.tr_ids == ["H0STCNT0", "H0STCNT0", "HDFSCNT0"]
+    assert columns.symbols == ["005930", "005930", "AAPL"]
+    assert list(columns.times) == [20240105090001, 20240105090001, 20240105093001]
+    assert list(columns.prices) == [71000.0, 71100.0, 181.9]
+    assert list(columns.volumes) == [7, 7, 15]
+    assert list(columns.accumulated_volumes) == [1007, 1007, 12345]
+    assert columns.highs[2] == 182.0
+
+    columns.clear()
+    assert len(columns) == 0 and len(columns.prices) == 0
+
+
+def test_decode_trades_batched_frame():
+    # 장 시작 직후처럼 한 프레임에 여러 종목 체결이 묶여 오는 상황
+    frame = "0|HDFSCNT0|020|" + "^".join(OVERSEAS_TRADE * 20)
+    columns = TradeColumns()
+
+    assert decode_trades(frame, columns) == 20
+    assert len(columns) == 20 and columns.prices[19] == columns.prices[0]
+
+
+@pytest.mark.benchmark
+def test_decode_trades_throughput():
+    frame = "0|HDFSCNT0|020|" + "^".join(OVERSEAS_TRADE * 20)
+    columns = TradeColumns()
+    ticks = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < 0.5:
+        for _ in range(100):
+            ticks += decode_trades(frame, columns)
+        columns.clear()
+
+    # 한 코어에서 초당 5만 건 이상 (개발 환경에서는 20만 건 이상)
+    assert ticks / elapsed > 50_000
+
+
+KEY = "k" * 32
+IV = "i" * 16
+
+
+def _fill_notice(order_id: str, quantity: str, price: str, is_fill: bool, revise_cancel: str = "0", **fields) -> str:
+    """국내주식 체결통보 레코드"""
+    record = ["0"] * 23
+    record[1], record[2], record[3], record[4], record[5] = "1234567801", order_id, "", "02", revise_cancel
+    record[8], record[9], record[10], record[11] = "005930", quantity, price, "093001"
+    record[12], record[13], record[16], record[22] = "0", "2" if is_fill else "1", "0000000010", "71000"
+    for index, value in fields.items():
+        record[int(index[1:])] = value
+    return "^".join(record)
+
+
+def _encrypt(tr_id: str, payload: str) -> str:
+    cipher = AES.new(KEY.encode(), AES.MODE_CBC, IV.encode())
+    return f"1|{tr_id}|001|" + base64.b64encode(cipher.encrypt(pad(payload.encode(), AES.block_size))).decode()
+
+
+class FakeConnection:
+    def __init__(self, messages: list[str]):
+        self._messages = messages
+
+    def recv(self, timeout: float | None = None) -> str:
+        if not self._messages:
+            raise TimeoutError
+        return self._messages.pop(0)
+
+    def send(self, message: str) -> None:
+        pass
+
+
+def test_realtime_client_decrypts_fill_notices(mocker: MockerFixture):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    client = RealtimeClient(auth)
+    subscribe = mocker.patch.object(client, "subscribe")
+    client.subscribe_fill_notices("hts_id")
+    assert subscribe.call_args_list == [mocker.call("H0STCNI0", "hts_id"), mocker.call("H0GSCNI0", "hts_id")]
+
+    ack = {
+        "header": {"tr_id": "H0STCNI0", "tr_key": "hts_id", "encrypt": "N"},
+        "body": {"rt_cd": "0", "msg1": "SUBSCRIBE SUCCESS", "output": {"key": KEY, "iv": IV}},
+    }
+    connection = FakeConnection(
+        [
+            _encrypt("H0STCNI0", _fill_notice("0000012345", "0000000003", "71000", is_fill=True)),  # 키를 받기 전 통보
+            json.dumps(ack),
+            _encrypt("H0STCNI0", _fill_notice("0000012345", "0000000003", "71000", is_fill=True)),
+        ]
+    )
+    frames = []
+    with pytest.raises(TimeoutError):
+        for frame in client._receive(connection):  # type: ignore[arg-type]
+            frames.append(frame)
+
+    assert isinstance(frames[0], SubscriptionResult) and frames[0].key == KEY
+    notice = parse_frame(frames[1])[0]  # type: ignore[arg-type]
+    assert isinstance(notice, FillNotice)
+    assert (notice.order_id, notice.side, notice.is_fill, notice.quantity, notice.order_price) == (
+        "0000012345",
+        "buy",
+        True,
+        "0000000003",
+        "71000",
+    )
+
+
+def test_order_tracker_accumulates_fills():
+    tracker = OrderTracker()
+
+    def update(payload: str):
+        notice = parse_frame("0|H0STCNI0|001|" + payload)[0]
+        assert isinstance(notice, FillNotice)
+        return tracker.update(notice)
+
+    accepted = update(_fill_notice("0000012345", "0", "71000", is_fill=False))
+    assert accepted is not None
+    assert (accepted.status, accepted.requested_quantity, accepted.requested_price) == ("open", "10", "71000")
+    assert update(_fill_notice("0000012345", "0", "71000", is_fill=False)) is None  # 중복 접수 통보
+
+    partial = update(_fill_notice("0000012345", "0000000004", "71000", is_fill=True))
+    assert partial is not None
+    assert (partial.status, partial.filled_quantity, partial.average_price) == ("open", "4", "71000")
+
+    closed = update(_fill_notice("0000012345", "0000000006", "71500", is_fill=True))
+    assert closed is not None
+    assert (closed.status, closed.filled_quantity, closed.filled_amount, closed.average_price) == (
+        "closed",
+        "10",
+        "713000",
+        "71300",
+    )
+
+    update(_fill_notice("0000012346", "0", "70000", is_fill=False))
+    canceled = update(_fill_notice("0000012347", "0", "70000", is_fill=False, revise_cancel="2", f3="0000012346"))
+    assert canceled is not None and (canceled.order_id, canceled.status) == ("0000012346", "canceled")
+
+    rejected = update(_fill_notice("0000012348", "0", "70000", is_fill=False, f12="1"))
+    assert rejected is not None and rejected.status == "rejected"
+
+
+class FakeServer:
+    """KIS 실시간 서버 대역: 등록 요청에 응답하고, 첫 접속은 PINGPONG 확인 후 체결가를 보내고 끊음"""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.connections = 0
+        self.pong = threading.Event()
+        self._server = serve(self._handle, "127.0.0.1", 0)
+        self.url = f"ws://127.0.0.1:{self._server.socket.getsockname()[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def _handle(self, connection: ServerConnection) -> None:
+        self.connections += 1
+        first = self.connections == 1
+        for message in connection:
+            data = json.loads(message)
+            if data["header"].get("tr_id") == "PINGPONG":
+                self.pong.set()
+                return  # 첫 접속은 PINGPONG 응답을 받으면 끊음
+
+            self.requests.append(data)
+            tr_id, tr_key = data["body"]["input"]["tr_id"], data["body"]["input"]["tr_key"]
+            ack = {
+                "header": {"tr_id": tr_id, "tr_key": tr_key, "encrypt": "N"},
+                "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": "SUBSCRIBE SUCCESS", "output": {}},
+            }
+            connection.send(json.dumps(ack))
+            if first:
+                connection.send(json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "20240105093001"}}))
+                connection.send("0|HDFSCNT0|001|" + "^".join(OVERSEAS_TRADE))
+
+    def shutdown(self):
+        self._server.shutdown()
+
+
+@pytest.fixture
+def server():
+    server = FakeServer()
+    yield server
+    server.shutdown()
+
+
+def test_realtime_client_reconnects_and_resubscribes(mocker: MockerFixture, server: FakeServer):
+    auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+    mocker.patch.object(auth, "get_approval_key", return_value="approval")
+    client = RealtimeClient(auth, url=server.url, reconnect_delay=0.01)
+    client.subscribe_trades(Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL"))
+
+    events = []
+    for event in client.events():
+        events.append(event)
+        if len(events) == 3:
+            client.close()
+
+    assert [type(event) for event in events] == [SubscriptionResult, Trade, SubscriptionResult]
+    assert events[1].price == "181.90"  # type: ignore[union-attr]
+    assert server.pong.is_set()
+    assert server.connections == 2
+    assert [request["body"]["input"] for request in server.requests] == [{"tr_id": "HDFSCNT0", "tr_key": "DNASAAPL"}] * 2
+    assert server.requests[0]["header"] == {
+        "approval_key": "approval",
+        "custtype": "P",
+        "tr_type": "1",
+        "content-type": "utf-8",
+    }
+
+
+def test_realtime_client_refreshes_rejected_approval_key(mocker: MockerFixture):
+    requests = []
+
+    def handle(connection: ServerConnection) -> None:
+        for message in connection:
+            data = json.loads(message)
+            requests.append(data)
+            tr_id, tr_key = data["body"]["input"]["tr_id"], data["body"]["input"]["tr_key"]
+            rejected = data["header"]["approval_key"] == "expired"
+            body = {"rt_cd": "1", "msg1": "invalid approval : NOT FOUND"} if rejected else {"rt_cd": "0", "msg1": "OK"}
+            connection.send(json.dumps({"header": {"tr_id": tr_id, "tr_key": tr_key}, "body": body}))
+
+    with serve(handle, "127.0.0.1", 0) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+        keys = ["expired"]
+
+        def approval_key(refresh: bool = False) -> str:
+            if refresh:
+                keys.append("new")
+            return keys[-1]
+
+        get_approval_key = mocker.patch.object(auth, "get_approval_key", side_effect=approval_key)
+        client = RealtimeClient(auth, url=f"ws://127.0.0.1:{server.socket.getsockname()[1]}")
+        client.subscribe("HDFSCNT0", "DNASAAPL")
+
+        events = client.events()
+        result = next(events)
+        client.close()
+        server.shutdown()
+
+    # 거부 응답은 내보내지 않고 새 접속키로 다시 등록
+    assert isinstance(result, SubscriptionResult) and result.success
+    assert [request["header"]["approval_key"] for request in requests] == ["expired", "new"]
+    assert get_approval_key.call_args_list[1] == mocker.call(refresh=True)
+
+
+def test_realtime_client_skips_malformed_messages(mocker: MockerFixture):
+    def handle(connection: ServerConnection) -> None:
+        connection.send("{not json")
+        connection.send(json.dumps({"header": {"tr_id": "HDFSCNT0", "tr_key": "DNASAAPL"}, "body": {"rt_cd": "0"}}))
+        connection.recv()
+
+    with serve(handle, "127.0.0.1", 0) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+        client = RealtimeClient(auth, url=f"ws://127.0.0.1:{server.socket.getsockname()[1]}")
+
+        events = client.events()
+        result = next(events)
+        client.close()
+        server.shutdown()
+
+    # 깨진 메시지는 건너뛰고 접속을 유지
+    assert isinstance(result, SubscriptionResult) and result.success
+
+
+class _RecordingEvent(threading.Event):
+    """재접속 대기 시간을 기록하고 실제로 기다리지 않는 종료 이벤트 (stop_after번 기다리면 종료)"""
+
+    def __init__(self, stop_after: int):
+        super().__init__()
+        self.stop_after = stop_after
+        self.waits: list[float | None] = []
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.waits.append(timeout)
+        if len(self.waits) >= self.stop_after:
+            self.set()
+        return self.is_set()
+
+
+def test_realtime_client_backs_off_when_connection_drops_immediately(mocker: MockerFixture):
+    connections = []
+
+    def handle(connection: ServerConnection) -> None:
+        connections.append(connection)  # 접속하자마자 끊음
+
+    with serve(handle, "127.0.0.1", 0) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        auth = KisAuth(app_key="key", secret="secret", account_no="12345678-01", is_real=True)
+        mocker.patch.object(auth, "get_approval_key", return_value="approval")
+        url = f"ws://127.0.0.1:{server.socket.getsockname()[1]}"
+        client = RealtimeClient(auth, url=url, reconnect_delay=0.05, max_reconnect_delay=0.2)
+        closed = client._closed = _RecordingEvent(stop_after=5)
+
+        assert list(client.frames()) == []
+        server.shutdown()
+
+    # 바로 재접속하지 않고 0.05, 0.1, 0.2, 0.2 ... 간격으로 재접속
+    assert closed.waits == [0.05, 0.1, 0.2, 0.2, 0.2]
+    assert len(connections) == 5
@@ -0,0 +1,119 @@
+import queue
+from datetime import datetime
+
+import pytest
+
+from kispy.auth import KisAuth
+from kispy.models.realtime import Trade
+from kispy.realtime_pool import RealtimeSessionPool
+
+
+class FakeClient:
+    """RealtimeClient 대역: 등록 요청을 기록하고, push()로 넣은 이벤트를 events()로 돌려줌"""
+
+    def __init__(self, auth: KisAuth):
+        self.auth = auth
+        self.subscriptions: dict[tuple[str, str], None] = {}
+        self.closed = False
+        self._events: queue.Queue = queue.Queue()
+
+    def subscribe(self, tr_id: str, tr_key: str) -> None:
+        self.subscriptions[(tr_id, tr_key)] = None
+
+    def unsubscribe(self, tr_id: str, tr_key: str) -> None:
+        del self.subscriptions[(tr_id, tr_key)]
+
+    def push(self, event: object) -> None:
+        self._events.put(event)
+
+    def events(self):
+        while (event := self._events.get()) is not None:
+            yield event
+
+    def close(self) -> None:
+        self.closed = True
+        self._events.put(None)
+
+
+def _trade(symbol: str) -> Trade:
+    return Trade("HDFSCNT0", symbol, datetime(2024, 1, 5, 9, 30), "1", "1", "1", "1", "1", "1")
+
+
+def _pool(keys: int = 3, **kwargs) -> tuple[RealtimeSessionPool, list[FakeClient]]:
+    auths = [
+        KisAuth(app_key=f"key{i}", secret="secret", account_no="12345678-01", is_real=True) for i in range(1, keys + 1)
+    ]
+    clients: list[FakeClient] = []
+
+    def factory(auth: KisAuth) -> FakeClient:
+        clients.append(FakeClient(auth))
+        return clients[-1]
+
+    return RealtimeSessionPool(auths, client_factory=factory, **kwargs), clients  # type: ignore[arg-type]
+
+
+def test_pool_shards_and_rebalances():
+    pool, clients = _pool(max_subscriptions=3)
+    for i in range(7):
+        pool.subscribe("HDFSCNT0", f"DNASS{i}")
+    pool.subscribe("HDFSCNT0", "DNASS0")  # 중복 등록은 무시
+
+    assert [len(client.subscriptions) for client in clients] == [3, 3, 1]
+    assert [client.auth.app_key for client in clients] == ["key1", "key2", "key3"]
+    assert [stats.subscriptions for stats in pool.stats()] == [3, 3, 1]
+
+    # 6건이면 세션 2개로 충분하므로 등록이 가장 적은 세션을 비우고 닫음
+    pool.unsubscribe("HDFSCNT0", "DNASS0")
+    assert [stats.subscriptions for stats in pool.stats()] == [3, 3]
+    assert clients[2].closed and not clients[0].closed and not clients[1].closed
+    assert set(clients[0].subscriptions) == {("HDFSCNT0", "DNASS1"), ("HDFSCNT0", "DNASS2"), ("HDFSCNT0", "DNASS6")}
+
+    for i in (1, 3):
+        pool.unsubscribe("HDFSCNT0", f"DNASS{i}")
+    assert [stats.subscriptions for stats in pool.stats()] == [2, 2]
+    assert sorted(pool.subscriptions) == [("HDFSCNT0", f"DNASS{i}") for i in (2, 4, 5, 6)]
+
+    # 닫은 세션의 앱키를 새 세션에 다시 사용 (열려 있는 세션과 앱키가 겹치지 않음)
+    for i in (7, 8, 9):
+        pool.subscribe("HDFSCNT0", f"DNASS{i}")
+    assert clients[3].auth.app_key == "key3"
+    pool.close()
+
+
+def test_pool_merges_session_events():
+    pool, clients = _pool(max_subscriptions=1)
+    pool.subscribe("HDFSCNT0", "DNASAAPL")
+    pool.subscribe("HDFSCNT0", "DNASMSFT")
+    clients[0].push(_trade("AAPL"))
+    clients[1].push(_trade("MSFT"))
+    clients[0].push(_trade("AAPL"))
+
+    symbols = []
+    for event in pool.events():
+        symbols.append(event.symbol)  # type: ignore[union-attr]
+        if len(symbols) == 3:
+            pool_stats = pool.stats()
+            pool.close()
+
+    assert sorted(symbols) == ["AAPL", "AAPL", "MSFT"]
+    assert [stats.events for stats in pool_stats] == [2, 1]
+    assert all(client.closed for client in clients)
+
+
+def test_pool_session_limit():
+    pool, _ = _pool(max_subscriptions=1, max_sessions=1)
+    pool.subscribe("HDFSCNT0", "DNASAAPL")
+    with pytest.raises(ValueError):
+        pool.subscribe("HDFSCNT0", "DNASMSFT")
+    pool.close()
+
+    # 앱키당 세션은 하나: 기본 최대 세션 수는 앱키 수
+    pool, clients = _pool(keys=1, max_subscriptions=1)
+    pool.subscribe("HDFSCNT0", "DNASAAPL")
+    with pytest.raises(ValueError):
+        pool.subscribe("HDFSCNT0", "DNASMSFT")
+    assert len(clients) == 1
+    pool.close()
+
+    with pytest.raises(ValueError):
+        _pool(keys=2, max_sessions=3)
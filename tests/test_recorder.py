@@ -0,0 +1,102 @@
+from datetime import datetime
+
+from pytest_mock import MockerFixture
+
+from kispy.auth import KisAuth
+from kispy.client import KisClient
+from kispy.constants import MarketBreakMap, MarketSessionMap, TimeZoneMap
+from kispy.models.market import Symbol
+from kispy.recorder import MinuteBarRecorder, _find_gaps
+from kispy.store import BarStore
+
+
+def _minute(date: str) -> dict:
+    return {"xymd": date[:8], "xhms": date[8:], "open": "1", "high": "1", "low": "1", "last": "1", "evol": "1"}
+
+
+def test_sweep_records_new_bars_and_gaps(auth: KisAuth, mocker: MockerFixture, tmp_path):
+    client = KisClient(auth)
+    store = BarStore(str(tmp_path))
+    symbol = Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL")
+    recorder = MinuteBarRecorder(client, store, symbols=[symbol])
+
+    mock_minute = mocker.patch.object(client.overseas_stock.quote, "get_stock_price_history_by_minute")
+    mock_minute.return_value = [_minute("20240102093000"), _minute("20240102093100")]
+    [report] = recorder.sweep()
+
+    assert report.recorded == 2
+    assert report.gaps == []
+    assert mock_minute.call_args.kwargs["start_date"] is None
+
+    # 마지막 기록 이후만 조회하고, 조회 범위 안의 빈 분봉은 거래가 없었던 것으로 봄
+    mock_minute.return_value = [_minute("20240102093100"), _minute("20240102093400")]
+    [report] = recorder.sweep()
+
+    assert report.recorded == 1
+    assert (report.gaps, report.empty_gaps) == ([], 1)
+    assert mock_minute.call_args.kwargs["start_date"] == "20240102093100"
+    assert len(store.read("AAPL")) == 3
+
+    # 조회가 마지막 기록까지 닿지 않은 구간은 누락으로 보고
+    mock_minute.return_value = [_minute("20240102093800")]
+    [report] = recorder.sweep()
+
+    assert report.gaps == [(datetime(2024, 1, 2, 9, 34), datetime(2024, 1, 2, 9, 38))]
+
+
+def test_sweep_reports_error(auth: KisAuth, mocker: MockerFixture, tmp_path):
+    client = KisClient(auth)
+    recorder = MinuteBarRecorder(client, BarStore(str(tmp_path)), domestic_symbols=["005930"])
+    mocker.patch.object(
+        client.domestic_stock.quote, "get_stock_price_history_by_minute_range", side_effect=ConnectionError("down")
+    )
+
+    [report] = recorder.sweep("KRX")
+
+    assert report.error == "down"
+
+
+def test_next_run_skips_weekend(auth: KisAuth, tmp_path):
+    symbol = Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL")
+    recorder = MinuteBarRecorder(KisClient(auth), BarStore(str(tmp_path)), symbols=[symbol])
+
+    # 2024-01-05 (금) 17:00 뉴욕 -> 2024-01-08 (월) 16:10
+    exchange_code, run_at = recorder.next_run(datetime(2024, 1, 5, 17, 0, tzinfo=TimeZoneMap["NAS"]))
+
+    assert exchange_code == "NAS"
+    assert run_at == datetime(2024, 1, 8, 16, 10, tzinfo=TimeZoneMap["NAS"])
+
+
+def test_sweep_keeps_last_date_and_reports_missed_sessions(auth: KisAuth, mocker: MockerFixture, tmp_path):
+    client = KisClient(auth)
+    store = BarStore(str(tmp_path))
+    symbol = Symbol(symbol="AAPL", exchange_code="NAS", realtime_symbol="DNASAAPL")
+    recorder = MinuteBarRecorder(client, store, symbols=[symbol])
+    last_date = mocker.spy(store, "last_date")
+
+    mock_minute = mocker.patch.object(client.overseas_stock.quote, "get_stock_price_history_by_minute")
+    mock_minute.return_value = [_minute("20240102155800"), _minute("20240102155900")]
+    recorder.sweep()
+
+    # 다음 거래일 정규장 시작부터 이어지면 누락 없음 (장중 빈 구간은 조회 범위 안이라 거래 없음)
+    mock_minute.return_value = [_minute("20240103093000"), _minute("20240103155900")]
+    [report] = recorder.sweep()
+    assert (report.gaps, report.empty_gaps) == ([], 1)
+
+    # 2024-01-04, 01-05 거래일을 통째로 놓침
+    mock_minute.return_value = [_minute("20240108093000")]
+    [report] = recorder.sweep()
+    assert report.gaps == [(datetime(2024, 1, 3, 15, 59), datetime(2024, 1, 8, 9, 30))]
+    assert mock_minute.call_args.kwargs["start_date"] == "20240103155900"
+    assert last_date.call_count == 1  # 저장소 파일은 처음 한 번만 읽음
+
+
+def test_find_gaps_skips_lunch_break():
+    dates = [datetime(2024, 1, 2, 11, 59), datetime(2024, 1, 2, 13, 0), datetime(2024, 1, 2, 13, 5)]
+
+    # 홍콩 점심시간(12:00~13:00)은 누락이 아님
+    assert _find_gaps(dates, MarketSessionMap["HKS"], MarketBreakMap["HKS"]) == [(dates[1], dates[2])]
+    assert _find_gaps(dates, MarketSessionMap["HKS"]) == [(dates[0], dates[1]), (dates[1], dates[2])]
+    assert _find_gaps([datetime(2024, 1, 2, 11, 50), dates[1]], MarketSessionMap["HKS"], MarketBreakMap["HKS"]) == [
+        (datetime(2024, 1, 2, 11, 50), dates[1])
+    ]
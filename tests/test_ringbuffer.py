@@ -0,0 +1,77 @@
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from kispy.models.market import OHLCV
+from kispy.models.realtime import Trade
+from kispy.realtime import TradeColumns
+from kispy.ringbuffer import MarketBuffers, RingBuffer
+
+
+def _bar(minute: int, close: str, volume: str = "10") -> OHLCV:
+    return OHLCV(date=datetime(2024, 1, 5, 9, minute), open="1", high="3", low="0.5", close=close, volume=volume)
+
+
+def test_ring_buffer_views_are_contiguous():
+    buffer = RingBuffer(4, "q")
+    assert list(buffer.view()) == []
+    with pytest.raises(IndexError):
+        buffer.last()
+
+    for value in range(1, 7):
+        buffer.append(value)
+
+    assert len(buffer) == 4
+    assert list(buffer.view()) == [3, 4, 5, 6]
+    assert list(buffer.view(2)) == [5, 6]
+    assert list(buffer.view(10)) == [3, 4, 5, 6]
+    assert buffer.view().contiguous and buffer.view().obj is buffer.view(1).obj  # 같은 배열을 가리킴
+    assert buffer.last() == 6
+
+    buffer.replace_last(60)
+    assert list(buffer.view()) == [3, 4, 5, 60]
+
+    buffer.clear()
+    assert len(buffer) == 0
+
+
+def test_ring_buffer_append_does_not_allocate():
+    buffer = RingBuffer(1_000)
+    for i in range(2_000):
+        buffer.append(i)
+
+    tracemalloc.start()
+    try:
+        for i in range(100_000):
+            buffer.append(float(i))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 10_000
+
+
+def test_market_buffers():
+    buffers = MarketBuffers(tick_capacity=3, bar_capacity=3)
+    for price in ("1.5", "2.5"):
+        buffers.add_trade(Trade("HDFSCNT0", "AAPL", datetime(2024, 1, 5, 9, 30, 1), price, "5", "10", "1", "1", "1"))
+    buffers.add_trade("not a trade")
+
+    columns = TradeColumns()
+    columns.symbols.append("AAPL")
+    columns.times.append(20240105093002)
+    columns.prices.append(3.5)
+    columns.volumes.append(7)
+    buffers.add_trade_columns(columns)
+
+    ticks = buffers.ticks("AAPL")
+    assert list(ticks.prices.view()) == [1.5, 2.5, 3.5]
+    assert list(ticks.times.view()) == [20240105093001, 20240105093001, 20240105093002]
+
+    assert buffers.add_bars("AAPL", [_bar(0, "1"), _bar(1, "2"), _bar(2, "3")]) == 3
+    # 이전 봉은 무시, 같은 시각의 봉은 갱신
+    assert buffers.add_bars("AAPL", [_bar(1, "9"), _bar(2, "4", "20"), _bar(3, "5")]) == 2
+    bars = buffers.bars("AAPL")
+    assert list(bars.closes.view()) == [2.0, 4.0, 5.0]
+    assert list(bars.volumes.view()) == [10.0, 20.0, 10.0]
+    assert bars.times.last() == 20240105090300
@@ -0,0 +1,59 @@
+import time
+
+from kispy.models.market import Symbol
+from kispy.search import SymbolSearchIndex
+
+
+def _symbol(symbol: str, korean_name: str, english_name: str, exchange_code: str = "NAS") -> Symbol:
+    return Symbol(
+        symbol=symbol,
+        exchange_code=exchange_code,
+        realtime_symbol=f"D{exchange_code}{symbol}",
+        korean_name=korean_name,
+        english_name=english_name,
+    )
+
+
+SYMBOLS = [
+    _symbol("AAPL", "애플", "APPLE INC"),
+    _symbol("AAPU", "디렉시온 데일리 애플 불 2X", "DIREXION DAILY AAPL BULL 2X SHARES"),
+    _symbol("A", "애질런트 테크놀로지스", "AGILENT TECHNOLOGIES INC", "NYS"),
+    _symbol("MSFT", "마이크로소프트", "MICROSOFT CORP"),
+    _symbol("TSLA", "테슬라", "TESLA INC"),
+    _symbol("SPY", "SPDR S&P 500 ETF", "SPDR S&P 500 ETF TRUST", "AMS"),
+]
+
+
+def _search(index: SymbolSearchIndex, query: str, limit: int = 10) -> list[str]:
+    return [symbol.symbol for symbol in index.search(query, limit)]
+
+
+def test_search_ranking():
+    index = SymbolSearchIndex(SYMBOLS)
+
+    # 종목코드 일치 > 종목코드 앞부분 > 이름 앞부분
+    assert _search(index, "a") == ["A", "AAPL", "AAPU"]
+    assert _search(index, "aap") == ["AAPL", "AAPU"]
+    assert _search(index, "apple") == ["AAPL"]
+    assert _search(index, "애플") == ["AAPL", "AAPU"]
+    assert _search(index, "소프트") == ["MSFT"]
+    assert _search(index, "Microsoft Corp") == ["MSFT"]
+    assert _search(index, "s&p 500") == ["SPY"]
+    assert _search(index, "tesla", limit=0) == []
+    assert _search(index, "  ") == []
+    assert _search(index, "없는종목") == []
+
+
+def test_search_performance():
+    symbols = [_symbol(f"S{i:05d}", f"종목{i}", f"COMPANY {i} HOLDINGS") for i in range(50000)]
+    index = SymbolSearchIndex(symbols)
+
+    start = time.perf_counter()
+    for query in ["S123", "종목42", "company 4", "HOLD", "1234 hold"]:
+        index.search(query, limit=10)
+    elapsed = (time.perf_counter() - start) / 5
+
+    assert _search(index, "S00012") == ["S00012"]
+    assert _search(index, "종목4999", limit=3) == ["S04999", "S49990", "S49991"]
+    assert _search(index, "1234 hold", limit=2) == ["S01234", "S11234"]
+    assert elapsed < 0.005
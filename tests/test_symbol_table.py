@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from kispy.models.market import Symbol
+from kispy.symbol_table import SymbolTable, compile_symbol_table
+
+
+def _symbol(symbol: str, exchange_code: str = "NAS") -> Symbol:
+    return Symbol(
+        symbol=symbol,
+        exchange_code=exchange_code,
+        realtime_symbol=f"D{exchange_code}{symbol}",
+        currency="USD",
+        float_position=4,
+        tick_size_type="1",
+        korean_name=f"{symbol} 한글",
+        english_name=f"{symbol} Inc",
+    )
+
+
+def test_compile_and_lookup(tmp_path):
+    path = str(tmp_path / "us.symtab")
+    symbols = [_symbol("MSFT"), _symbol("AAPL"), _symbol("SPY"), _symbol("IBM", "NYS"), _symbol("SPY", "NYS")]
+    assert compile_symbol_table(path, symbols) == 5
+
+    with SymbolTable(path) as table:
+        assert len(table) == 5
+        assert table["AAPL"] == _symbol("AAPL")
+        assert table["IBM"] == _symbol("IBM", "NYS")
+        # 같은 종목코드는 먼저 추가한 종목이 우선
+        assert table["SPY"].exchange_code == "NAS"
+        assert table.get("SPY", "NYS") == _symbol("SPY", "NYS")
+        assert table.get("AAPL", "NYS") is None
+        assert "AA" not in table
+        assert "ZZZZ" not in table
+        with pytest.raises(KeyError):
+            table["UNKNOWN"]
+        assert [symbol.symbol for symbol in table] == ["AAPL", "IBM", "MSFT", "SPY", "SPY"]
+
+
+def test_domestic_market_is_kept(tmp_path):
+    path = str(tmp_path / "kr.symtab")
+    samsung = Symbol(
+        symbol="005930",
+        exchange_code="KRX",
+        realtime_symbol="005930",
+        currency="KRW",
+        korean_name="삼성전자",
+        market="KOSPI",
+    )
+    compile_symbol_table(path, [samsung])
+
+    with SymbolTable(path) as table:
+        assert table["005930"] == samsung
+
+
+def test_reload_after_rebuild(tmp_path):
+    path = str(tmp_path / "us.symtab")
+    compile_symbol_table(path, [_symbol("AAPL")])
+
+    with SymbolTable(path) as table:
+        compile_symbol_table(path, [_symbol("AAPL"), _symbol("TSLA")])
+        assert "TSLA" not in table
+
+        table.clear()
+        assert table["TSLA"] == _symbol("TSLA")
+
+
+def test_open_and_lookup_performance(tmp_path):
+    path = str(tmp_path / "us.symtab")
+    compile_symbol_table(path, [_symbol(f"S{i:05d}") for i in range(50000)])
+
+    start = time.perf_counter()
+    table = SymbolTable(path)
+    for i in range(0, 50000, 50):
+        assert table[f"S{i:05d}"].symbol == f"S{i:05d}"
+    elapsed = time.perf_counter() - start
+    table.close()
+
+    assert elapsed < 0.5